@@ -0,0 +1,104 @@
+"""Common fixtures for Liquid Check benchmarks."""
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+# Must be before other imports for pytest plugin to work
+pytest_plugins = "pytest_homeassistant_custom_component"  # noqa: E402
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry  # noqa: E402
+
+from custom_components.liquid_check.client import LiquidCheckClient  # noqa: E402
+
+FIXTURE = Path(__file__).parent.parent / "tests" / "fixtures" / "api_response.json"
+BASELINES = Path(__file__).parent / "baselines.json"
+
+# Relative change of a timing or memory metric reported as a regression
+TOLERANCE = 0.25
+
+
+def pytest_addoption(parser):
+    """Add the option to store the results as the new baselines."""
+    parser.addoption(
+        "--update-baselines",
+        action="store_true",
+        help=f"Write the benchmark results to {BASELINES.name}",
+    )
+
+
+@pytest.fixture(scope="session")
+def baselines(request):
+    """Compare the benchmark results with the stored baselines.
+
+    Counts must match the baseline exactly, timings and memory are reported
+    when they grew by more than the tolerance.
+    """
+    stored = json.loads(BASELINES.read_text()) if BASELINES.exists() else {}
+    update = request.config.getoption("--update-baselines")
+    results = {}
+
+    def record(name: str, metrics: dict[str, float | int]) -> None:
+        results[name] = metrics
+        baseline = stored.get(name)
+        for metric, value in metrics.items():
+            expected = None if baseline is None else baseline.get(metric)
+            if expected is None:
+                print(f"\n{name} {metric}: {value} (no baseline)")
+                continue
+            if isinstance(value, int):
+                print(f"\n{name} {metric}: {value} (baseline {expected})")
+                if not update:
+                    assert value == expected, f"{name} {metric} changed"
+                continue
+            change = value / expected - 1 if expected else 0.0
+            flag = " REGRESSION" if change > TOLERANCE else ""
+            print(f"\n{name} {metric}: {value} ({change:+.0%} vs baseline){flag}")
+
+    yield record
+
+    if update and results:
+        BASELINES.write_text(
+            json.dumps({**stored, **results}, indent=2, sort_keys=True) + "\n"
+        )
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable custom integrations."""
+    yield
+
+
+@pytest.fixture
+def api_response() -> dict:
+    """Return the device response used by all mocked devices."""
+    return json.loads(FIXTURE.read_text())
+
+
+@pytest.fixture
+def mock_get_info(api_response):
+    """Answer every device poll with the fixture response."""
+    with patch.object(
+        LiquidCheckClient, "get_info", AsyncMock(return_value=api_response)
+    ) as mock:
+        yield mock
+
+
+def create_entries(hass, count: int) -> list[MockConfigEntry]:
+    """Add mocked Liquid Check config entries to hass."""
+    entries = []
+    for index in range(count):
+        entry = MockConfigEntry(
+            domain="liquid_check",
+            title=f"Tank {index}",
+            data={
+                "name": f"Tank {index}",
+                "host": f"10.0.{index // 250}.{index % 250 + 1}",
+                "scan_interval": 60,
+            },
+            entry_id=f"tank_{index}",
+        )
+        entry.add_to_hass(hass)
+        entries.append(entry)
+    return entries
@@ -0,0 +1,86 @@
+"""Benchmark decoding a device response."""
+import json
+import time
+from unittest.mock import MagicMock, patch
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.liquid_check import client as client_module
+from custom_components.liquid_check.coordinator import (
+    LiquidCheckDataUpdateCoordinator,
+)
+
+from .conftest import FIXTURE
+
+POLLS = 2000
+
+
+def _stdlib_loads(body: bytes):
+    """Decode like aiohttp's response.json() with the json module."""
+    return json.loads(body.decode("utf-8"))
+
+
+class _FakeResponse:
+    """Minimal aiohttp response returning a fixed body."""
+
+    def __init__(self, body: bytes) -> None:
+        self._body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return None
+
+    def raise_for_status(self) -> None:
+        pass
+
+    async def read(self) -> bytes:
+        return self._body
+
+
+class _FakeSession:
+    """Minimal aiohttp session, cheap enough not to hide the decode time."""
+
+    def __init__(self, body: bytes) -> None:
+        self._response = _FakeResponse(body)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return None
+
+    def get(self, url, timeout=None) -> _FakeResponse:
+        return self._response
+
+
+def test_decode_time():
+    """Measure decoding the raw body with the stdlib and with orjson."""
+    body = FIXTURE.read_bytes()
+    for name, loads in (("json", _stdlib_loads), ("orjson", client_module.json_loads)):
+        start = time.perf_counter()
+        for _ in range(POLLS):
+            loads(body)
+        elapsed = time.perf_counter() - start
+        print(f"\ndecode with {name}: {elapsed / POLLS * 1e6:.1f} µs per response")
+
+
+async def test_poll_time(hass: HomeAssistant):
+    """Measure get_info plus the coordinator update per decoder."""
+    body = FIXTURE.read_bytes()
+    entry = MagicMock()
+    entry.data = {"name": "Test", "host": "192.168.1.100"}
+    entry.options = {}
+
+    for name, loads in (("json", _stdlib_loads), ("orjson", client_module.json_loads)):
+        coordinator = LiquidCheckDataUpdateCoordinator(hass, entry)
+        with patch.object(
+            client_module.aiohttp, "ClientSession", lambda: _FakeSession(body)
+        ), patch.object(client_module, "json_loads", loads):
+            await coordinator._async_update_data()
+            start = time.perf_counter()
+            for _ in range(POLLS):
+                await coordinator._async_update_data()
+            elapsed = time.perf_counter() - start
+        print(f"\npoll with {name}: {elapsed / POLLS * 1e6:.1f} µs per update")
@@ -0,0 +1,138 @@
+"""Benchmark the coordinator to entity fan-out for a fleet of devices."""
+import copy
+import time
+import tracemalloc
+
+import pytest
+from homeassistant.const import EVENT_STATE_CHANGED, EVENT_STATE_REPORTED
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.setup import async_setup_component
+
+from custom_components.liquid_check.coordinator import (
+    LiquidCheckDataUpdateCoordinator,
+)
+
+from .conftest import create_entries
+
+COUNTS = [1, 10, 50, 200]
+CYCLES = 20
+
+
+async def _setup_fleet(hass: HomeAssistant, count: int) -> None:
+    """Set up count mocked devices."""
+    create_entries(hass, count)
+    assert await async_setup_component(hass, "liquid_check", {})
+    await hass.async_block_till_done()
+
+
+def _entity_counts(hass: HomeAssistant) -> tuple[int, int]:
+    """Return the registered and the enabled entities of the integration."""
+    entries = [
+        entry
+        for entry in er.async_get(hass).entities.values()
+        if entry.platform == "liquid_check"
+    ]
+    return len(entries), sum(1 for entry in entries if not entry.disabled)
+
+
+@pytest.mark.parametrize("count", COUNTS)
+async def test_fleet_setup(hass: HomeAssistant, mock_get_info, baselines, count):
+    """Measure the setup time and the entities per device."""
+    start = time.perf_counter()
+    await _setup_fleet(hass, count)
+    elapsed = time.perf_counter() - start
+
+    registered, enabled = _entity_counts(hass)
+    baselines(
+        f"setup_{count}",
+        {
+            "setup_ms_per_entry": round(elapsed / count * 1000, 3),
+            "entities": registered,
+            "enabled_entities": enabled,
+        },
+    )
+
+
+@pytest.mark.parametrize("count", COUNTS)
+async def test_fleet_memory(hass: HomeAssistant, mock_get_info, baselines, count):
+    """Measure the memory allocated per device and per entity."""
+    tracemalloc.start()
+    try:
+        await _setup_fleet(hass, count)
+        allocated, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    _, enabled = _entity_counts(hass)
+    baselines(
+        f"memory_{count}",
+        {
+            "kib_per_entry": round(allocated / count / 1024, 1),
+            "kib_per_entity": round(allocated / enabled / 1024, 1),
+        },
+    )
+
+
+@pytest.mark.parametrize("count", COUNTS)
+async def test_fleet_refresh(
+    hass: HomeAssistant, mock_get_info, api_response, baselines, count
+):
+    """Measure the refresh and dispatch time and state writes per cycle."""
+    await _setup_fleet(hass, count)
+    coordinators = [
+        coordinator
+        for coordinator in hass.data["liquid_check"].values()
+        if isinstance(coordinator, LiquidCheckDataUpdateCoordinator)
+    ]
+    assert len(coordinators) == count
+
+    writes = 0
+
+    @callback
+    def _count_write(event) -> None:
+        nonlocal writes
+        writes += 1
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _count_write)
+    hass.bus.async_listen(
+        EVENT_STATE_REPORTED, _count_write, event_filter=callback(lambda data: True)
+    )
+
+    # Time the fan-out to the entities separately from the whole refresh
+    dispatch = 0.0
+    for coordinator in coordinators:
+        update_listeners = coordinator.async_update_listeners
+
+        def _timed(update_listeners=update_listeners) -> None:
+            nonlocal dispatch
+            start = time.perf_counter()
+            update_listeners()
+            dispatch += time.perf_counter() - start
+
+        coordinator.async_update_listeners = _timed
+
+    responses = []
+    for cycle in range(2):
+        response = copy.deepcopy(api_response)
+        response["payload"]["measure"]["level"] += cycle * 0.01
+        response["payload"]["measure"]["content"] += cycle * 10
+        responses.append(response)
+
+    start = time.perf_counter()
+    for cycle in range(CYCLES):
+        # Every cycle reports a changed measurement
+        mock_get_info.return_value = responses[cycle % 2]
+        for coordinator in coordinators:
+            await coordinator.async_refresh()
+        await hass.async_block_till_done()
+    elapsed = time.perf_counter() - start
+
+    baselines(
+        f"refresh_{count}",
+        {
+            "refresh_ms_per_cycle": round(elapsed / CYCLES * 1000, 3),
+            "dispatch_ms_per_cycle": round(dispatch / CYCLES * 1000, 3),
+            "state_writes_per_cycle": writes // CYCLES,
+        },
+    )
@@ -0,0 +1,62 @@
+"""Benchmark the Liquid Check import and setup time."""
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+from .conftest import create_entries
+
+IMPORT_SCRIPT = """
+import time
+import homeassistant.config_entries, homeassistant.helpers.entity_platform
+import homeassistant.components.sensor, homeassistant.components.binary_sensor
+import homeassistant.components.button
+start = time.perf_counter()
+import custom_components.liquid_check
+import custom_components.liquid_check.binary_sensor
+import custom_components.liquid_check.button
+import custom_components.liquid_check.config_flow
+import custom_components.liquid_check.sensor
+print(time.perf_counter() - start)
+"""
+
+
+def test_import_time():
+    """Measure importing the integration on top of Home Assistant core."""
+    samples = [
+        float(
+            subprocess.run(
+                [sys.executable, "-c", IMPORT_SCRIPT],
+                capture_output=True,
+                check=True,
+                cwd=Path(__file__).parent.parent,
+                text=True,
+            ).stdout
+        )
+        for _ in range(5)
+    ]
+    print(f"\nimport: {min(samples) * 1000:.1f} ms (best of 5)")
+
+
+@pytest.mark.parametrize("count", [1, 10, 50])
+async def test_setup_time(hass: HomeAssistant, mock_get_info, count):
+    """Measure setting up an increasing number of config entries."""
+    entries = create_entries(hass, count)
+
+    # Setting up the component sets up all of its config entries
+    start = time.perf_counter()
+    assert await async_setup_component(hass, "liquid_check", {})
+    await hass.async_block_till_done()
+    elapsed = time.perf_counter() - start
+
+    assert all(entry.state is ConfigEntryState.LOADED for entry in entries)
+    assert len(hass.services.async_services()["liquid_check"]) == 4
+    print(
+        f"\nsetup {count} entries: {elapsed * 1000:.1f} ms, "
+        f"{elapsed / count * 1000:.2f} ms per entry"
+    )
@@ -3,97 +3,131 @@ from __future__ import annotations
 
 import logging
 
-import voluptuous as vol
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.device_registry import format_mac
+from homeassistant.helpers.typing import ConfigType
 
-from .client import LiquidCheckClient
-from .const import DOMAIN
+from .const import CONF_MEASURE_SCHEDULE, CONF_MEMBERS, DOMAIN
+from .services import (  # noqa: F401
+    SERVICE_EXPORT_HISTORY,
+    SERVICE_IMPORT_HISTORY,
+    SERVICE_RESTART,
+    SERVICE_START_MEASURE,
+    async_setup_services,
+)
 
-PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BUTTON]
+PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BINARY_SENSOR, Platform.BUTTON]
 
 _LOGGER = logging.getLogger(__name__)
 
-SERVICE_START_MEASURE = "start_measure"
-SERVICE_START_MEASURE_SCHEMA = vol.Schema(
-    {
-        vol.Required("device_id"): cv.string,
-    }
-)
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
-SERVICE_RESTART = "restart"
-SERVICE_RESTART_SCHEMA = vol.Schema(
-    {
-        vol.Required("device_id"): cv.string,
-    }
-)
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Liquid Check services, WebSocket API and HTTP views."""
+    from .views import async_register_views
+    from .websocket_api import async_setup_websocket_api
+
+    async_setup_services(hass)
+    async_setup_websocket_api(hass)
+    async_register_views(hass)
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Liquid Check from a config entry."""
+    if CONF_MEMBERS in entry.data:
+        return await async_setup_aggregate_entry(hass, entry)
+
+    from .coordinator import LiquidCheckDataUpdateCoordinator
+    from .cron import CronSchedule
+    from .scheduler import async_get_scheduler
+
+    coordinator = LiquidCheckDataUpdateCoordinator(hass, entry)
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    
-    async def send_device_command(
-        device_id: str, command_name: str, action: str
-    ) -> None:
-        """Send a command to the Liquid Check device."""
-        config_entry = None
-        for entry in hass.config_entries.async_entries(DOMAIN):
-            if entry.entry_id == device_id:
-                config_entry = entry
-                break
-        
-        if not config_entry:
-            _LOGGER.error("Device with ID %s not found", device_id)
-            return
-        
-        client = LiquidCheckClient(config_entry.data["host"])
-        
-        try:
-            await client.send_command(command_name)
-            _LOGGER.info("%s on device %s", action, config_entry.data["host"])
-        except Exception as err:
-            _LOGGER.error("Error %s on device: %s", action.lower(), err)
-    
-    async def handle_start_measure(call: ServiceCall) -> None:
-        """Handle the start_measure service call."""
-        await send_device_command(
-            call.data["device_id"], "StartMeasure", "Measurement started"
-        )
-    
-    async def handle_restart(call: ServiceCall) -> None:
-        """Handle the restart service call."""
-        await send_device_command(
-            call.data["device_id"], "Restart", "Device restarting"
+    _async_set_unique_id(hass, entry, coordinator.metadata.get("mac"))
+    if schedule := entry.options.get(CONF_MEASURE_SCHEDULE):
+        entry.async_on_unload(
+            async_get_scheduler(hass).async_add(
+                entry.entry_id, CronSchedule(schedule), coordinator
+            )
         )
-    
-    # Register the services
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_START_MEASURE,
-        handle_start_measure,
-        schema=SERVICE_START_MEASURE_SCHEMA,
-    )
-    
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_RESTART,
-        handle_restart,
-        schema=SERVICE_RESTART_SCHEMA,
-    )
-    
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    _async_reload_aggregates(hass, entry)
+
     return True
 
 
+async def async_setup_aggregate_entry(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> bool:
+    """Set up an aggregate of several Liquid Check tanks."""
+    from .aggregate import LiquidCheckAggregateCoordinator
+    from .coordinator import LiquidCheckDataUpdateCoordinator
+
+    coordinators = hass.data.get(DOMAIN, {})
+    members = {}
+    for member_id in entry.data[CONF_MEMBERS]:
+        member = coordinators.get(member_id)
+        if not isinstance(member, LiquidCheckDataUpdateCoordinator):
+            raise ConfigEntryNotReady(f"Tank {member_id} is not loaded yet")
+        members[member_id] = member
+
+    aggregate = LiquidCheckAggregateCoordinator(hass, members)
+    aggregate.async_start()
+    entry.async_on_unload(aggregate.async_stop)
+    hass.data[DOMAIN][entry.entry_id] = aggregate
+
+    await hass.config_entries.async_forward_entry_setups(entry, [Platform.SENSOR])
+    return True
+
+
+@callback
+def _async_set_unique_id(
+    hass: HomeAssistant, entry: ConfigEntry, mac: str | None
+) -> None:
+    """Identify the entry by the MAC address the device reported.
+
+    DHCP discovery finds the entry by it to follow a new IP address. Done
+    before the update listener is added, so it does not reload the entry.
+    """
+    if entry.unique_id is not None or not mac:
+        return
+    unique_id = format_mac(mac)
+    if hass.config_entries.async_entry_for_domain_unique_id(DOMAIN, unique_id):
+        _LOGGER.debug("%s is already configured by another entry", unique_id)
+        return
+    hass.config_entries.async_update_entry(entry, unique_id=unique_id)
+
+
+def _async_reload_aggregates(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload aggregates containing a tank so they use its new coordinator."""
+    for other in hass.config_entries.async_entries(DOMAIN):
+        if entry.entry_id in other.data.get(CONF_MEMBERS, []) and other.state in (
+            ConfigEntryState.LOADED,
+            ConfigEntryState.SETUP_RETRY,
+        ):
+            hass.config_entries.async_schedule_reload(other.entry_id)
+
+
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
-    
-    # Remove services if no more entries
-    if not hass.config_entries.async_entries(DOMAIN):
-        hass.services.async_remove(DOMAIN, SERVICE_START_MEASURE)
-        hass.services.async_remove(DOMAIN, SERVICE_RESTART)
-    
+    platforms = [Platform.SENSOR] if CONF_MEMBERS in entry.data else PLATFORMS
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, platforms)
+    if unload_ok:
+        from .views import async_forget_infos
+
+        hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
+        async_forget_infos(hass, entry.entry_id)
+
     return unload_ok
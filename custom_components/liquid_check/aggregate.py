@@ -0,0 +1,105 @@
+"""Aggregate of several Liquid Check tanks forming one reservoir."""
+from __future__ import annotations
+
+import logging
+import math
+from collections.abc import Callable
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .coordinator import LiquidCheckDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class LiquidCheckAggregateCoordinator(DataUpdateCoordinator):
+    """Combine the data of several member coordinators.
+
+    The totals are summed from the last contribution of each member. Updates
+    of several members arriving in the same event loop iteration are
+    published as a single update.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        members: dict[str, LiquidCheckDataUpdateCoordinator],
+    ) -> None:
+        """Initialize."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name="Liquid Check aggregate",
+            update_interval=None,
+        )
+        self._members = members
+        # entry_id -> (content, capacity, flow)
+        self._contributions: dict[str, tuple[float, float | None, float]] = {}
+        self._flush_scheduled = False
+        self._unsubs: list[Callable[[], None]] = []
+
+    @callback
+    def async_start(self) -> None:
+        """Subscribe to the member coordinators."""
+        for member_id, member in self._members.items():
+            self._unsubs.append(
+                member.async_add_listener(self._member_listener(member_id))
+            )
+            self._async_update_member(member_id)
+        self._async_flush()
+
+    @callback
+    def async_stop(self) -> None:
+        """Unsubscribe from the member coordinators."""
+        while self._unsubs:
+            self._unsubs.pop()()
+
+    def _member_listener(self, member_id: str) -> Callable[[], None]:
+        @callback
+        def _async_member_updated() -> None:
+            if self._async_update_member(member_id) and not self._flush_scheduled:
+                self._flush_scheduled = True
+                self.hass.loop.call_soon(self._async_flush)
+
+        return _async_member_updated
+
+    @callback
+    def _async_update_member(self, member_id: str) -> bool:
+        """Update the totals for one member, return True if they changed."""
+        data = self._members[member_id].data
+        if not data or data.get("content") is None:
+            return False
+
+        content = float(data["content"])
+        capacity = self._members[member_id].capacity
+        flow = float(data.get("flow") or 0.0)
+
+        current = (content, capacity, flow)
+        if current == self._contributions.get(member_id):
+            return False
+
+        self._contributions[member_id] = current
+        return True
+
+    @callback
+    def _async_flush(self) -> None:
+        """Publish the combined totals."""
+        self._flush_scheduled = False
+        contributions = self._contributions.values()
+        content = math.fsum(content for content, _, _ in contributions)
+        flow = math.fsum(flow for _, _, flow in contributions)
+        # The percent is unknown until the capacity of every member is known
+        capacities = [capacity for _, capacity, _ in contributions]
+        capacity = 0.0 if None in capacities else math.fsum(capacities)
+        self.async_set_updated_data(
+            {
+                "content": round(content, 1),
+                "percent": (
+                    round(content / capacity * 100, 1) if capacity > 0 else None
+                ),
+                "flow": round(flow, 2),
+                "members": len(self._contributions),
+            }
+        )
+
@@ -0,0 +1,157 @@
+"""Import past Liquid Check readings into the recorder statistics."""
+from __future__ import annotations
+
+import csv
+import json
+import logging
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import PERCENTAGE, UnitOfVolume
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+from homeassistant.util import slugify
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STATISTIC_UNITS = {
+    "level": "m",
+    "content": UnitOfVolume.LITERS,
+    "percent": PERCENTAGE,
+}
+
+
+class _Bucket:
+    """Running mean, minimum and maximum of one hour."""
+
+    __slots__ = ("count", "total", "min", "max")
+
+    def __init__(self, value: float) -> None:
+        self.count = 1
+        self.total = value
+        self.min = value
+        self.max = value
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+
+def statistic_id(entry: ConfigEntry, key: str) -> str:
+    """Return the external statistic id of a quantity of a device."""
+    return f"{DOMAIN}:{slugify(entry.entry_id)}_{key}"
+
+
+def aggregate_readings(
+    readings: Iterable[tuple[datetime, dict[str, Any]]],
+) -> dict[str, list[StatisticData]]:
+    """Aggregate readings into hourly statistics per quantity.
+
+    Memory grows with the number of hours covered, not the number of readings.
+    """
+    buckets: dict[str, dict[datetime, _Bucket]] = {key: {} for key in STATISTIC_UNITS}
+    for timestamp, values in readings:
+        start = timestamp.replace(minute=0, second=0, microsecond=0)
+        for key, hours in buckets.items():
+            value = values.get(key)
+            if value is None:
+                continue
+            if (bucket := hours.get(start)) is None:
+                hours[start] = _Bucket(float(value))
+            else:
+                bucket.add(float(value))
+
+    return {
+        key: [
+            StatisticData(
+                start=start,
+                mean=bucket.total / bucket.count,
+                min=bucket.min,
+                max=bucket.max,
+            )
+            for start, bucket in sorted(hours.items())
+        ]
+        for key, hours in buckets.items()
+        if hours
+    }
+
+
+def read_history_file(path: Path) -> Iterator[tuple[datetime, dict[str, Any]]]:
+    """Yield readings from a CSV or JSON lines file.
+
+    Each row needs a ``timestamp`` (ISO 8601 or UNIX seconds) and any of
+    ``level``, ``content`` and ``percent``.
+    """
+    with path.open(encoding="utf-8", newline="") as file:
+        if path.suffix.lower() == ".csv":
+            rows: Iterable[dict[str, Any]] = csv.DictReader(file)
+        else:
+            rows = (json.loads(line) for line in file if line.strip())
+
+        for row in rows:
+            values = {
+                key: float(row[key])
+                for key in STATISTIC_UNITS
+                if row.get(key) not in (None, "")
+            }
+            yield _parse_timestamp(row["timestamp"]), values
+
+
+def _parse_timestamp(value: Any) -> datetime:
+    """Return an aware UTC datetime from an ISO string or UNIX timestamp."""
+    if value is None:
+        raise ValueError("Missing timestamp")
+    try:
+        return dt_util.utc_from_timestamp(float(value))
+    except (TypeError, ValueError):
+        pass
+    timestamp = dt_util.parse_datetime(str(value))
+    if timestamp is None:
+        raise ValueError(f"Invalid timestamp: {value}")
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=dt_util.get_default_time_zone())
+    return dt_util.as_utc(timestamp)
+
+
+@callback
+def async_import_hourly_statistics(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    statistics: dict[str, list[StatisticData]],
+) -> int:
+    """Queue one batched statistics import per quantity, return the hours."""
+    for key, rows in statistics.items():
+        metadata = StatisticMetaData(
+            has_mean=True,
+            has_sum=False,
+            name=f"{entry.data['name']} {key.capitalize()}",
+            source=DOMAIN,
+            statistic_id=statistic_id(entry, key),
+            unit_of_measurement=STATISTIC_UNITS[key],
+        )
+        async_add_external_statistics(hass, metadata, rows)
+
+    hours = max((len(rows) for rows in statistics.values()), default=0)
+    _LOGGER.info("Imported %s hours of history for %s", hours, entry.data["name"])
+    return hours
+
+
+async def async_import_history_file(
+    hass: HomeAssistant, entry: ConfigEntry, path: Path
+) -> int:
+    """Read and aggregate a history file off the event loop, then import it."""
+    statistics = await hass.async_add_executor_job(
+        lambda: aggregate_readings(read_history_file(path))
+    )
+    return async_import_hourly_statistics(hass, entry, statistics)
@@ -0,0 +1,108 @@
+"""Binary sensor platform for Liquid Check integration."""
+from __future__ import annotations
+
+import logging
+
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
+    BinarySensorEntity,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import DeviceInfo, EntityCategory
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+from .coordinator import LiquidCheckDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up Liquid Check binary sensor based on a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+
+    async_add_entities(
+        [
+            LiquidCheckLeakBinarySensor(coordinator, entry),
+            LiquidCheckSensorFaultBinarySensor(coordinator, entry),
+            LiquidCheckRefillBinarySensor(coordinator, entry),
+        ]
+    )
+
+
+class LiquidCheckBaseBinarySensor(CoordinatorEntity, BinarySensorEntity):
+    """Base class for Liquid Check binary sensors."""
+
+    _key: str
+
+    def __init__(
+        self, coordinator: LiquidCheckDataUpdateCoordinator, entry: ConfigEntry
+    ) -> None:
+        """Initialize the binary sensor."""
+        super().__init__(coordinator)
+        self._entry = entry
+        self._attr_device_info = DeviceInfo(
+            identifiers={("liquid_check", entry.entry_id)},
+            name=entry.data["name"],
+            manufacturer="SI-Elektronik GmbH",
+            model="Liquid-Check",
+            configuration_url=f"http://{entry.data['host']}",
+        )
+
+    @property
+    def is_on(self):
+        """Return true if the anomaly is detected."""
+        if self.coordinator.data:
+            return self.coordinator.data.get(self._key)
+        return None
+
+
+class LiquidCheckLeakBinarySensor(LiquidCheckBaseBinarySensor):
+    """Representation of Liquid Check Leak Binary Sensor."""
+
+    _attr_device_class = BinarySensorDeviceClass.MOISTURE
+    _key = "leak"
+
+    def __init__(
+        self, coordinator: LiquidCheckDataUpdateCoordinator, entry: ConfigEntry
+    ) -> None:
+        """Initialize the binary sensor."""
+        super().__init__(coordinator, entry)
+        self._attr_name = f"{entry.data['name']} Leak"
+        self._attr_unique_id = f"{entry.entry_id}_leak"
+
+
+class LiquidCheckSensorFaultBinarySensor(LiquidCheckBaseBinarySensor):
+    """Representation of Liquid Check Sensor Fault Binary Sensor."""
+
+    _attr_device_class = BinarySensorDeviceClass.PROBLEM
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _key = "sensor_fault"
+
+    def __init__(
+        self, coordinator: LiquidCheckDataUpdateCoordinator, entry: ConfigEntry
+    ) -> None:
+        """Initialize the binary sensor."""
+        super().__init__(coordinator, entry)
+        self._attr_name = f"{entry.data['name']} Sensor Fault"
+        self._attr_unique_id = f"{entry.entry_id}_sensor_fault"
+
+
+class LiquidCheckRefillBinarySensor(LiquidCheckBaseBinarySensor):
+    """Representation of Liquid Check Refill Binary Sensor."""
+
+    _key = "refill"
+
+    def __init__(
+        self, coordinator: LiquidCheckDataUpdateCoordinator, entry: ConfigEntry
+    ) -> None:
+        """Initialize the binary sensor."""
+        super().__init__(coordinator, entry)
+        self._attr_name = f"{entry.data['name']} Refill"
+        self._attr_unique_id = f"{entry.entry_id}_refill"
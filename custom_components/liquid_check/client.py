@@ -1,37 +1,153 @@
 """Client for communicating with Liquid Check device."""
 from __future__ import annotations
 
+import asyncio
+import ipaddress
 import logging
+import socket
+import statistics
+import time
+from collections import deque
+from collections.abc import Callable, Coroutine
 from typing import Any
 
 import aiohttp
+from homeassistant.util.json import json_loads
+from yarl import URL
 
 _LOGGER = logging.getLogger(__name__)
 
+# Seconds between reminders while a device stays unreachable
+OFFLINE_SUMMARY_INTERVAL = 3600
+
+# Seconds a resolved address is used before it is resolved again in the
+# background, and the longest time to wait for the resolver
+ADDRESS_TTL = 300
+RESOLVE_TIMEOUT = 5
+
+# Latencies of successful requests the hedge delay is the p95 of
+LATENCY_SAMPLES = 100
+MIN_LATENCY_SAMPLES = 20
+# Hedged requests earned per request, and the most that can be saved up
+HEDGE_BUDGET = 0.1
+HEDGE_BURST = 2.0
+
 
 class LiquidCheckClient:
     """Client to communicate with Liquid Check device."""
 
-    def __init__(self, host: str) -> None:
-        """Initialize the client."""
+    def __init__(
+        self,
+        host: str,
+        hedge: bool = False,
+        create_task: Callable[[Coroutine[Any, Any, None], str], asyncio.Task[None]]
+        | None = None,
+    ) -> None:
+        """Initialize the client.
+
+        With hedge set, a poll slower than the device's usual p95 latency is
+        sent a second time and the first answer is used. Background work,
+        like resolving the hostname again, is started with create_task.
+        """
         self._host = host
+        url = URL(f"http://{host}")
+        self._hostname = url.raw_host or host
+        self._port = f":{url.explicit_port}" if url.explicit_port else ""
+        try:
+            ipaddress.ip_address(self._hostname)
+        except ValueError:
+            self._address: str | None = None
+            self._static_address = False
+        else:
+            self._address = self._hostname
+            self._static_address = True
+        self._resolved_at = 0.0
+        self._resolve_task: asyncio.Task[None] | None = None
+        self._create_task = create_task or (
+            lambda coro, name: asyncio.get_running_loop().create_task(coro, name=name)
+        )
+        self._failures = 0
+        self._offline_since: float | None = None
+        self._last_summary = 0.0
+        self._hedge = hedge
+        self._latencies: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self._hedge_tokens = HEDGE_BURST
+        self.hedge_count = 0
+        # Body of the last successful response, served to other readers
+        self.last_body: bytes | None = None
 
     async def get_info(self) -> dict[str, Any]:
         """Get device information."""
         url = f"http://{self._host}/infos.json"
         try:
-            async with aiohttp.ClientSession() as session, session.get(
-                url, timeout=aiohttp.ClientTimeout(total=10)
-            ) as response:
-                response.raise_for_status()
-                return await response.json()
+            url = await self._async_url("/infos.json")
+            if self._hedge:
+                body = await self._async_fetch_hedged(url)
+            else:
+                body = await self._async_fetch(url)
+            # Decode the raw body with orjson, skipping aiohttp's text decoding
+            data = json_loads(body)
         except Exception as err:
-            _LOGGER.error("Failed to fetch data from %s: %s", url, err)
+            self._expire_address()
+            self._log_fetch_failure(url, err)
             raise
 
+        self._log_fetch_success()
+        self.last_body = body
+        return data
+
+    async def _async_fetch(self, url: str, record: bool = True) -> bytes:
+        """Return the body of a GET request, recording its latency if set."""
+        started = time.monotonic()
+        async with aiohttp.ClientSession() as session, session.get(
+            url, timeout=aiohttp.ClientTimeout(total=10)
+        ) as response:
+            response.raise_for_status()
+            body = await response.read()
+        if record:
+            self._latencies.append(time.monotonic() - started)
+        return body
+
+    async def _async_fetch_hedged(self, url: str) -> bytes:
+        """Fetch a URL, sending a second request when the first is slow.
+
+        Each request earns a tenth of a hedge, so at most about one in ten
+        polls is doubled. Whichever request answers first wins and the other
+        one is cancelled. The latency is counted from the start of the first
+        request, so a slow request a hedge overtook still counts as slow.
+        """
+        self._hedge_tokens = min(HEDGE_BURST, self._hedge_tokens + HEDGE_BUDGET)
+        if len(self._latencies) < MIN_LATENCY_SAMPLES:
+            return await self._async_fetch(url)
+
+        delay = statistics.quantiles(self._latencies, n=20)[-1]
+        started = time.monotonic()
+        tasks = [asyncio.ensure_future(self._async_fetch(url, record=False))]
+        try:
+            await asyncio.wait(tasks, timeout=delay)
+            if not tasks[0].done() and self._hedge_tokens >= 1:
+                self._hedge_tokens -= 1
+                self.hedge_count += 1
+                tasks.append(
+                    asyncio.ensure_future(self._async_fetch(url, record=False))
+                )
+
+            errors: list[Exception] = []
+            for completed in asyncio.as_completed(tasks):
+                try:
+                    body = await completed
+                except Exception as err:
+                    errors.append(err)
+                else:
+                    self._latencies.append(time.monotonic() - started)
+                    return body
+            raise errors[0]
+        finally:
+            for task in tasks:
+                task.cancel()
+
     async def send_command(self, command_name: str) -> None:
         """Send command to device."""
-        url = f"http://{self._host}/command"
         payload = {
             "header": {
                 "namespace": "Device.Control",
@@ -43,6 +159,7 @@ class LiquidCheckClient:
         }
 
         try:
+            url = await self._async_url("/command")
             async with aiohttp.ClientSession() as session, session.post(
                 url,
                 json=payload,
@@ -51,5 +168,85 @@ class LiquidCheckClient:
             ) as response:
                 response.raise_for_status()
         except Exception as err:
+            self._expire_address()
             _LOGGER.error("Failed to send %s command: %s", command_name, err)
             raise
+
+    async def _async_url(self, path: str) -> str:
+        """Return the URL of a path using the cached address of the device.
+
+        Only the first request waits for the resolver. Later an expired
+        address keeps being used while it is resolved in the background.
+        """
+        if self._address is None:
+            await self._async_resolve()
+        elif (
+            not self._static_address
+            and self._resolve_task is None
+            and time.monotonic() - self._resolved_at >= ADDRESS_TTL
+        ):
+            self._resolve_task = self._create_task(
+                self._async_resolve(), f"liquid_check resolve {self._hostname}"
+            )
+        return f"http://{self._address}{self._port}{path}"
+
+    async def _async_resolve(self) -> None:
+        """Resolve the hostname, keep the last known good address on errors."""
+        try:
+            infos = await asyncio.wait_for(
+                asyncio.get_running_loop().getaddrinfo(
+                    self._hostname, None, family=socket.AF_INET, type=socket.SOCK_STREAM
+                ),
+                RESOLVE_TIMEOUT,
+            )
+        except (OSError, TimeoutError) as err:
+            if self._address is None:
+                raise
+            _LOGGER.debug(
+                "Failed to resolve %s, using %s: %s", self._hostname, self._address, err
+            )
+            self._resolved_at = time.monotonic()
+        else:
+            self._address = infos[0][4][0]
+            self._resolved_at = time.monotonic()
+        finally:
+            self._resolve_task = None
+
+    def _expire_address(self) -> None:
+        """Resolve the hostname again after a failed request."""
+        self._resolved_at = 0.0
+
+    def _log_fetch_failure(self, url: str, err: Exception) -> None:
+        """Log the first failure and periodic summaries while offline."""
+        now = time.monotonic()
+        self._failures += 1
+
+        if self._offline_since is None:
+            self._offline_since = now
+            self._last_summary = now
+            _LOGGER.warning("Liquid Check at %s went offline: %s", self._host, err)
+        elif now - self._last_summary >= OFFLINE_SUMMARY_INTERVAL:
+            self._last_summary = now
+            _LOGGER.warning(
+                "Liquid Check at %s still offline, %s failed requests in %d min: %s",
+                self._host,
+                self._failures,
+                (now - self._offline_since) / 60,
+                err,
+            )
+        else:
+            _LOGGER.debug("Failed to fetch data from %s: %s", url, err)
+
+    def _log_fetch_success(self) -> None:
+        """Log when an offline device answers again."""
+        if self._offline_since is None:
+            return
+
+        _LOGGER.info(
+            "Liquid Check at %s is back online after %s failed requests in %d min",
+            self._host,
+            self._failures,
+            (time.monotonic() - self._offline_since) / 60,
+        )
+        self._failures = 0
+        self._offline_since = None
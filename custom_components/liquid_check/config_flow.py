@@ -2,13 +2,42 @@
 from __future__ import annotations
 
 import ipaddress
+from collections.abc import Mapping
 from typing import Any
 
 import voluptuous as vol
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import selector
+from homeassistant.helpers.device_registry import format_mac
+from homeassistant.helpers.service_info.dhcp import DhcpServiceInfo
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CONF_FILTER,
+    CONF_HEDGE_REQUESTS,
+    CONF_MEASURE_SCHEDULE,
+    CONF_MEMBERS,
+    CONF_POLL_MODE,
+    CONF_PUMP_POWER,
+    CONF_STALE_AFTER,
+    CONF_STRAPPING_TABLE,
+    CONF_TANK_DIAMETER,
+    CONF_TANK_HEIGHT,
+    CONF_TANK_LENGTH,
+    CONF_TANK_SHAPE,
+    CONF_TANK_WIDTH,
+    FILTER_NONE,
+    FILTER_TYPES,
+    POLL_MODE_INTERVAL,
+    POLL_MODES,
+    SHAPE_DEVICE,
+    TANK_SHAPES,
+)
+from .cron import CronSchedule
+from .geometry import geometry_from_options
 
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
@@ -20,6 +49,15 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     }
 )
 
+STEP_DISCOVERY_CONFIRM_SCHEMA = vol.Schema(
+    {
+        vol.Required("name", default="Liquid Check"): str,
+        vol.Optional("scan_interval", default=60): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=3600)
+        ),
+    }
+)
+
 
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect."""
@@ -45,10 +83,24 @@ class ConfigFlow(config_entries.ConfigFlow, domain="liquid_check"):
 
     VERSION = 1
 
+    def __init__(self) -> None:
+        """Initialize the flow."""
+        self._discovered_host: str | None = None
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle the initial step."""
+        if self._async_tank_entries():
+            return self.async_show_menu(
+                step_id="user", menu_options=["device", "aggregate"]
+            )
+        return await self.async_step_device(user_input)
+
+    async def async_step_device(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle adding a Liquid Check device."""
         errors: dict[str, str] = {}
         if user_input is not None:
             try:
@@ -63,9 +115,199 @@ class ConfigFlow(config_entries.ConfigFlow, domain="liquid_check"):
                 return self.async_create_entry(title=info["title"], data=user_input)
 
         return self.async_show_form(
-            step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
+            step_id="device", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
         )
 
+    async def async_step_dhcp(self, discovery_info: DhcpServiceInfo) -> FlowResult:
+        """Handle a device found by DHCP, following a new IP address."""
+        await self.async_set_unique_id(format_mac(discovery_info.macaddress))
+        entry = self.hass.config_entries.async_entry_for_domain_unique_id(
+            self.handler, self.unique_id
+        )
+        if entry is not None and _is_ip_address(entry.data["host"]):
+            # Updating the host reloads the entry with a client for it
+            self._abort_if_unique_id_configured(updates={"host": discovery_info.ip})
+        # A configured hostname is followed by resolving it again
+        self._abort_if_unique_id_configured()
+
+        self._discovered_host = discovery_info.ip
+        self.context["title_placeholders"] = {"host": discovery_info.ip}
+        return await self.async_step_discovery_confirm()
+
+    async def async_step_discovery_confirm(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Confirm adding a discovered device."""
+        if user_input is not None:
+            return self.async_create_entry(
+                title=user_input["name"],
+                data={
+                    "name": user_input["name"],
+                    "host": self._discovered_host,
+                    "scan_interval": user_input["scan_interval"],
+                },
+            )
+
+        return self.async_show_form(
+            step_id="discovery_confirm",
+            data_schema=STEP_DISCOVERY_CONFIRM_SCHEMA,
+            description_placeholders={"host": self._discovered_host},
+        )
+
+    async def async_step_aggregate(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle combining several tanks into one reservoir."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            if len(user_input[CONF_MEMBERS]) < 2:
+                errors["base"] = "too_few_members"
+            else:
+                return self.async_create_entry(
+                    title=user_input["name"], data=user_input
+                )
+
+        tanks = [
+            selector.SelectOptionDict(value=entry.entry_id, label=entry.title)
+            for entry in self._async_tank_entries()
+        ]
+        return self.async_show_form(
+            step_id="aggregate",
+            data_schema=vol.Schema(
+                {
+                    vol.Required("name"): str,
+                    vol.Required(CONF_MEMBERS): selector.SelectSelector(
+                        selector.SelectSelectorConfig(options=tanks, multiple=True)
+                    ),
+                }
+            ),
+            errors=errors,
+        )
+
+    @callback
+    def _async_tank_entries(self) -> list[config_entries.ConfigEntry]:
+        """Return the config entries of Liquid Check devices."""
+        return [
+            entry
+            for entry in self._async_current_entries(include_ignore=False)
+            if CONF_MEMBERS not in entry.data
+        ]
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlow:
+        """Get the options flow for this handler."""
+        return OptionsFlow()
+
+    @classmethod
+    @callback
+    def async_supports_options_flow(
+        cls, config_entry: config_entries.ConfigEntry
+    ) -> bool:
+        """Return options flow support, aggregates have no tank geometry."""
+        return CONF_MEMBERS not in config_entry.data
+
+
+class OptionsFlow(config_entries.OptionsFlow):
+    """Handle Liquid Check options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the tank geometry, measurement and pump options."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            try:
+                geometry_from_options(user_input)
+            except ValueError:
+                errors["base"] = "invalid_geometry"
+            if schedule := user_input.get(CONF_MEASURE_SCHEDULE):
+                try:
+                    CronSchedule(schedule).next_after(dt_util.now())
+                except ValueError:
+                    errors[CONF_MEASURE_SCHEDULE] = "invalid_schedule"
+            if not errors:
+                return self.async_create_entry(title="", data=user_input)
+
+        options = user_input or self.config_entry.options
+        return self.async_show_form(
+            step_id="init", data_schema=_options_schema(options), errors=errors
+        )
+
+
+def _options_schema(options: Mapping[str, Any]) -> vol.Schema:
+    """Return the options schema with the current values as defaults."""
+    dimension = vol.All(vol.Coerce(float), vol.Range(min=0))
+    return vol.Schema(
+        {
+            vol.Optional(
+                CONF_TANK_SHAPE, default=options.get(CONF_TANK_SHAPE, SHAPE_DEVICE)
+            ): selector.SelectSelector(
+                selector.SelectSelectorConfig(
+                    options=TANK_SHAPES,
+                    mode=selector.SelectSelectorMode.DROPDOWN,
+                    translation_key=CONF_TANK_SHAPE,
+                )
+            ),
+            vol.Optional(
+                CONF_TANK_DIAMETER, default=options.get(CONF_TANK_DIAMETER, 0.0)
+            ): dimension,
+            vol.Optional(
+                CONF_TANK_LENGTH, default=options.get(CONF_TANK_LENGTH, 0.0)
+            ): dimension,
+            vol.Optional(
+                CONF_TANK_WIDTH, default=options.get(CONF_TANK_WIDTH, 0.0)
+            ): dimension,
+            vol.Optional(
+                CONF_TANK_HEIGHT, default=options.get(CONF_TANK_HEIGHT, 0.0)
+            ): dimension,
+            vol.Optional(
+                CONF_STRAPPING_TABLE, default=options.get(CONF_STRAPPING_TABLE, "")
+            ): str,
+            vol.Optional(
+                CONF_MEASURE_SCHEDULE, default=options.get(CONF_MEASURE_SCHEDULE, "")
+            ): str,
+            vol.Optional(
+                CONF_PUMP_POWER, default=options.get(CONF_PUMP_POWER, 0.0)
+            ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+            vol.Optional(
+                CONF_STALE_AFTER, default=options.get(CONF_STALE_AFTER, 0)
+            ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+            vol.Optional(
+                CONF_POLL_MODE, default=options.get(CONF_POLL_MODE, POLL_MODE_INTERVAL)
+            ): selector.SelectSelector(
+                selector.SelectSelectorConfig(
+                    options=POLL_MODES,
+                    mode=selector.SelectSelectorMode.DROPDOWN,
+                    translation_key=CONF_POLL_MODE,
+                )
+            ),
+            vol.Optional(
+                CONF_FILTER, default=options.get(CONF_FILTER, FILTER_NONE)
+            ): selector.SelectSelector(
+                selector.SelectSelectorConfig(
+                    options=FILTER_TYPES,
+                    mode=selector.SelectSelectorMode.DROPDOWN,
+                    translation_key=CONF_FILTER,
+                )
+            ),
+            vol.Optional(
+                CONF_HEDGE_REQUESTS, default=options.get(CONF_HEDGE_REQUESTS, False)
+            ): bool,
+        }
+    )
+
+
+def _is_ip_address(host: str) -> bool:
+    """Return True if the host is an IP address rather than a hostname."""
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return True
+
 
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
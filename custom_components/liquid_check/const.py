@@ -1,3 +1,61 @@
 """Constants for the Liquid Check integration."""
 
 DOMAIN = "liquid_check"
+
+CONF_TANK_SHAPE = "tank_shape"
+CONF_TANK_DIAMETER = "tank_diameter"
+CONF_TANK_LENGTH = "tank_length"
+CONF_TANK_WIDTH = "tank_width"
+CONF_TANK_HEIGHT = "tank_height"
+CONF_STRAPPING_TABLE = "strapping_table"
+
+SHAPE_DEVICE = "device"
+SHAPE_VERTICAL_CYLINDER = "vertical_cylinder"
+SHAPE_HORIZONTAL_CYLINDER = "horizontal_cylinder"
+SHAPE_SPHERE = "sphere"
+SHAPE_RECTANGULAR = "rectangular"
+SHAPE_STRAPPING_TABLE = "strapping_table"
+
+TANK_SHAPES = [
+    SHAPE_DEVICE,
+    SHAPE_VERTICAL_CYLINDER,
+    SHAPE_HORIZONTAL_CYLINDER,
+    SHAPE_SPHERE,
+    SHAPE_RECTANGULAR,
+    SHAPE_STRAPPING_TABLE,
+]
+
+CONF_MEMBERS = "members"
+CONF_MEASURE_SCHEDULE = "measure_schedule"
+CONF_PUMP_POWER = "pump_power"
+CONF_STALE_AFTER = "stale_after"
+CONF_POLL_MODE = "poll_mode"
+CONF_HEDGE_REQUESTS = "hedge_requests"
+
+POLL_MODE_INTERVAL = "interval"
+POLL_MODE_PHASE_LOCKED = "phase_locked"
+POLL_MODES = [POLL_MODE_INTERVAL, POLL_MODE_PHASE_LOCKED]
+
+CONF_FILTER = "filter"
+
+FILTER_NONE = "none"
+FILTER_MEDIAN = "median"
+FILTER_EWMA = "ewma"
+FILTER_KALMAN = "kalman"
+FILTER_TYPES = [FILTER_NONE, FILTER_MEDIAN, FILTER_EWMA, FILTER_KALMAN]
+
+DEFAULT_SCAN_INTERVAL = 60
+
+# Seconds a device needs to finish a measurement before it is polled
+MEASURE_DURATION = 15
+
+# Seconds two measurement timestamps may differ by and still be the same
+# measurement; fetch time minus the whole-second age jitters between polls
+MEASUREMENT_JITTER = 5
+
+EVENT_LEAK_DETECTED = f"{DOMAIN}_leak_detected"
+EVENT_SENSOR_FAULT = f"{DOMAIN}_sensor_fault"
+EVENT_REFILL_DETECTED = f"{DOMAIN}_refill_detected"
+
+# Dispatched with the entry id after each update of a device coordinator
+SIGNAL_DATA_UPDATED = f"{DOMAIN}_data_updated"
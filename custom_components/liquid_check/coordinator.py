@@ -0,0 +1,448 @@
+"""Data update coordinator for the Liquid Check integration."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.typing import UNDEFINED
+from homeassistant.helpers.update_coordinator import (
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
+from homeassistant.util import dt as dt_util
+
+from .client import LiquidCheckClient
+from .const import (
+    CONF_HEDGE_REQUESTS,
+    CONF_POLL_MODE,
+    CONF_STALE_AFTER,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    EVENT_LEAK_DETECTED,
+    EVENT_REFILL_DETECTED,
+    EVENT_SENSOR_FAULT,
+    MEASURE_DURATION,
+    MEASUREMENT_JITTER,
+    POLL_MODE_PHASE_LOCKED,
+    SIGNAL_DATA_UPDATED,
+)
+from .detector import LevelAnomalyDetector
+from .filters import PRECISION, filter_from_options
+from .geometry import geometry_from_options
+from .history import MeasurementHistory
+from .phase import MeasurementPhase
+
+_LOGGER = logging.getLogger(__name__)
+
+# Location of each field in the infos.json payload
+FIELD_PATHS: dict[str, tuple[str, ...]] = {
+    "level": ("measure", "level"),
+    "content": ("measure", "content"),
+    "percent": ("measure", "percent"),
+    "age": ("measure", "age"),
+    "error": ("system", "error"),
+    "uptime": ("system", "uptime"),
+    "totalRuns": ("system", "pump", "totalRuns"),
+    "totalRuntime": ("system", "pump", "totalRuntime"),
+    "rssi": ("wifi", "accessPoint", "rssi"),
+    "firmware": ("device", "firmware"),
+    "hardware": ("device", "hardware"),
+    "mac": ("wifi", "station", "mac"),
+}
+
+# Diagnostics are refreshed every DIAGNOSTIC_INTERVAL, static metadata on the
+# first poll and after the device was unreachable or restarted, everything
+# else each poll
+DIAGNOSTIC_FIELDS = ("rssi", "uptime")
+STATIC_FIELDS = ("firmware", "hardware", "mac")
+DIAGNOSTIC_INTERVAL = timedelta(minutes=10)
+
+# Fields used by the coordinator itself, always extracted
+REQUIRED_FIELDS = ("level", "content", "percent", "age", "error", *STATIC_FIELDS)
+
+# Unrounded content and percent the tank capacity is derived from
+RAW_CONTENT_PATH = ("measure", "raw", "content")
+RAW_PERCENT_PATH = ("measure", "raw", "percent")
+
+LABEL_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n"})
+
+DETECTOR_EVENTS = {
+    "leak": EVENT_LEAK_DETECTED,
+    "sensor_fault": EVENT_SENSOR_FAULT,
+    "refill": EVENT_REFILL_DETECTED,
+}
+
+
+class LiquidCheckDataUpdateCoordinator(DataUpdateCoordinator):
+    """Class to manage fetching Liquid Check data."""
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Initialize."""
+        self._client = LiquidCheckClient(
+            entry.data["host"],
+            hedge=entry.options.get(CONF_HEDGE_REQUESTS, False),
+            create_task=partial(entry.async_create_background_task, hass),
+        )
+        self._geometry = geometry_from_options(entry.options)
+        self._capacity = self._geometry.capacity if self._geometry else None
+        self._filter = filter_from_options(entry.options)
+        self._measured_at: float | None = None
+        self._measured_content: float | None = None
+        self._flow: float | None = None
+        self._booted_at: float | None = None
+        self._uptime: Any = None
+        self._entry_id = entry.entry_id
+        self._name = entry.data["name"]
+        self.detector = LevelAnomalyDetector()
+        self.history = MeasurementHistory()
+        self._tracked_fields: dict[str, int] = {}
+        self._plan = self._compile_plan()
+        self._payload: dict[str, Any] = {}
+        self._diagnostics_at = 0.0
+        self._published_metadata: dict[str, Any] | None = None
+        self.metadata: dict[str, Any] = {}
+        self.metric_labels = _format_labels(
+            entry_id=entry.entry_id, name=entry.data["name"], host=entry.data["host"]
+        )
+        self.poll_count = 0
+        self.error_count = 0
+        self.poll_duration: float | None = None
+        self.fetched_at: float | None = None
+        stale_after = entry.options.get(CONF_STALE_AFTER)
+        self._stale_after = stale_after * 60 if stale_after else None
+        scan_interval = entry.data.get("scan_interval", DEFAULT_SCAN_INTERVAL)
+
+        # If interval is 0, disable automatic polling
+        update_interval = (
+            None if scan_interval == 0 else timedelta(seconds=scan_interval)
+        )
+        self._scan_interval = update_interval
+        self._phase = (
+            MeasurementPhase()
+            if update_interval is not None
+            and entry.options.get(CONF_POLL_MODE) == POLL_MODE_PHASE_LOCKED
+            else None
+        )
+
+        super().__init__(
+            hass,
+            _LOGGER,
+            config_entry=entry,
+            name=f"Liquid Check {entry.data['name']}",
+            update_interval=update_interval,
+        )
+
+    @property
+    def client(self) -> LiquidCheckClient:
+        """Return the client of the device."""
+        return self._client
+
+    @property
+    def capacity(self) -> float | None:
+        """Return the tank capacity in liters, None until it is known."""
+        return self._capacity
+
+    def payload_value(self, key: str) -> Any:
+        """Return a field of the last payload, whether it is tracked or not."""
+        return _extract(self._payload, FIELD_PATHS[key])
+
+    @callback
+    def async_track_field(self, key: str) -> CALLBACK_TYPE:
+        """Request a field for an entity, return a callback to release it."""
+        self._tracked_fields[key] = self._tracked_fields.get(key, 0) + 1
+        self._plan = self._compile_plan()
+        if self.data is not None and key not in self.data:
+            # Fill in a newly enabled field from the last payload
+            self.data[key] = self.payload_value(key)
+            if key == "uptime" and self.fetched_at is not None:
+                self._update_booted_at(self.fetched_at, self.data[key])
+                self.data["booted_at"] = _as_datetime(self._booted_at)
+
+        @callback
+        def _async_release() -> None:
+            self._tracked_fields[key] -= 1
+            if not self._tracked_fields[key]:
+                del self._tracked_fields[key]
+            self._plan = self._compile_plan()
+
+        return _async_release
+
+    def _compile_plan(self) -> dict[str, tuple[tuple[str, tuple[str, ...]], ...]]:
+        """Return the (field, payload path) pairs to extract for each tier."""
+        fields = [
+            (key, path)
+            for key, path in FIELD_PATHS.items()
+            if key in REQUIRED_FIELDS or key in self._tracked_fields
+        ]
+        return {
+            "static": tuple(field for field in fields if field[0] in STATIC_FIELDS),
+            "diagnostic": tuple(
+                field for field in fields if field[0] in DIAGNOSTIC_FIELDS
+            ),
+            "measurement": tuple(
+                field
+                for field in fields
+                if field[0] not in STATIC_FIELDS + DIAGNOSTIC_FIELDS
+            ),
+        }
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the device registry and all registered listeners."""
+        if self.metadata and self.metadata != self._published_metadata:
+            self._async_update_device()
+        super().async_update_listeners()
+        async_dispatcher_send(self.hass, SIGNAL_DATA_UPDATED, self._entry_id)
+
+    @callback
+    def _async_update_device(self) -> None:
+        """Publish changed static metadata to the device registry."""
+        self._published_metadata = self.metadata
+        mac = self.metadata.get("mac")
+        dr.async_get(self.hass).async_get_or_create(
+            config_entry_id=self._entry_id,
+            identifiers={(DOMAIN, self._entry_id)},
+            connections=(
+                {(dr.CONNECTION_NETWORK_MAC, dr.format_mac(mac))} if mac else UNDEFINED
+            ),
+            sw_version=self.metadata.get("firmware"),
+            hw_version=self.metadata.get("hardware"),
+        )
+
+    async def _async_update_data(self):
+        """Fetch data from API."""
+        self.poll_count += 1
+        started = time.monotonic()
+        try:
+            data = await self._client.get_info()
+            self.poll_duration = time.monotonic() - started
+            fetched_at = dt_util.utcnow().timestamp()
+            payload = data.get("payload", {})
+
+            self.fetched_at = fetched_at
+            self._payload = payload
+            if self._capacity is None:
+                self._learn_capacity(payload)
+            # Flatten the nested structure, only for the fields in use
+            plan = self._plan
+            result = {
+                key: _extract(payload, path) for key, path in plan["measurement"]
+            }
+
+            previous = self.data or {}
+            # A device that restarted, e.g. for a firmware update, may have
+            # new metadata even though no poll failed
+            uptime = _extract(payload, FIELD_PATHS["uptime"])
+            rebooted = _restarted(self._uptime, uptime)
+            self._uptime = uptime
+            reconnected = (
+                self.data is None or not self.last_update_success or rebooted
+            )
+            if reconnected:
+                self.metadata = {
+                    key: _extract(payload, path) for key, path in plan["static"]
+                }
+            result.update(self.metadata)
+
+            if reconnected or fetched_at - self._diagnostics_at >= (
+                DIAGNOSTIC_INTERVAL.total_seconds()
+            ):
+                self._diagnostics_at = fetched_at
+                for key, path in plan["diagnostic"]:
+                    result[key] = _extract(payload, path)
+                self._update_booted_at(fetched_at, result.get("uptime"))
+            else:
+                for key, _ in plan["diagnostic"]:
+                    result[key] = previous.get(key)
+
+            # Replace the device computed content for custom tank shapes
+            if self._geometry is not None and result["level"] is not None:
+                result["content"] = round(
+                    self._geometry.volume_at(result["level"]), 1
+                )
+                result["percent"] = round(
+                    self._geometry.percent_at(result["level"]), 1
+                )
+
+            measured_at = self._new_measurement(fetched_at, result["age"])
+            if self._filter is not None:
+                self._apply_filter(result, measured_at is not None)
+            if measured_at is not None:
+                self._update_flow(measured_at, result["content"])
+                if result["level"] is not None:
+                    self.detector.add_measurement(measured_at, result["level"])
+                self.history.append(
+                    measured_at, result["level"], result["content"], result["percent"]
+                )
+                self._measured_at = measured_at
+                if self._phase is not None:
+                    self._phase.add_measurement(measured_at)
+            self.detector.check_age(result["age"], result["error"])
+            result["stale"] = self._check_stale(result["age"])
+
+            if self._phase is not None:
+                self._schedule_after_measurement(fetched_at)
+
+            result["flow"] = self._flow
+            result["measured_at"] = _as_datetime(self._measured_at)
+            result["booted_at"] = (
+                _as_datetime(self._booted_at) if "uptime" in result else None
+            )
+            self._async_fire_detector_events(result)
+
+            return result
+        except Exception as err:
+            self.error_count += 1
+            if self._phase is not None:
+                self.update_interval = self._scan_interval
+            raise UpdateFailed(f"Error fetching data: {err}") from err
+
+    def _learn_capacity(self, payload: dict[str, Any]) -> None:
+        """Derive the capacity once from the unrounded values of the device.
+
+        It stays fixed afterwards, deriving it from each measurement would
+        make it change with the rounding of the fill level.
+        """
+        content = _extract(payload, RAW_CONTENT_PATH)
+        percent = _extract(payload, RAW_PERCENT_PATH)
+        if (
+            isinstance(content, int | float)
+            and isinstance(percent, int | float)
+            and percent > 0
+        ):
+            self._capacity = content / percent * 100
+
+    def _new_measurement(self, fetched_at: float, age: Any) -> float | None:
+        """Return the measurement timestamp if the device measured again."""
+        if age is None:
+            return None
+
+        measured_at = fetched_at - age
+        previous_at = self._measured_at
+        if previous_at is not None and measured_at - previous_at < MEASUREMENT_JITTER:
+            # Same measurement as the last poll
+            return None
+        return measured_at
+
+    def _apply_filter(self, result: dict[str, Any], new: bool) -> None:
+        """Publish the smoothed values and keep the raw ones."""
+        if new:
+            self._filter.update(result)
+        for key in PRECISION:
+            raw = result.get(key)
+            result[f"{key}_raw"] = raw
+            if raw is not None and (smoothed := self._filter.values[key]) is not None:
+                result[key] = smoothed
+
+    def _schedule_after_measurement(self, fetched_at: float) -> None:
+        """Poll again just after the next expected measurement."""
+        delay = self._phase.next_delay(fetched_at)
+        self.update_interval = (
+            self._scan_interval if delay is None else timedelta(seconds=delay)
+        )
+
+    def _check_stale(self, age: Any) -> bool:
+        """Return True if the last measurement is too old.
+
+        A new measurement is started once when the data becomes stale.
+        """
+        if self._stale_after is None or age is None:
+            return False
+
+        stale = age > self._stale_after
+        if stale and not (self.data or {}).get("stale"):
+            _LOGGER.info(
+                "Measurement of %s is %d min old, starting a new one",
+                self._name,
+                age / 60,
+            )
+            # Cancelled when the entry is unloaded
+            self.config_entry.async_create_background_task(
+                self.hass, self._async_measure_stale(), f"{DOMAIN} measure {self._name}"
+            )
+        return stale
+
+    async def _async_measure_stale(self) -> None:
+        """Start a measurement and refresh once it is done."""
+        try:
+            await self._client.send_command("StartMeasure")
+        except Exception as err:
+            _LOGGER.warning("Error starting a measurement of %s: %s", self._name, err)
+            return
+
+        await asyncio.sleep(MEASURE_DURATION)
+        await self.async_request_refresh()
+
+    def _update_booted_at(self, fetched_at: float, uptime: Any) -> None:
+        """Update the boot time when the device restarted."""
+        if uptime is None:
+            return
+
+        booted_at = fetched_at - uptime
+        if (
+            self._booted_at is None
+            or abs(booted_at - self._booted_at) >= MEASUREMENT_JITTER
+        ):
+            self._booted_at = booted_at
+
+    def _update_flow(self, measured_at: float, content: Any) -> None:
+        """Update the content change rate in L/min between measurements."""
+        previous = self._measured_content
+        if content is not None and previous is not None and self._measured_at:
+            minutes = (measured_at - self._measured_at) / 60
+            self._flow = round((content - previous) / minutes, 2)
+
+        self._measured_content = content
+
+    @callback
+    def _async_fire_detector_events(self, result: dict[str, Any]) -> None:
+        """Store the detector verdicts and fire events on new detections."""
+        state = self.detector.state
+        for key, event in DETECTOR_EVENTS.items():
+            detected = getattr(state, key)
+            if detected and not (self.data or {}).get(key):
+                self.hass.bus.async_fire(
+                    event, {"entry_id": self._entry_id, "name": self._name}
+                )
+            result[key] = detected
+
+
+def _format_labels(**labels: str) -> str:
+    """Return an OpenMetrics label set."""
+    return ",".join(
+        f'{name}="{value.translate(LABEL_ESCAPES)}"' for name, value in labels.items()
+    )
+
+
+def _as_datetime(timestamp: float | None) -> datetime | None:
+    """Return a UTC timestamp as datetime, rounded to the second."""
+    if timestamp is None:
+        return None
+    return dt_util.utc_from_timestamp(round(timestamp))
+
+
+def _restarted(previous: Any, uptime: Any) -> bool:
+    """Return True if the uptime went back since the last poll."""
+    return (
+        isinstance(previous, int | float)
+        and isinstance(uptime, int | float)
+        and uptime < previous
+    )
+
+
+def _extract(payload: dict[str, Any], path: tuple[str, ...]) -> Any:
+    """Return the value at a path of the payload, None if it is missing."""
+    value: Any = payload
+    for name in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(name)
+    return value
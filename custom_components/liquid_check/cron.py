@@ -0,0 +1,96 @@
+"""Cron expressions for the measurement schedule.
+
+Kept free of other imports of the integration so the config flow can
+validate schedules without loading the coordinator.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+# (name, minimum, maximum) of the five cron fields
+CRON_FIELDS = (
+    ("minute", 0, 59),
+    ("hour", 0, 23),
+    ("day", 1, 31),
+    ("month", 1, 12),
+    ("weekday", 0, 7),
+)
+
+
+class CronSchedule:
+    """A five field cron expression evaluated in local time.
+
+    Fields are minute, hour, day of month, month and day of week (0 or 7 is
+    Sunday). Each field accepts `*`, values, ranges `a-b`, steps `*/n` or
+    `a-b/n` and comma separated lists of these.
+    """
+
+    __slots__ = ("expression", "minutes", "hours", "days", "months", "weekdays")
+
+    def __init__(self, expression: str) -> None:
+        """Parse the expression, raise ValueError if it is invalid."""
+        fields = expression.split()
+        if len(fields) != len(CRON_FIELDS):
+            raise ValueError(f"Expected 5 fields in {expression!r}")
+
+        self.expression = expression
+        minutes, hours, days, months, weekdays = (
+            _parse_field(field, *spec) for field, spec in zip(fields, CRON_FIELDS)
+        )
+        self.minutes = minutes
+        self.hours = hours
+        self.months = months
+        # Like cron, a restricted day of month or day of week matches either
+        self.days = days if fields[2] != "*" or fields[4] == "*" else frozenset()
+        self.weekdays = (
+            frozenset(day % 7 for day in weekdays)
+            if fields[4] != "*" or fields[2] == "*"
+            else frozenset()
+        )
+
+    def next_after(self, moment: datetime) -> datetime:
+        """Return the first matching minute after a local datetime."""
+        moment = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = moment + timedelta(days=366 * 5)
+        while moment < limit:
+            if moment.month not in self.months:
+                year, month = divmod(moment.month, 12)
+                moment = moment.replace(
+                    year=moment.year + year, month=month + 1, day=1, hour=0, minute=0
+                )
+            elif not self._matches_day(moment):
+                moment = moment.replace(hour=0, minute=0) + timedelta(days=1)
+            elif moment.hour not in self.hours:
+                moment = moment.replace(minute=0) + timedelta(hours=1)
+            elif moment.minute not in self.minutes:
+                moment += timedelta(minutes=1)
+            else:
+                return moment
+        raise ValueError(f"{self.expression!r} never matches")
+
+    def _matches_day(self, moment: datetime) -> bool:
+        """Return True if the day of month or day of week matches."""
+        # isoweekday is 1 for Monday to 7 for Sunday, cron uses 0 for Sunday
+        return (
+            moment.day in self.days or moment.isoweekday() % 7 in self.weekdays
+        )
+
+
+def _parse_field(field: str, name: str, minimum: int, maximum: int) -> frozenset[int]:
+    """Return the values of one cron field."""
+    values: set[int] = set()
+    for part in field.split(","):
+        part_range, _, step = part.partition("/")
+        if part_range == "*":
+            start, end = minimum, maximum
+        elif "-" in part_range:
+            start, end = (int(value) for value in part_range.split("-", 1))
+        else:
+            start = end = int(part_range)
+            if step:
+                end = maximum
+        stride = int(step) if step else 1
+        if not minimum <= start <= end <= maximum or stride < 1:
+            raise ValueError(f"Invalid {name} field {field!r}")
+        values.update(range(start, end + 1, stride))
+    return frozenset(values)
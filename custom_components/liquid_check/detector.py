@@ -0,0 +1,109 @@
+"""Online anomaly and leak detection over the Liquid Check level stream."""
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+from homeassistant.util import dt as dt_util
+
+# Smoothing factor of the level rate baseline
+EWMA_ALPHA = 0.05
+# Noise floor of the level rate in m/h, avoids dividing by a tiny variance
+MIN_SIGMA = 0.002
+# CUSUM slack and decision threshold in standard deviations
+CUSUM_DRIFT = 0.5
+CUSUM_THRESHOLD = 5.0
+# A rise of this many standard deviations and at least MIN_REFILL meters
+REFILL_SIGMAS = 6.0
+MIN_REFILL = 0.02
+# Local hours in which no consumption is expected
+QUIET_HOURS = range(1, 5)
+# Level drop in meters during the quiet hours that indicates a leak
+QUIET_DRAIN = 0.01
+# Seconds without a new measurement before the sensor is considered stuck
+STUCK_AGE = 3 * 3600
+
+
+@dataclass(slots=True)
+class DetectorState:
+    """Current detector verdicts."""
+
+    leak: bool = False
+    sensor_fault: bool = False
+    refill: bool = False
+
+
+class LevelAnomalyDetector:
+    """Detect leaks, sensor faults and refills from successive measurements.
+
+    Every sample updates a fixed number of scalars: an EWMA mean and variance
+    of the level rate, a one-sided CUSUM on unusually fast draining and the
+    level at the start of the current quiet period.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the detector."""
+        self.state = DetectorState()
+        self._level: float | None = None
+        self._measured_at: float | None = None
+        self._mean = 0.0
+        self._variance = MIN_SIGMA**2
+        self._cusum = 0.0
+        self._quiet_start: float | None = None
+
+    def add_measurement(self, measured_at: float, level: float) -> DetectorState:
+        """Process a new measurement taken at a UTC timestamp."""
+        previous_level = self._level
+        previous_at = self._measured_at
+        self._level = level
+        self._measured_at = measured_at
+
+        if previous_level is None or previous_at is None or measured_at <= previous_at:
+            return self.state
+
+        delta = level - previous_level
+        rate = delta / ((measured_at - previous_at) / 3600)
+        sigma = max(math.sqrt(self._variance), MIN_SIGMA)
+        score = (rate - self._mean) / sigma
+
+        self.state.refill = delta >= MIN_REFILL and score >= REFILL_SIGMAS
+        if self.state.refill:
+            # A refill ends any leak suspicion and starts a new quiet period
+            self._cusum = 0.0
+            self._quiet_start = None
+            self.state.leak = False
+            return self.state
+
+        self._cusum = max(0.0, self._cusum - score - CUSUM_DRIFT)
+        leak = self._cusum >= CUSUM_THRESHOLD or self._quiet_drain(
+            measured_at, level
+        )
+
+        if abs(score) < 3:
+            # Only learn from samples that look normal
+            difference = rate - self._mean
+            self._mean += EWMA_ALPHA * difference
+            self._variance = (1 - EWMA_ALPHA) * (
+                self._variance + EWMA_ALPHA * difference**2
+            )
+
+        self.state.leak = leak
+        return self.state
+
+    def check_age(self, age: float | None, error: int | None) -> DetectorState:
+        """Update the sensor fault verdict, evaluated on every poll."""
+        self.state.sensor_fault = bool(error) or (
+            age is not None and age > STUCK_AGE
+        )
+        return self.state
+
+    def _quiet_drain(self, measured_at: float, level: float) -> bool:
+        """Return True if the level dropped during the quiet hours."""
+        local = dt_util.as_local(dt_util.utc_from_timestamp(measured_at))
+        if local.hour not in QUIET_HOURS:
+            self._quiet_start = None
+            return False
+        if self._quiet_start is None:
+            self._quiet_start = level
+            return False
+        return self._quiet_start - level >= QUIET_DRAIN
@@ -9,6 +9,7 @@ from homeassistant.core import Context, HomeAssistant
 from homeassistant.helpers import config_validation as cv
 
 from .const import DOMAIN
+from .services import async_send_device_command
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -43,13 +44,11 @@ async def async_call_action_from_config(
     hass: HomeAssistant, config: dict, variables: dict, context: Context | None
 ) -> None:
     """Execute a device action."""
-    service_data = {CONF_DEVICE_ID: config[CONF_DEVICE_ID]}
-    
     if config[CONF_TYPE] == "start_measure":
-        await hass.services.async_call(
-            DOMAIN, "start_measure", service_data, blocking=True, context=context
+        await async_send_device_command(
+            hass, config[CONF_DEVICE_ID], "StartMeasure", "Measurement started"
         )
     elif config[CONF_TYPE] == "restart":
-        await hass.services.async_call(
-            DOMAIN, "restart", service_data, blocking=True, context=context
+        await async_send_device_command(
+            hass, config[CONF_DEVICE_ID], "Restart", "Device restarting"
         )
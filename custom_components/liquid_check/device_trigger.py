@@ -0,0 +1,269 @@
+"""Support for Liquid Check device triggers.
+
+The triggers of a device are evaluated together once per coordinator update
+against the new data, instead of each automation watching entity states.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+from homeassistant.components.device_automation import DEVICE_TRIGGER_BASE_SCHEMA
+from homeassistant.components.device_automation.exceptions import (
+    InvalidDeviceAutomationConfig,
+)
+from homeassistant.const import CONF_DEVICE_ID, CONF_DOMAIN, CONF_PLATFORM, CONF_TYPE
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
+from homeassistant.helpers.typing import ConfigType
+
+from .const import DOMAIN, SIGNAL_DATA_UPDATED
+from .coordinator import LiquidCheckDataUpdateCoordinator
+from .services import async_get_device_entry
+
+DATA_DEVICE_TRIGGERS = f"{DOMAIN}_device_triggers"
+
+TRIGGER_BELOW = "below"
+TRIGGER_ABOVE = "above"
+TRIGGER_RATE = "rate"
+TRIGGER_REFILL = "refill"
+TRIGGER_TYPES = {TRIGGER_BELOW, TRIGGER_ABOVE, TRIGGER_RATE, TRIGGER_REFILL}
+
+CONF_FIELD = "field"
+CONF_THRESHOLD = "threshold"
+CONF_HYSTERESIS = "hysteresis"
+CONF_RATE = "rate"
+CONF_WINDOW = "window"
+
+FIELDS = ["percent", "content", "level"]
+# Minutes of history the rate is computed over
+DEFAULT_WINDOW = 60
+
+
+def _require(key: str, *types: str):
+    """Return a validator requiring key for the given trigger types."""
+
+    def validate(config: dict[str, Any]) -> dict[str, Any]:
+        if config[CONF_TYPE] in types and key not in config:
+            raise vol.Invalid(f"{key} is required for {config[CONF_TYPE]} triggers")
+        return config
+
+    return validate
+
+
+TRIGGER_SCHEMA = vol.All(
+    DEVICE_TRIGGER_BASE_SCHEMA.extend(
+        {
+            vol.Required(CONF_TYPE): vol.In(TRIGGER_TYPES),
+            vol.Optional(CONF_FIELD, default="percent"): vol.In(FIELDS),
+            vol.Optional(CONF_THRESHOLD): vol.Coerce(float),
+            vol.Optional(CONF_HYSTERESIS, default=0): vol.All(
+                vol.Coerce(float), vol.Range(min=0)
+            ),
+            vol.Optional(CONF_RATE): vol.Coerce(float),
+            vol.Optional(CONF_WINDOW, default=DEFAULT_WINDOW): vol.All(
+                vol.Coerce(int), vol.Range(min=1)
+            ),
+        }
+    ),
+    _require(CONF_THRESHOLD, TRIGGER_BELOW, TRIGGER_ABOVE),
+    _require(CONF_RATE, TRIGGER_RATE),
+)
+
+
+async def async_get_triggers(
+    hass: HomeAssistant, device_id: str
+) -> list[dict[str, str]]:
+    """List device triggers for Liquid Check devices."""
+    if async_get_device_entry(hass, device_id) is None:
+        return []
+    return [
+        {
+            CONF_PLATFORM: "device",
+            CONF_DEVICE_ID: device_id,
+            CONF_DOMAIN: DOMAIN,
+            CONF_TYPE: trigger_type,
+        }
+        for trigger_type in (TRIGGER_BELOW, TRIGGER_ABOVE, TRIGGER_RATE, TRIGGER_REFILL)
+    ]
+
+
+async def async_get_trigger_capabilities(
+    hass: HomeAssistant, config: ConfigType
+) -> dict[str, vol.Schema]:
+    """List the fields of a device trigger."""
+    trigger_type = config[CONF_TYPE]
+    if trigger_type == TRIGGER_REFILL:
+        return {}
+
+    fields: dict[Any, Any] = {
+        vol.Optional(CONF_FIELD, default="percent"): vol.In(FIELDS)
+    }
+    if trigger_type == TRIGGER_RATE:
+        fields[vol.Required(CONF_RATE)] = vol.Coerce(float)
+        fields[vol.Optional(CONF_WINDOW, default=DEFAULT_WINDOW)] = cv.positive_int
+    else:
+        fields[vol.Required(CONF_THRESHOLD)] = vol.Coerce(float)
+        fields[vol.Optional(CONF_HYSTERESIS, default=0)] = vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        )
+    return {"extra_fields": vol.Schema(fields)}
+
+
+async def async_attach_trigger(
+    hass: HomeAssistant,
+    config: ConfigType,
+    action: TriggerActionType,
+    trigger_info: TriggerInfo,
+) -> CALLBACK_TYPE:
+    """Attach a trigger to the updates of the device."""
+    entry = async_get_device_entry(hass, config[CONF_DEVICE_ID])
+    if entry is None:
+        raise InvalidDeviceAutomationConfig(
+            f"Device {config[CONF_DEVICE_ID]} not found"
+        )
+
+    trigger = LevelTrigger(config, action, trigger_info)
+    return async_get_device_triggers(hass).async_attach(entry.entry_id, trigger)
+
+
+@callback
+def async_get_device_triggers(hass: HomeAssistant) -> DeviceTriggers:
+    """Return the device triggers shared by all devices."""
+    if DATA_DEVICE_TRIGGERS not in hass.data:
+        hass.data[DATA_DEVICE_TRIGGERS] = DeviceTriggers(hass)
+    return hass.data[DATA_DEVICE_TRIGGERS]
+
+
+class DeviceTriggers:
+    """Evaluate the attached triggers of a device on each of its updates."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the triggers."""
+        self._hass = hass
+        self._triggers: dict[str, list[LevelTrigger]] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_attach(self, entry_id: str, trigger: LevelTrigger) -> CALLBACK_TYPE:
+        """Add a trigger of a device, return a callback to remove it."""
+        if self._unsub is None:
+            self._unsub = async_dispatcher_connect(
+                self._hass, SIGNAL_DATA_UPDATED, self._async_updated
+            )
+        self._triggers.setdefault(entry_id, []).append(trigger)
+        # Start from the current data, only later crossings fire
+        if (coordinator := self._coordinator(entry_id)) is not None:
+            trigger.async_evaluate(self._hass, coordinator)
+
+        @callback
+        def _async_remove() -> None:
+            triggers = self._triggers[entry_id]
+            triggers.remove(trigger)
+            if not triggers:
+                del self._triggers[entry_id]
+            if not self._triggers and self._unsub is not None:
+                self._unsub()
+                self._unsub = None
+
+        return _async_remove
+
+    @callback
+    def _async_updated(self, entry_id: str) -> None:
+        """Evaluate the triggers of an updated device."""
+        if (triggers := self._triggers.get(entry_id)) and (
+            coordinator := self._coordinator(entry_id)
+        ) is not None:
+            for trigger in list(triggers):
+                trigger.async_evaluate(self._hass, coordinator)
+
+    def _coordinator(self, entry_id: str) -> LiquidCheckDataUpdateCoordinator | None:
+        """Return the coordinator of a device with current data."""
+        coordinator = self._hass.data.get(DOMAIN, {}).get(entry_id)
+        if (
+            isinstance(coordinator, LiquidCheckDataUpdateCoordinator)
+            and coordinator.data
+            and coordinator.last_update_success
+        ):
+            return coordinator
+        return None
+
+
+class LevelTrigger:
+    """A trigger that fires when its condition becomes true.
+
+    After firing it is re-armed once the condition is released, for the
+    thresholds only after the value moved back past the hysteresis.
+    """
+
+    __slots__ = ("_config", "_job", "_trigger_data", "_armed")
+
+    def __init__(
+        self, config: ConfigType, action: TriggerActionType, trigger_info: TriggerInfo
+    ) -> None:
+        """Initialize the trigger."""
+        self._config = config
+        self._job = HassJob(action, f"liquid_check device trigger {config[CONF_TYPE]}")
+        self._trigger_data = trigger_info["trigger_data"]
+        self._armed: bool | None = None
+
+    @callback
+    def async_evaluate(
+        self, hass: HomeAssistant, coordinator: LiquidCheckDataUpdateCoordinator
+    ) -> None:
+        """Check the trigger against the data of the device."""
+        data = coordinator.data
+        if data.get("stale") or (state := self._state(coordinator)) is None:
+            return
+
+        active, released, value = state
+        if self._armed is None:
+            self._armed = not active
+        elif self._armed and active:
+            self._armed = False
+            hass.async_run_hass_job(
+                self._job,
+                {
+                    "trigger": {
+                        **self._trigger_data,
+                        CONF_PLATFORM: "device",
+                        CONF_DOMAIN: DOMAIN,
+                        CONF_DEVICE_ID: self._config[CONF_DEVICE_ID],
+                        CONF_TYPE: self._config[CONF_TYPE],
+                        CONF_FIELD: self._config[CONF_FIELD],
+                        "value": value,
+                        "description": f"{coordinator.name} {self._config[CONF_TYPE]}",
+                    }
+                },
+            )
+        elif not self._armed and released:
+            self._armed = True
+
+    def _state(
+        self, coordinator: LiquidCheckDataUpdateCoordinator
+    ) -> tuple[bool, bool, Any] | None:
+        """Return whether the condition is active and released, and the value."""
+        config = self._config
+        trigger_type = config[CONF_TYPE]
+        if trigger_type == TRIGGER_REFILL:
+            refill = bool(coordinator.data.get("refill"))
+            return refill, not refill, refill
+
+        field = config[CONF_FIELD]
+        if trigger_type == TRIGGER_RATE:
+            since = (coordinator.fetched_at or 0) - config[CONF_WINDOW] * 60
+            if (rate := coordinator.history.slope(field, since)) is None:
+                return None
+            limit = config[CONF_RATE]
+            active = rate <= limit if limit < 0 else rate >= limit
+            return active, not active, rate
+
+        if (value := coordinator.data.get(field)) is None:
+            return None
+        threshold = config[CONF_THRESHOLD]
+        hysteresis = config[CONF_HYSTERESIS]
+        if trigger_type == TRIGGER_BELOW:
+            return value < threshold, value >= threshold + hysteresis, value
+        return value > threshold, value <= threshold - hysteresis, value
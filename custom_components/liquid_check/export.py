@@ -0,0 +1,200 @@
+"""Export the recorded Liquid Check history to a file."""
+from __future__ import annotations
+
+import csv
+import json
+import logging
+import math
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import IO, Any
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.history import get_significant_states
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+
+from .backfill import STATISTIC_UNITS
+
+_LOGGER = logging.getLogger(__name__)
+
+# Recorded time read per query, rounded up to a multiple of the interval
+CHUNK_DURATION = timedelta(days=1)
+
+COLUMNS = ("timestamp", *STATISTIC_UNITS)
+
+
+@callback
+def async_get_export_entities(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, str]:
+    """Return the key of each exported sensor of a device by entity id."""
+    registry = er.async_get(hass)
+    return {
+        entity_id: key
+        for key in STATISTIC_UNITS
+        if (
+            entity_id := registry.async_get_entity_id(
+                "sensor", entry.domain, f"{entry.entry_id}_{key}"
+            )
+        )
+    }
+
+
+def merge_states(
+    states: dict[str, list[dict[str, Any]]],
+    entities: dict[str, str],
+    origin: float,
+    interval: float | None,
+) -> list[tuple[float, dict[str, float]]]:
+    """Merge the states of the sensors into rows in time order.
+
+    Without an interval the states of one update, written within the same
+    second, form a row. With an interval each row holds the means of the
+    states in the interval starting at its timestamp.
+    """
+    buckets: dict[float, dict[str, list[float]]] = {}
+    for entity_id, entity_states in states.items():
+        key = entities[entity_id]
+        for state in entity_states:
+            try:
+                value = float(state["s"])
+            except ValueError:
+                # unavailable or unknown
+                continue
+            if not math.isfinite(value):
+                continue
+            timestamp = state["lu"]
+            if interval is None:
+                start = float(math.floor(timestamp))
+            else:
+                start = origin + (timestamp - origin) // interval * interval
+            bucket = buckets.setdefault(start, {})
+            bucket.setdefault(key, []).append(value)
+
+    return [
+        (start, {key: math.fsum(values) / len(values) for key, values in row.items()})
+        for start, row in sorted(buckets.items())
+    ]
+
+
+class HistoryWriter:
+    """Write rows as CSV or JSON lines, in the format import_history reads."""
+
+    def __init__(self, file: IO[str], jsonl: bool) -> None:
+        """Initialize the writer and write the CSV header, in the executor."""
+        self.file = file
+        self._csv = None if jsonl else csv.DictWriter(file, COLUMNS)
+        if self._csv is not None:
+            self._csv.writeheader()
+
+    def write(self, rows: Iterable[tuple[float, dict[str, float]]]) -> int:
+        """Write rows, return how many were written."""
+        count = 0
+        for timestamp, values in rows:
+            row = {
+                "timestamp": dt_util.utc_from_timestamp(timestamp).isoformat(),
+                **values,
+            }
+            if self._csv is not None:
+                self._csv.writerow(row)
+            else:
+                self.file.write(json.dumps(row) + "\n")
+            count += 1
+        return count
+
+
+def _export_chunk(
+    hass: HomeAssistant,
+    writer: HistoryWriter,
+    entities: dict[str, str],
+    start: datetime,
+    end: datetime,
+    origin: float,
+    interval: float | None,
+) -> int:
+    """Query one chunk of the history and append it to the file."""
+    states = get_significant_states(
+        hass,
+        # The recorder excludes states at the start time
+        start - timedelta(microseconds=1),
+        end,
+        list(entities),
+        include_start_time_state=False,
+        significant_changes_only=False,
+        minimal_response=True,
+        no_attributes=True,
+        compressed_state_format=True,
+    )
+    return writer.write(merge_states(states, entities, origin, interval))
+
+
+def _open_export(path: Path) -> HistoryWriter:
+    """Open a new file next to the export, renamed when it is complete."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    file = path.with_name(f"{path.name}.part").open(
+        "w", encoding="utf-8", newline=""
+    )
+    return HistoryWriter(file, jsonl=path.suffix.lower() != ".csv")
+
+
+def _finish_export(writer: HistoryWriter, path: Path, complete: bool) -> None:
+    """Close the file and move it into place, or remove a partial export."""
+    writer.file.close()
+    part = Path(writer.file.name)
+    if complete:
+        part.replace(path)
+    else:
+        part.unlink(missing_ok=True)
+
+
+async def async_export_history(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    path: Path,
+    start: datetime,
+    end: datetime,
+    interval: timedelta | None = None,
+) -> int:
+    """Stream the recorded history of a device to a file, return the rows.
+
+    The history is read one chunk at a time in the recorder's executor and
+    written right away, so memory does not grow with the time range.
+    """
+    if not (entities := async_get_export_entities(hass, entry)):
+        raise ValueError(f"No sensors of {entry.data['name']} found")
+
+    step = CHUNK_DURATION
+    seconds = None
+    if interval is not None:
+        seconds = interval.total_seconds()
+        step = interval * max(1, math.ceil(CHUNK_DURATION / interval))
+
+    recorder = get_instance(hass)
+    writer = await hass.async_add_executor_job(_open_export, path)
+    rows = 0
+    complete = False
+    try:
+        chunk_start = start
+        while chunk_start < end:
+            chunk_end = min(chunk_start + step, end)
+            rows += await recorder.async_add_executor_job(
+                _export_chunk,
+                hass,
+                writer,
+                entities,
+                chunk_start,
+                chunk_end,
+                start.timestamp(),
+                seconds,
+            )
+            chunk_start = chunk_end
+        complete = True
+    finally:
+        await hass.async_add_executor_job(_finish_export, writer, path, complete)
+
+    _LOGGER.info("Exported %s rows of history for %s", rows, entry.data["name"])
+    return rows
@@ -0,0 +1,120 @@
+"""Noise filters for the Liquid Check measurements."""
+from __future__ import annotations
+
+import statistics
+from collections import deque
+from collections.abc import Mapping
+from typing import Any, Protocol
+
+from .const import CONF_FILTER, FILTER_EWMA, FILTER_KALMAN, FILTER_MEDIAN
+
+# Measurements the median is taken of
+MEDIAN_SIZE = 5
+# Weight of a new measurement in the moving average
+EWMA_ALPHA = 0.3
+# Ratio of the process noise to the measurement noise of the Kalman filter
+KALMAN_NOISE_RATIO = 0.05
+
+# Decimals of the published values, small wobbles do not change the state
+PRECISION = {"level": 3, "content": 1, "percent": 1}
+
+
+class Filter(Protocol):
+    """Filter of a single series of values."""
+
+    def update(self, value: float) -> float:
+        """Add a value and return the filtered value."""
+
+
+class MedianFilter:
+    """Median of the last measurements, drops single outliers."""
+
+    __slots__ = ("_values",)
+
+    def __init__(self, size: int = MEDIAN_SIZE) -> None:
+        """Initialize the filter."""
+        self._values: deque[float] = deque(maxlen=size)
+
+    def update(self, value: float) -> float:
+        """Add a value and return the filtered value."""
+        self._values.append(value)
+        return statistics.median(self._values)
+
+
+class EwmaFilter:
+    """Exponentially weighted moving average."""
+
+    __slots__ = ("_alpha", "_value")
+
+    def __init__(self, alpha: float = EWMA_ALPHA) -> None:
+        """Initialize the filter."""
+        self._alpha = alpha
+        self._value: float | None = None
+
+    def update(self, value: float) -> float:
+        """Add a value and return the filtered value."""
+        if self._value is None:
+            self._value = value
+        else:
+            self._value += self._alpha * (value - self._value)
+        return self._value
+
+
+class KalmanFilter:
+    """One dimensional Kalman filter of a slowly changing value.
+
+    The variances are relative to the measurement noise, so the same filter
+    works for values of any unit.
+    """
+
+    __slots__ = ("_ratio", "_estimate", "_variance")
+
+    def __init__(self, ratio: float = KALMAN_NOISE_RATIO) -> None:
+        """Initialize the filter."""
+        self._ratio = ratio
+        self._estimate: float | None = None
+        self._variance = 1.0
+
+    def update(self, value: float) -> float:
+        """Add a value and return the filtered value."""
+        if self._estimate is None:
+            self._estimate = value
+            return value
+
+        variance = self._variance + self._ratio
+        gain = variance / (variance + 1)
+        self._estimate += gain * (value - self._estimate)
+        self._variance = (1 - gain) * variance
+        return self._estimate
+
+
+FILTERS: dict[str, type[MedianFilter | EwmaFilter | KalmanFilter]] = {
+    FILTER_MEDIAN: MedianFilter,
+    FILTER_EWMA: EwmaFilter,
+    FILTER_KALMAN: KalmanFilter,
+}
+
+
+class MeasurementFilter:
+    """Smooth the level, content and percent of new measurements."""
+
+    __slots__ = ("_filters", "values")
+
+    def __init__(self, kind: str) -> None:
+        """Initialize a filter per value."""
+        self._filters: dict[str, Filter] = {
+            key: FILTERS[kind]() for key in PRECISION
+        }
+        self.values: dict[str, float | None] = dict.fromkeys(PRECISION)
+
+    def update(self, measurement: Mapping[str, Any]) -> None:
+        """Add the values of a new measurement."""
+        for key, value_filter in self._filters.items():
+            if (value := measurement.get(key)) is not None:
+                self.values[key] = round(value_filter.update(value), PRECISION[key])
+
+
+def filter_from_options(options: Mapping[str, Any]) -> MeasurementFilter | None:
+    """Build the filter configured in the entry options, None if unfiltered."""
+    kind = options.get(CONF_FILTER)
+    return MeasurementFilter(kind) if kind in FILTERS else None
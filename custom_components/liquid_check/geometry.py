@@ -0,0 +1,187 @@
+"""Tank geometry model for the Liquid Check integration."""
+from __future__ import annotations
+
+import math
+import re
+from bisect import bisect_right
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any
+
+from .const import (
+    CONF_STRAPPING_TABLE,
+    CONF_TANK_DIAMETER,
+    CONF_TANK_HEIGHT,
+    CONF_TANK_LENGTH,
+    CONF_TANK_SHAPE,
+    CONF_TANK_WIDTH,
+    SHAPE_HORIZONTAL_CYLINDER,
+    SHAPE_RECTANGULAR,
+    SHAPE_SPHERE,
+    SHAPE_STRAPPING_TABLE,
+    SHAPE_VERTICAL_CYLINDER,
+)
+
+# Number of points sampled for shapes whose volume is not linear in level
+TABLE_SIZE = 256
+
+LITERS_PER_CUBIC_METER = 1000
+
+
+class TankGeometry:
+    """Precomputed level to volume lookup table.
+
+    Levels are in meters and volumes in liters. The table is immutable once
+    built, so a single instance can be shared between updates without locking.
+    """
+
+    __slots__ = ("_levels", "_volumes", "max_level", "capacity")
+
+    def __init__(self, levels: Sequence[float], volumes: Sequence[float]) -> None:
+        """Initialize the lookup table."""
+        if len(levels) != len(volumes) or len(levels) < 2:
+            raise ValueError("At least two level/volume points are required")
+        for index in range(1, len(levels)):
+            if levels[index] <= levels[index - 1]:
+                raise ValueError("Levels must be strictly increasing")
+            if volumes[index] < volumes[index - 1]:
+                raise ValueError("Volumes must not decrease with level")
+
+        self._levels = tuple(float(level) for level in levels)
+        self._volumes = tuple(float(volume) for volume in volumes)
+        self.max_level = self._levels[-1]
+        self.capacity = self._volumes[-1]
+
+    @classmethod
+    def from_function(
+        cls,
+        volume: Callable[[float], float],
+        max_level: float,
+        size: int = TABLE_SIZE,
+    ) -> TankGeometry:
+        """Sample a volume function (m -> m³) into a lookup table."""
+        if max_level <= 0:
+            raise ValueError("Tank dimensions must be positive")
+        step = max_level / (size - 1)
+        levels = [index * step for index in range(size)]
+        levels[-1] = max_level
+        return cls(
+            levels, [volume(level) * LITERS_PER_CUBIC_METER for level in levels]
+        )
+
+    @classmethod
+    def from_strapping_table(
+        cls, points: Sequence[tuple[float, float]]
+    ) -> TankGeometry:
+        """Build a lookup table from (level, volume) calibration points."""
+        ordered = sorted(points)
+        return cls([level for level, _ in ordered], [vol for _, vol in ordered])
+
+    def volume_at(self, level: float) -> float:
+        """Return the volume in liters for a level in meters."""
+        levels = self._levels
+        volumes = self._volumes
+        if level <= levels[0]:
+            return volumes[0]
+        if level >= levels[-1]:
+            return volumes[-1]
+
+        index = bisect_right(levels, level)
+        low_level = levels[index - 1]
+        low_volume = volumes[index - 1]
+        ratio = (level - low_level) / (levels[index] - low_level)
+        return low_volume + ratio * (volumes[index] - low_volume)
+
+    def percent_at(self, level: float) -> float:
+        """Return the fill percentage for a level in meters."""
+        if self.capacity <= 0:
+            return 0.0
+        return self.volume_at(level) / self.capacity * 100
+
+
+def _horizontal_cylinder(diameter: float, length: float) -> TankGeometry:
+    radius = diameter / 2
+
+    def volume(level: float) -> float:
+        depth = min(max(level, 0.0), diameter)
+        offset = radius - depth
+        area = radius**2 * math.acos(offset / radius) - offset * math.sqrt(
+            max(2 * radius * depth - depth**2, 0.0)
+        )
+        return area * length
+
+    return TankGeometry.from_function(volume, diameter)
+
+
+def _sphere(diameter: float) -> TankGeometry:
+    radius = diameter / 2
+
+    def volume(level: float) -> float:
+        depth = min(max(level, 0.0), diameter)
+        return math.pi * depth**2 * (3 * radius - depth) / 3
+
+    return TankGeometry.from_function(volume, diameter)
+
+
+def _vertical_cylinder(diameter: float, height: float) -> TankGeometry:
+    # Volume is linear in level, two points describe the tank exactly
+    area = math.pi * (diameter / 2) ** 2
+    return TankGeometry.from_function(lambda level: area * level, height, size=2)
+
+
+def _rectangular(length: float, width: float, height: float) -> TankGeometry:
+    return TankGeometry.from_function(
+        lambda level: length * width * level, height, size=2
+    )
+
+
+def parse_strapping_table(value: str) -> list[tuple[float, float]]:
+    """Parse a strapping table such as ``0:0, 0.5:420, 1.2:1000``."""
+    points = []
+    for item in re.split(r"[,;\n]+", value):
+        item = item.strip()
+        if not item:
+            continue
+        level, separator, volume = item.replace("=", ":").partition(":")
+        if not separator:
+            raise ValueError(f"Invalid strapping table entry: {item}")
+        points.append((float(level), float(volume)))
+    return points
+
+
+def geometry_from_options(options: Mapping[str, Any]) -> TankGeometry | None:
+    """Build the tank geometry configured in the entry options.
+
+    Returns None when the content reported by the device should be used.
+    Raises ValueError when the configured dimensions are invalid.
+    """
+    shape = options.get(CONF_TANK_SHAPE)
+
+    if shape == SHAPE_STRAPPING_TABLE:
+        return TankGeometry.from_strapping_table(
+            parse_strapping_table(options.get(CONF_STRAPPING_TABLE, ""))
+        )
+
+    diameter = float(options.get(CONF_TANK_DIAMETER, 0))
+    length = float(options.get(CONF_TANK_LENGTH, 0))
+    width = float(options.get(CONF_TANK_WIDTH, 0))
+    height = float(options.get(CONF_TANK_HEIGHT, 0))
+
+    if shape == SHAPE_HORIZONTAL_CYLINDER:
+        _require_positive(diameter, length)
+        return _horizontal_cylinder(diameter, length)
+    if shape == SHAPE_VERTICAL_CYLINDER:
+        _require_positive(diameter, height)
+        return _vertical_cylinder(diameter, height)
+    if shape == SHAPE_SPHERE:
+        _require_positive(diameter)
+        return _sphere(diameter)
+    if shape == SHAPE_RECTANGULAR:
+        _require_positive(length, width, height)
+        return _rectangular(length, width, height)
+
+    return None
+
+
+def _require_positive(*values: float) -> None:
+    if any(value <= 0 for value in values):
+        raise ValueError("Tank dimensions must be positive")
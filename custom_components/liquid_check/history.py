@@ -0,0 +1,125 @@
+"""Fixed capacity in-memory history of the Liquid Check measurements."""
+from __future__ import annotations
+
+import math
+from array import array
+
+# Measurements kept per device, 32 bytes each
+HISTORY_SIZE = 1024
+
+COLUMNS = ("level", "content", "percent")
+
+
+class MeasurementHistory:
+    """Ring buffer of the latest measurements in array backed columns.
+
+    Timestamps are UTC seconds in increasing order. Missing values are stored
+    as NaN and skipped by the statistics. Queries take an optional start
+    timestamp and cover the measurements taken at or after it.
+    """
+
+    __slots__ = ("_size", "_start", "_count", "timestamps", "_columns")
+
+    def __init__(self, size: int = HISTORY_SIZE) -> None:
+        """Initialize the history."""
+        self._size = size
+        self._start = 0
+        self._count = 0
+        self.timestamps = array("d", bytes(8 * size))
+        self._columns = {column: array("d", bytes(8 * size)) for column in COLUMNS}
+
+    def __len__(self) -> int:
+        """Return the number of stored measurements."""
+        return self._count
+
+    def append(
+        self,
+        timestamp: float,
+        level: float | None,
+        content: float | None,
+        percent: float | None,
+    ) -> None:
+        """Add a measurement, replacing the oldest one when full."""
+        if self._count < self._size:
+            index = (self._start + self._count) % self._size
+            self._count += 1
+        else:
+            index = self._start
+            self._start = (self._start + 1) % self._size
+
+        self.timestamps[index] = timestamp
+        for column, value in zip(COLUMNS, (level, content, percent)):
+            self._columns[column][index] = math.nan if value is None else value
+
+    def window(
+        self, column: str, since: float | None = None
+    ) -> list[tuple[float, float]]:
+        """Return the (timestamp, value) pairs of a column."""
+        values = self._columns[column]
+        return [
+            (self.timestamps[index], values[index])
+            for index in self._indexes(since)
+            if not math.isnan(values[index])
+        ]
+
+    def minimum(self, column: str, since: float | None = None) -> float | None:
+        """Return the smallest value of a column."""
+        values = self._values(column, since)
+        return min(values) if values else None
+
+    def maximum(self, column: str, since: float | None = None) -> float | None:
+        """Return the largest value of a column."""
+        values = self._values(column, since)
+        return max(values) if values else None
+
+    def mean(self, column: str, since: float | None = None) -> float | None:
+        """Return the mean value of a column."""
+        values = self._values(column, since)
+        return math.fsum(values) / len(values) if values else None
+
+    def slope(self, column: str, since: float | None = None) -> float | None:
+        """Return the least squares change of a column per hour."""
+        points = self.window(column, since)
+        if len(points) < 2:
+            return None
+
+        # Center the timestamps so large epoch values do not lose precision
+        origin = points[0][0]
+        count = len(points)
+        mean_time = math.fsum(time - origin for time, _ in points) / count
+        mean_value = math.fsum(value for _, value in points) / count
+        covariance = math.fsum(
+            (time - origin - mean_time) * (value - mean_value) for time, value in points
+        )
+        variance = math.fsum((time - origin - mean_time) ** 2 for time, _ in points)
+        if not variance:
+            return None
+        return covariance / variance * 3600
+
+    def _values(self, column: str, since: float | None) -> list[float]:
+        """Return the present values of a column."""
+        values = self._columns[column]
+        return [
+            values[index]
+            for index in self._indexes(since)
+            if not math.isnan(values[index])
+        ]
+
+    def _indexes(self, since: float | None) -> range | list[int]:
+        """Return the buffer indexes in time order, starting at since."""
+        first = 0 if since is None else self._bisect(since)
+        start, size = self._start, self._size
+        if start + self._count <= size:
+            return range(start + first, start + self._count)
+        return [(start + offset) % size for offset in range(first, self._count)]
+
+    def _bisect(self, since: float) -> int:
+        """Return the offset of the first measurement at or after since."""
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self.timestamps[(self._start + middle) % self._size] < since:
+                low = middle + 1
+            else:
+                high = middle
+        return low
@@ -0,0 +1,57 @@
+"""Align the polls with the measurement cycle of a Liquid Check device."""
+from __future__ import annotations
+
+# Smoothing factor of the measurement period
+PERIOD_ALPHA = 0.3
+# Seconds after the expected measurement to poll, covers the measuring time
+PHASE_MARGIN = 5
+# Shortest delay between polls while waiting for a late measurement
+MIN_DELAY = 10
+# Seconds a measurement may be late before the next cycle is expected
+LATE_TOLERANCE = 30
+
+
+class MeasurementPhase:
+    """Learn the measurement period and predict the next measurement.
+
+    Gaps spanning several periods, from skipped measurements or polls, are
+    divided by the number of periods they cover. Much shorter gaps come from
+    measurements started by hand and do not change the period.
+    """
+
+    __slots__ = ("period", "_measured_at")
+
+    def __init__(self) -> None:
+        """Initialize the tracker."""
+        self.period: float | None = None
+        self._measured_at: float | None = None
+
+    def add_measurement(self, measured_at: float) -> None:
+        """Update the period with the timestamp of a new measurement."""
+        previous = self._measured_at
+        self._measured_at = measured_at
+        if previous is None or measured_at <= previous:
+            return
+
+        delta = measured_at - previous
+        if self.period is None:
+            self.period = delta
+            return
+
+        if delta < self.period / 2:
+            return
+        cycles = max(1, round(delta / self.period))
+        self.period += PERIOD_ALPHA * (delta / cycles - self.period)
+
+    def next_delay(self, now: float) -> float | None:
+        """Return the seconds until the poll after the next measurement."""
+        if self.period is None or self._measured_at is None:
+            return None
+
+        expected = self._measured_at + self.period
+        if expected < now - LATE_TOLERANCE:
+            # Skip the cycles that were missed
+            expected += ((now - LATE_TOLERANCE - expected) // self.period + 1) * (
+                self.period
+            )
+        return max(MIN_DELAY, expected + PHASE_MARGIN - now)
@@ -0,0 +1,142 @@
+"""Fleet-wide measurement scheduling for Liquid Check devices."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime
+from functools import partial
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, MEASURE_DURATION
+
+if TYPE_CHECKING:
+    from .coordinator import LiquidCheckDataUpdateCoordinator
+    from .cron import CronSchedule
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_SCHEDULER = f"{DOMAIN}_scheduler"
+
+# Commands in flight at the same time and delay between starting them
+MAX_CONCURRENT_COMMANDS = 3
+COMMAND_STAGGER = 0.5
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> MeasurementScheduler:
+    """Return the measurement scheduler shared by all devices."""
+    if DATA_SCHEDULER not in hass.data:
+        hass.data[DATA_SCHEDULER] = MeasurementScheduler(hass)
+    return hass.data[DATA_SCHEDULER]
+
+
+class MeasurementScheduler:
+    """Start scheduled measurements of all devices from a single timer.
+
+    Devices sharing a schedule form a group. When the timer fires the
+    StartMeasure commands of all due devices are staggered, with a bounded
+    number in flight, and each device is refreshed once after measuring.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._schedules: dict[
+            str, tuple[CronSchedule, LiquidCheckDataUpdateCoordinator]
+        ] = {}
+        self._next_runs: dict[str, datetime] = {}
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    @callback
+    def async_add(
+        self,
+        entry_id: str,
+        schedule: CronSchedule,
+        coordinator: LiquidCheckDataUpdateCoordinator,
+    ) -> CALLBACK_TYPE:
+        """Schedule measurements of a device, return a callback to remove it."""
+        self._schedules[entry_id] = (schedule, coordinator)
+        self._next_runs[entry_id] = schedule.next_after(dt_util.now())
+        self._async_schedule_timer()
+
+        @callback
+        def _async_remove() -> None:
+            self._schedules.pop(entry_id, None)
+            self._next_runs.pop(entry_id, None)
+            if (task := self._tasks.pop(entry_id, None)) is not None:
+                task.cancel()
+            self._async_schedule_timer()
+
+        return _async_remove
+
+    @callback
+    def _async_schedule_timer(self) -> None:
+        """Set the timer to the earliest scheduled measurement."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+        if self._next_runs:
+            self._unsub_timer = async_track_point_in_utc_time(
+                self.hass,
+                self._async_fire,
+                dt_util.as_utc(min(self._next_runs.values())),
+            )
+
+    @callback
+    def _async_fire(self, now: datetime) -> None:
+        """Start the measurements of all due devices."""
+        self._unsub_timer = None
+        now = dt_util.as_local(now)
+        due = []
+        for entry_id, next_run in self._next_runs.items():
+            if next_run <= now:
+                schedule, coordinator = self._schedules[entry_id]
+                due.append((entry_id, coordinator))
+                self._next_runs[entry_id] = schedule.next_after(next_run)
+        self._async_schedule_timer()
+
+        if due:
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_COMMANDS)
+            for index, (entry_id, coordinator) in enumerate(due):
+                # Tasks of the entry are also cancelled when it is unloaded
+                task = coordinator.config_entry.async_create_background_task(
+                    self.hass,
+                    self._async_measure(coordinator, index, semaphore),
+                    f"{DOMAIN} scheduled measurement {coordinator.name}",
+                )
+                self._tasks[entry_id] = task
+                task.add_done_callback(partial(self._async_task_done, entry_id))
+
+    @callback
+    def _async_task_done(self, entry_id: str, task: asyncio.Task) -> None:
+        """Forget the measurement task of a device once it is done."""
+        if self._tasks.get(entry_id) is task:
+            del self._tasks[entry_id]
+
+    async def _async_measure(
+        self,
+        coordinator: LiquidCheckDataUpdateCoordinator,
+        index: int,
+        semaphore: asyncio.Semaphore,
+    ) -> None:
+        """Start a measurement on a device, then refresh it once.
+
+        The commands of devices due together are staggered by their index and
+        share the semaphore bounding the commands in flight.
+        """
+        await asyncio.sleep(index * COMMAND_STAGGER)
+        async with semaphore:
+            try:
+                await coordinator.client.send_command("StartMeasure")
+            except Exception as err:
+                _LOGGER.warning(
+                    "Scheduled measurement of %s failed: %s", coordinator.name, err
+                )
+
+        await asyncio.sleep(MEASURE_DURATION)
+        await coordinator.async_refresh()
@@ -2,9 +2,9 @@
 from __future__ import annotations
 
 import logging
-from datetime import timedelta
 
 from homeassistant.components.sensor import (
+    RestoreSensor,
     SensorDeviceClass,
     SensorEntity,
     SensorStateClass,
@@ -13,24 +13,24 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     PERCENTAGE,
     SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+    UnitOfEnergy,
     UnitOfTime,
     UnitOfVolume,
+    UnitOfVolumeFlowRate,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.device_registry import DeviceEntryType
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
-    DataUpdateCoordinator,
-    UpdateFailed,
-)
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .client import LiquidCheckClient
+from .aggregate import LiquidCheckAggregateCoordinator
+from .const import CONF_FILTER, CONF_MEMBERS, CONF_PUMP_POWER, DOMAIN, FILTER_NONE
+from .coordinator import LiquidCheckDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
-DEFAULT_SCAN_INTERVAL = 60
-
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -38,9 +38,28 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Liquid Check sensor based on a config entry."""
-    coordinator = LiquidCheckDataUpdateCoordinator(hass, entry)
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+
+    if CONF_MEMBERS in entry.data:
+        async_add_entities(
+            [
+                LiquidCheckAggregateContentSensor(coordinator, entry),
+                LiquidCheckAggregatePercentSensor(coordinator, entry),
+                LiquidCheckAggregateFlowSensor(coordinator, entry),
+            ]
+        )
+        return
+
     await coordinator.async_config_entry_first_refresh()
 
+    # The uptime and measurement age counters were replaced by timestamps
+    registry = er.async_get(hass)
+    for suffix in ("uptime", "measurement_age"):
+        if entity_id := registry.async_get_entity_id(
+            "sensor", DOMAIN, f"{entry.entry_id}_{suffix}"
+        ):
+            registry.async_remove(entity_id)
+
     async_add_entities(
         [
             LiquidCheckLevelSensor(coordinator, entry),
@@ -49,77 +68,35 @@ async def async_setup_entry(
             LiquidCheckWiFiRSSISensor(coordinator, entry),
             LiquidCheckPumpTotalRunsSensor(coordinator, entry),
             LiquidCheckPumpTotalRuntimeSensor(coordinator, entry),
-            LiquidCheckUptimeSensor(coordinator, entry),
+            LiquidCheckBootedAtSensor(coordinator, entry),
             LiquidCheckErrorSensor(coordinator, entry),
             LiquidCheckFirmwareSensor(coordinator, entry),
-            LiquidCheckMeasurementAgeSensor(coordinator, entry),
+            LiquidCheckLastMeasuredSensor(coordinator, entry),
         ]
     )
 
+    if entry.options.get(CONF_PUMP_POWER):
+        async_add_entities([LiquidCheckPumpEnergySensor(coordinator, entry)])
 
-class LiquidCheckDataUpdateCoordinator(DataUpdateCoordinator):
-    """Class to manage fetching Liquid Check data."""
-
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
-        """Initialize."""
-        self._client = LiquidCheckClient(entry.data["host"])
-        scan_interval = entry.data.get("scan_interval", DEFAULT_SCAN_INTERVAL)
-        
-        # If interval is 0, disable automatic polling
-        update_interval = (
-            None if scan_interval == 0 else timedelta(seconds=scan_interval)
+    if entry.options.get(CONF_FILTER, FILTER_NONE) != FILTER_NONE:
+        async_add_entities(
+            [
+                LiquidCheckLevelRawSensor(coordinator, entry),
+                LiquidCheckContentRawSensor(coordinator, entry),
+                LiquidCheckPercentRawSensor(coordinator, entry),
+            ]
         )
-        
-        super().__init__(
-            hass,
-            _LOGGER,
-            name="Liquid Check",
-            update_interval=update_interval,
-        )
-
-    async def _async_update_data(self):
-        """Fetch data from API."""
-        try:
-            data = await self._client.get_info()
-            payload = data.get("payload", {})
-            
-            # Flatten the nested structure for easier access
-            result = {}
-            
-            # Get measure data
-            measure = payload.get("measure", {})
-            result["level"] = measure.get("level")
-            result["content"] = measure.get("content")
-            result["percent"] = measure.get("percent")
-            result["age"] = measure.get("age")
-            
-            # Get system data
-            system = payload.get("system", {})
-            result["error"] = system.get("error")
-            result["uptime"] = system.get("uptime")
-            
-            # Get pump data
-            pump = system.get("pump", {})
-            result["totalRuns"] = pump.get("totalRuns")
-            result["totalRuntime"] = pump.get("totalRuntime")
-            
-            # Get WiFi data
-            wifi = payload.get("wifi", {})
-            access_point = wifi.get("accessPoint", {})
-            result["rssi"] = access_point.get("rssi")
-            
-            # Get device data
-            device = payload.get("device", {})
-            result["firmware"] = device.get("firmware")
-            
-            return result
-        except Exception as err:
-            raise UpdateFailed(f"Error fetching data: {err}") from err
 
 
 class LiquidCheckBaseSensor(CoordinatorEntity, SensorEntity):
     """Base class for Liquid Check sensors."""
 
+    _key: str
+    # Payload field the value is derived from, if it is not _key itself
+    _field: str | None = None
+    # Unavailable while the last measurement is stale
+    _measured = False
+
     def __init__(
         self, coordinator: LiquidCheckDataUpdateCoordinator, entry: ConfigEntry
     ) -> None:
@@ -134,6 +111,27 @@ class LiquidCheckBaseSensor(CoordinatorEntity, SensorEntity):
             configuration_url=f"http://{entry.data['host']}",
         )
 
+    async def async_added_to_hass(self) -> None:
+        """Request the field of this sensor from the coordinator."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_track_field(self._field or self._key)
+        )
+
+    @property
+    def available(self) -> bool:
+        """Return if the value is current."""
+        return super().available and not (
+            self._measured and (self.coordinator.data or {}).get("stale")
+        )
+
+    @property
+    def native_value(self):
+        """Return the state of the sensor."""
+        if self.coordinator.data:
+            return self.coordinator.data.get(self._key)
+        return None
+
 
 class LiquidCheckLevelSensor(LiquidCheckBaseSensor):
     """Representation of Liquid Check Level Sensor."""
@@ -141,6 +139,8 @@ class LiquidCheckLevelSensor(LiquidCheckBaseSensor):
     _attr_device_class = SensorDeviceClass.DISTANCE
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = "m"
+    _key = "level"
+    _measured = True
 
     def __init__(
         self, coordinator: LiquidCheckDataUpdateCoordinator, entry: ConfigEntry
@@ -150,13 +150,6 @@ class LiquidCheckLevelSensor(LiquidCheckBaseSensor):
         self._attr_name = f"{entry.data['name']} Level"
         self._attr_unique_id = f"{entry.entry_id}_level"
 
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("level")
-        return None
-
 
 class LiquidCheckContentSensor(LiquidCheckBaseSensor):
     """Representation of Liquid Check Content Sensor."""
@@ -164,6 +157,8 @@ class LiquidCheckContentSensor(LiquidCheckBaseSensor):
     _attr_device_class = SensorDeviceClass.VOLUME
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = UnitOfVolume.LITERS
+    _key = "content"
+    _measured = True
 
     def __init__(
         self, coordinator: LiquidCheckDataUpdateCoordinator, entry: ConfigEntry
@@ -173,19 +168,14 @@ class LiquidCheckContentSensor(LiquidCheckBaseSensor):
         self._attr_name = f"{entry.data['name']} Content"
         self._attr_unique_id = f"{entry.entry_id}_content"
 
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("content")
-        return None
-
 
 class LiquidCheckPercentSensor(LiquidCheckBaseSensor):
     """Representation of Liquid Check Percent Sensor."""
 
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = PERCENTAGE
+    _key = "percent"
+    _measured = True
 
     def __init__(
         self, coordinator: LiquidCheckDataUpdateCoordinator, entry: ConfigEntry
@@ -195,12 +185,53 @@ class LiquidCheckPercentSensor(LiquidCheckBaseSensor):
         self._attr_name = f"{entry.data['name']} Percent"
         self._attr_unique_id = f"{entry.entry_id}_percent"
 
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("percent")
-        return None
+
+class LiquidCheckLevelRawSensor(LiquidCheckLevelSensor):
+    """Representation of the unfiltered Liquid Check level."""
+
+    _attr_entity_registry_enabled_default = False
+    _key = "level_raw"
+    _field = "level"
+
+    def __init__(
+        self, coordinator: LiquidCheckDataUpdateCoordinator, entry: ConfigEntry
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry)
+        self._attr_name = f"{entry.data['name']} Level Raw"
+        self._attr_unique_id = f"{entry.entry_id}_level_raw"
+
+
+class LiquidCheckContentRawSensor(LiquidCheckContentSensor):
+    """Representation of the unfiltered Liquid Check content."""
+
+    _attr_entity_registry_enabled_default = False
+    _key = "content_raw"
+    _field = "content"
+
+    def __init__(
+        self, coordinator: LiquidCheckDataUpdateCoordinator, entry: ConfigEntry
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry)
+        self._attr_name = f"{entry.data['name']} Content Raw"
+        self._attr_unique_id = f"{entry.entry_id}_content_raw"
+
+
+class LiquidCheckPercentRawSensor(LiquidCheckPercentSensor):
+    """Representation of the unfiltered Liquid Check percent."""
+
+    _attr_entity_registry_enabled_default = False
+    _key = "percent_raw"
+    _field = "percent"
+
+    def __init__(
+        self, coordinator: LiquidCheckDataUpdateCoordinator, entry: ConfigEntry
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry)
+        self._attr_name = f"{entry.data['name']} Percent Raw"
+        self._attr_unique_id = f"{entry.entry_id}_percent_raw"
 
 
 class LiquidCheckWiFiRSSISensor(LiquidCheckBaseSensor):
@@ -210,6 +241,7 @@ class LiquidCheckWiFiRSSISensor(LiquidCheckBaseSensor):
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = SIGNAL_STRENGTH_DECIBELS_MILLIWATT
     _attr_entity_registry_enabled_default = False
+    _key = "rssi"
 
     def __init__(
         self, coordinator: LiquidCheckDataUpdateCoordinator, entry: ConfigEntry
@@ -219,19 +251,13 @@ class LiquidCheckWiFiRSSISensor(LiquidCheckBaseSensor):
         self._attr_name = f"{entry.data['name']} WiFi RSSI"
         self._attr_unique_id = f"{entry.entry_id}_wifi_rssi"
 
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("rssi")
-        return None
-
 
 class LiquidCheckPumpTotalRunsSensor(LiquidCheckBaseSensor):
     """Representation of Liquid Check Pump Total Runs Sensor."""
 
     _attr_state_class = SensorStateClass.TOTAL_INCREASING
     _attr_entity_registry_enabled_default = False
+    _key = "totalRuns"
 
     def __init__(
         self, coordinator: LiquidCheckDataUpdateCoordinator, entry: ConfigEntry
@@ -241,13 +267,6 @@ class LiquidCheckPumpTotalRunsSensor(LiquidCheckBaseSensor):
         self._attr_name = f"{entry.data['name']} Pump Total Runs"
         self._attr_unique_id = f"{entry.entry_id}_pump_total_runs"
 
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("totalRuns")
-        return None
-
 
 class LiquidCheckPumpTotalRuntimeSensor(LiquidCheckBaseSensor):
     """Representation of Liquid Check Pump Total Runtime Sensor."""
@@ -256,6 +275,7 @@ class LiquidCheckPumpTotalRuntimeSensor(LiquidCheckBaseSensor):
     _attr_state_class = SensorStateClass.TOTAL_INCREASING
     _attr_native_unit_of_measurement = UnitOfTime.SECONDS
     _attr_entity_registry_enabled_default = False
+    _key = "totalRuntime"
 
     def __init__(
         self, coordinator: LiquidCheckDataUpdateCoordinator, entry: ConfigEntry
@@ -265,42 +285,93 @@ class LiquidCheckPumpTotalRuntimeSensor(LiquidCheckBaseSensor):
         self._attr_name = f"{entry.data['name']} Pump Total Runtime"
         self._attr_unique_id = f"{entry.entry_id}_pump_total_runtime"
 
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("totalRuntime")
-        return None
 
+class LiquidCheckPumpEnergySensor(LiquidCheckBaseSensor, RestoreSensor):
+    """Representation of the energy used by the connected pump.
 
-class LiquidCheckUptimeSensor(LiquidCheckBaseSensor):
-    """Representation of Liquid Check Uptime Sensor."""
+    The total is advanced by the pump runtime since the previous update times
+    the configured power rating, and restored after a restart.
+    """
 
-    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_device_class = SensorDeviceClass.ENERGY
     _attr_state_class = SensorStateClass.TOTAL_INCREASING
-    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
-    _attr_entity_registry_enabled_default = False
+    _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
+    _attr_suggested_display_precision = 3
+    _key = "totalRuntime"
 
     def __init__(
         self, coordinator: LiquidCheckDataUpdateCoordinator, entry: ConfigEntry
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry)
-        self._attr_name = f"{entry.data['name']} Uptime"
-        self._attr_unique_id = f"{entry.entry_id}_uptime"
+        self._attr_name = f"{entry.data['name']} Pump Energy"
+        self._attr_unique_id = f"{entry.entry_id}_pump_energy"
+        self._power = entry.options[CONF_PUMP_POWER]
+        self._energy = 0.0
+        self._runtime: float | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Restore the energy total and the runtime it was counted up to."""
+        await super().async_added_to_hass()
+        if (last_data := await self.async_get_last_sensor_data()) and isinstance(
+            last_data.native_value, (int, float)
+        ):
+            self._energy = float(last_data.native_value)
+        if last_state := await self.async_get_last_state():
+            self._runtime = last_state.attributes.get("pump_runtime")
+        self._update_energy()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Add the energy of the runtime since the last update."""
+        self._update_energy()
+        super()._handle_coordinator_update()
+
+    def _update_energy(self) -> None:
+        """Advance the energy total by the new pump runtime."""
+        runtime = (self.coordinator.data or {}).get(self._key)
+        if runtime is None:
+            return
+
+        if self._runtime is not None:
+            # The counter restarts at zero when the device is reset
+            delta = runtime - self._runtime if runtime >= self._runtime else runtime
+            self._energy += delta * self._power / 3_600_000
+        self._runtime = runtime
 
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("uptime")
-        return None
+        return round(self._energy, 6)
+
+    @property
+    def extra_state_attributes(self):
+        """Return the pump runtime the total was counted up to."""
+        return {"pump_runtime": self._runtime}
+
+
+class LiquidCheckBootedAtSensor(LiquidCheckBaseSensor):
+    """Representation of Liquid Check Booted At Sensor."""
+
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_entity_registry_enabled_default = False
+    _key = "booted_at"
+    _field = "uptime"
+
+    def __init__(
+        self, coordinator: LiquidCheckDataUpdateCoordinator, entry: ConfigEntry
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry)
+        self._attr_name = f"{entry.data['name']} Booted At"
+        self._attr_unique_id = f"{entry.entry_id}_booted_at"
 
 
 class LiquidCheckErrorSensor(LiquidCheckBaseSensor):
     """Representation of Liquid Check Error Sensor."""
 
     _attr_entity_registry_enabled_default = False
+    _key = "error"
 
     def __init__(
         self, coordinator: LiquidCheckDataUpdateCoordinator, entry: ConfigEntry
@@ -310,18 +381,12 @@ class LiquidCheckErrorSensor(LiquidCheckBaseSensor):
         self._attr_name = f"{entry.data['name']} Error"
         self._attr_unique_id = f"{entry.entry_id}_error"
 
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("error")
-        return None
-
 
 class LiquidCheckFirmwareSensor(LiquidCheckBaseSensor):
     """Representation of Liquid Check Firmware Sensor."""
 
     _attr_entity_registry_enabled_default = False
+    _key = "firmware"
 
     def __init__(
         self, coordinator: LiquidCheckDataUpdateCoordinator, entry: ConfigEntry
@@ -331,33 +396,105 @@ class LiquidCheckFirmwareSensor(LiquidCheckBaseSensor):
         self._attr_name = f"{entry.data['name']} Firmware"
         self._attr_unique_id = f"{entry.entry_id}_firmware"
 
+
+class LiquidCheckLastMeasuredSensor(LiquidCheckBaseSensor):
+    """Representation of Liquid Check Last Measured Sensor."""
+
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_entity_registry_enabled_default = False
+    _key = "measured_at"
+    _field = "age"
+
+    def __init__(
+        self, coordinator: LiquidCheckDataUpdateCoordinator, entry: ConfigEntry
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry)
+        self._attr_name = f"{entry.data['name']} Last Measured"
+        self._attr_unique_id = f"{entry.entry_id}_last_measured"
+
+
+class LiquidCheckAggregateBaseSensor(CoordinatorEntity, SensorEntity):
+    """Base class for sensors of an aggregate of several tanks."""
+
+    def __init__(
+        self, coordinator: LiquidCheckAggregateCoordinator, entry: ConfigEntry
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._entry = entry
+        self._attr_device_info = DeviceInfo(
+            identifiers={("liquid_check", entry.entry_id)},
+            name=entry.data["name"],
+            manufacturer="SI-Elektronik GmbH",
+            model="Liquid-Check aggregate",
+            entry_type=DeviceEntryType.SERVICE,
+        )
+
+
+class LiquidCheckAggregateContentSensor(LiquidCheckAggregateBaseSensor):
+    """Representation of the combined content of several tanks."""
+
+    _attr_device_class = SensorDeviceClass.VOLUME
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfVolume.LITERS
+
+    def __init__(
+        self, coordinator: LiquidCheckAggregateCoordinator, entry: ConfigEntry
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry)
+        self._attr_name = f"{entry.data['name']} Content"
+        self._attr_unique_id = f"{entry.entry_id}_content"
+
     @property
     def native_value(self):
         """Return the state of the sensor."""
         if self.coordinator.data:
-            return self.coordinator.data.get("firmware")
+            return self.coordinator.data.get("content")
         return None
 
 
-class LiquidCheckMeasurementAgeSensor(LiquidCheckBaseSensor):
-    """Representation of Liquid Check Measurement Age Sensor."""
+class LiquidCheckAggregatePercentSensor(LiquidCheckAggregateBaseSensor):
+    """Representation of the capacity weighted fill level of several tanks."""
 
-    _attr_device_class = SensorDeviceClass.DURATION
     _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
-    _attr_entity_registry_enabled_default = False
+    _attr_native_unit_of_measurement = PERCENTAGE
 
     def __init__(
-        self, coordinator: LiquidCheckDataUpdateCoordinator, entry: ConfigEntry
+        self, coordinator: LiquidCheckAggregateCoordinator, entry: ConfigEntry
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry)
+        self._attr_name = f"{entry.data['name']} Percent"
+        self._attr_unique_id = f"{entry.entry_id}_percent"
+
+    @property
+    def native_value(self):
+        """Return the state of the sensor."""
+        if self.coordinator.data:
+            return self.coordinator.data.get("percent")
+        return None
+
+
+class LiquidCheckAggregateFlowSensor(LiquidCheckAggregateBaseSensor):
+    """Representation of the combined flow into or out of several tanks."""
+
+    _attr_device_class = SensorDeviceClass.VOLUME_FLOW_RATE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfVolumeFlowRate.LITERS_PER_MINUTE
+
+    def __init__(
+        self, coordinator: LiquidCheckAggregateCoordinator, entry: ConfigEntry
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry)
-        self._attr_name = f"{entry.data['name']} Measurement Age"
-        self._attr_unique_id = f"{entry.entry_id}_measurement_age"
+        self._attr_name = f"{entry.data['name']} Flow"
+        self._attr_unique_id = f"{entry.entry_id}_flow"
 
     @property
     def native_value(self):
         """Return the state of the sensor."""
         if self.coordinator.data:
-            return self.coordinator.data.get("age")
+            return self.coordinator.data.get("flow")
         return None
@@ -0,0 +1,204 @@
+"""Services for the Liquid Check integration."""
+from __future__ import annotations
+
+import logging
+from datetime import timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import voluptuous as vol
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
+from homeassistant.util import dt as dt_util
+
+from .const import CONF_MEMBERS, DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_START_MEASURE = "start_measure"
+SERVICE_START_MEASURE_SCHEMA = vol.Schema(
+    {
+        vol.Required("device_id"): cv.string,
+    }
+)
+
+SERVICE_RESTART = "restart"
+SERVICE_RESTART_SCHEMA = vol.Schema(
+    {
+        vol.Required("device_id"): cv.string,
+    }
+)
+
+SERVICE_IMPORT_HISTORY = "import_history"
+SERVICE_IMPORT_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Required("device_id"): cv.string,
+        vol.Required("file"): cv.string,
+    }
+)
+
+SERVICE_EXPORT_HISTORY = "export_history"
+SERVICE_EXPORT_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Required("device_id"): cv.string,
+        vol.Required("file"): cv.string,
+        vol.Required("start"): cv.datetime,
+        vol.Optional("end"): cv.datetime,
+        vol.Optional("interval"): vol.All(
+            cv.time_period, vol.Range(min=timedelta(seconds=1))
+        ),
+    }
+)
+
+
+@callback
+def async_get_device_entry(hass: HomeAssistant, device_id: str) -> ConfigEntry | None:
+    """Return the config entry of a Liquid Check device.
+
+    Accepts a device registry id, or a config entry id as used by earlier
+    versions of the services.
+    """
+    if device := dr.async_get(hass).async_get(device_id):
+        entry_ids = device.config_entries
+    else:
+        entry_ids = {device_id}
+
+    for entry_id in entry_ids:
+        entry = hass.config_entries.async_get_entry(entry_id)
+        if entry and entry.domain == DOMAIN and CONF_MEMBERS not in entry.data:
+            return entry
+    return None
+
+
+def resolve_config_path(hass: HomeAssistant, file: str) -> Path:
+    """Return the absolute path of a file of the history services.
+
+    Relative paths are inside the configuration directory. Raises
+    HomeAssistantError for paths outside of it and of the allowed paths.
+    """
+    path = Path(hass.config.path(file)).resolve()
+    config_dir = Path(hass.config.config_dir).resolve()
+    if not (path.is_relative_to(config_dir) or hass.config.is_allowed_path(str(path))):
+        raise HomeAssistantError(f"Access to {path} is not allowed")
+    return path
+
+
+async def async_send_device_command(
+    hass: HomeAssistant, device_id: str, command_name: str, action: str
+) -> None:
+    """Send a command to a Liquid Check device."""
+    config_entry = async_get_device_entry(hass, device_id)
+    if config_entry is None:
+        _LOGGER.error("Device with ID %s not found", device_id)
+        return
+
+    coordinator = hass.data.get(DOMAIN, {}).get(config_entry.entry_id)
+    if coordinator is not None:
+        client = coordinator.client
+    else:
+        from .client import LiquidCheckClient
+
+        client = LiquidCheckClient(config_entry.data["host"])
+
+    try:
+        await client.send_command(command_name)
+        _LOGGER.info("%s on device %s", action, config_entry.data["host"])
+    except Exception as err:
+        _LOGGER.error("Error %s on device: %s", action.lower(), err)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Liquid Check services once for the domain."""
+
+    async def handle_start_measure(call: ServiceCall) -> None:
+        """Handle the start_measure service call."""
+        await async_send_device_command(
+            hass, call.data["device_id"], "StartMeasure", "Measurement started"
+        )
+
+    async def handle_restart(call: ServiceCall) -> None:
+        """Handle the restart service call."""
+        await async_send_device_command(
+            hass, call.data["device_id"], "Restart", "Device restarting"
+        )
+
+    async def handle_import_history(call: ServiceCall) -> None:
+        """Handle the import_history service call."""
+        config_entry = async_get_device_entry(hass, call.data["device_id"])
+        if config_entry is None:
+            raise HomeAssistantError(f"Device {call.data['device_id']} not found")
+        if "recorder" not in hass.config.components:
+            raise HomeAssistantError("The recorder is not set up")
+
+        path = await hass.async_add_executor_job(
+            resolve_config_path, hass, call.data["file"]
+        )
+
+        # The recorder modules are only needed by this rarely used service
+        from .backfill import async_import_history_file
+
+        try:
+            await async_import_history_file(hass, config_entry, path)
+        except (OSError, KeyError, TypeError, ValueError) as err:
+            raise HomeAssistantError(f"Error importing {path}: {err}") from err
+
+    async def handle_export_history(call: ServiceCall) -> None:
+        """Handle the export_history service call."""
+        config_entry = async_get_device_entry(hass, call.data["device_id"])
+        if config_entry is None:
+            raise HomeAssistantError(f"Device {call.data['device_id']} not found")
+        if "recorder" not in hass.config.components:
+            raise HomeAssistantError("The recorder is not set up")
+
+        path = await hass.async_add_executor_job(
+            resolve_config_path, hass, call.data["file"]
+        )
+        if await hass.async_add_executor_job(path.exists):
+            raise HomeAssistantError(f"{path} already exists")
+
+        start = dt_util.as_utc(call.data["start"]).replace(microsecond=0)
+        end = dt_util.as_utc(call.data.get("end") or dt_util.utcnow())
+
+        # The recorder modules are only needed by this rarely used service
+        from .export import async_export_history
+
+        try:
+            await async_export_history(
+                hass, config_entry, path, start, end, call.data.get("interval")
+            )
+        except (OSError, ValueError) as err:
+            raise HomeAssistantError(f"Error exporting {path}: {err}") from err
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_START_MEASURE,
+        handle_start_measure,
+        schema=SERVICE_START_MEASURE_SCHEMA,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RESTART,
+        handle_restart,
+        schema=SERVICE_RESTART_SCHEMA,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_IMPORT_HISTORY,
+        handle_import_history,
+        schema=SERVICE_IMPORT_HISTORY_SCHEMA,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EXPORT_HISTORY,
+        handle_export_history,
+        schema=SERVICE_EXPORT_HISTORY_SCHEMA,
+    )
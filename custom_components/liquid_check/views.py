@@ -0,0 +1,212 @@
+"""HTTP views of the Liquid Check integration."""
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Callable
+from http import HTTPStatus
+from typing import Any
+
+from aiohttp import hdrs, web
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.http import KEY_HASS
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .coordinator import LiquidCheckDataUpdateCoordinator
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# entry_id -> (body, etag) of the infos view, hashed once per new body
+DATA_INFOS_ETAGS = f"{DOMAIN}_infos_etags"
+
+ValueFn = Callable[[LiquidCheckDataUpdateCoordinator], Any]
+
+# (family, type, unit, help, sample suffix, value of a coordinator)
+METRICS: tuple[tuple[str, str, str, str, str, ValueFn], ...] = (
+    (
+        "liquid_check_level_meters",
+        "gauge",
+        "meters",
+        "Liquid level",
+        "",
+        lambda coordinator: coordinator.data.get("level"),
+    ),
+    (
+        "liquid_check_content_liters",
+        "gauge",
+        "liters",
+        "Liquid volume",
+        "",
+        lambda coordinator: coordinator.data.get("content"),
+    ),
+    (
+        "liquid_check_percent",
+        "gauge",
+        "",
+        "Fill level in percent",
+        "",
+        lambda coordinator: coordinator.data.get("percent"),
+    ),
+    (
+        "liquid_check_pump_runs",
+        "counter",
+        "",
+        "Runs of the connected pump",
+        "_total",
+        lambda coordinator: coordinator.payload_value("totalRuns"),
+    ),
+    (
+        "liquid_check_pump_runtime_seconds",
+        "counter",
+        "seconds",
+        "Runtime of the connected pump",
+        "_total",
+        lambda coordinator: coordinator.payload_value("totalRuntime"),
+    ),
+    (
+        "liquid_check_up",
+        "gauge",
+        "",
+        "Whether the last poll succeeded",
+        "",
+        lambda coordinator: int(coordinator.last_update_success),
+    ),
+    (
+        "liquid_check_poll_duration_seconds",
+        "gauge",
+        "seconds",
+        "Duration of the last successful poll",
+        "",
+        lambda coordinator: coordinator.poll_duration,
+    ),
+    (
+        "liquid_check_polls",
+        "counter",
+        "",
+        "Polls of the device",
+        "_total",
+        lambda coordinator: coordinator.poll_count,
+    ),
+    (
+        "liquid_check_poll_errors",
+        "counter",
+        "",
+        "Failed polls of the device",
+        "_total",
+        lambda coordinator: coordinator.error_count,
+    ),
+    (
+        "liquid_check_hedged_requests",
+        "counter",
+        "",
+        "Polls sent a second time because the first was slow",
+        "_total",
+        lambda coordinator: coordinator.client.hedge_count,
+    ),
+)
+
+
+@callback
+def async_register_views(hass: HomeAssistant) -> None:
+    """Register the Liquid Check HTTP views if the web server is set up."""
+    if hass.http is not None:
+        hass.http.register_view(LiquidCheckMetricsView())
+        hass.http.register_view(LiquidCheckInfosView())
+
+
+@callback
+def async_forget_infos(hass: HomeAssistant, entry_id: str) -> None:
+    """Drop the cached ETag of an unloaded device."""
+    hass.data.get(DATA_INFOS_ETAGS, {}).pop(entry_id, None)
+
+
+@callback
+def async_render_metrics(hass: HomeAssistant) -> str:
+    """Return the OpenMetrics page of all loaded devices."""
+    coordinators = [
+        coordinator
+        for coordinator in hass.data.get(DOMAIN, {}).values()
+        if isinstance(coordinator, LiquidCheckDataUpdateCoordinator)
+        and coordinator.data is not None
+    ]
+
+    lines = []
+    for family, metric_type, unit, description, suffix, value_fn in METRICS:
+        lines.append(f"# TYPE {family} {metric_type}")
+        if unit:
+            lines.append(f"# UNIT {family} {unit}")
+        lines.append(f"# HELP {family} {description}.")
+        for coordinator in coordinators:
+            if (value := value_fn(coordinator)) is not None:
+                lines.append(
+                    f"{family}{suffix}{{{coordinator.metric_labels}}} {value}"
+                )
+    lines.append("# EOF\n")
+    return "\n".join(lines)
+
+
+class LiquidCheckMetricsView(HomeAssistantView):
+    """Serve the cached device data in the OpenMetrics text format."""
+
+    url = "/api/liquid_check/metrics"
+    name = "api:liquid_check:metrics"
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Render the metrics without polling the devices."""
+        return web.Response(
+            body=async_render_metrics(request.app[KEY_HASS]).encode(),
+            headers={"Content-Type": OPENMETRICS_CONTENT_TYPE},
+        )
+
+
+class LiquidCheckInfosView(HomeAssistantView):
+    """Serve the last response of a device to other readers.
+
+    The body is passed through unchanged. Clients can revalidate with the
+    ETag and may cache the response until the next poll is due.
+    """
+
+    url = "/api/liquid_check/{entry_id}/infos.json"
+    name = "api:liquid_check:infos"
+
+    async def get(self, request: web.Request, entry_id: str) -> web.Response:
+        """Return the cached infos.json of a device."""
+        hass = request.app[KEY_HASS]
+        coordinator = hass.data.get(DOMAIN, {}).get(entry_id)
+        if not isinstance(coordinator, LiquidCheckDataUpdateCoordinator) or (
+            (body := coordinator.client.last_body) is None
+            or coordinator.fetched_at is None
+        ):
+            return self.json_message("Device not found", HTTPStatus.NOT_FOUND)
+
+        etags: dict[str, tuple[bytes, str]] = hass.data.setdefault(
+            DATA_INFOS_ETAGS, {}
+        )
+        cached = etags.get(entry_id)
+        if cached is not None and cached[0] is body:
+            etag = cached[1]
+        else:
+            etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+            etags[entry_id] = (body, etag)
+
+        headers = {
+            hdrs.ETAG: f'"{etag}"',
+            hdrs.LAST_MODIFIED: dt_util.utc_from_timestamp(
+                coordinator.fetched_at
+            ).strftime("%a, %d %b %Y %H:%M:%S GMT"),
+            hdrs.CACHE_CONTROL: _cache_control(coordinator),
+        }
+        if any(match.value in (etag, "*") for match in request.if_none_match or ()):
+            return web.Response(status=HTTPStatus.NOT_MODIFIED, headers=headers)
+        return web.Response(body=body, content_type="application/json", headers=headers)
+
+
+def _cache_control(coordinator: LiquidCheckDataUpdateCoordinator) -> str:
+    """Return the Cache-Control header, fresh until the next poll is due."""
+    if coordinator.update_interval is None or coordinator.fetched_at is None:
+        return "private, no-cache"
+
+    age = dt_util.utcnow().timestamp() - coordinator.fetched_at
+    remaining = coordinator.update_interval.total_seconds() - age
+    return f"private, max-age={max(0, int(remaining))}"
@@ -0,0 +1,100 @@
+"""WebSocket API for the Liquid Check integration."""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+import voluptuous as vol
+from homeassistant.components import websocket_api
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.event import async_call_later
+
+from .const import DOMAIN, SIGNAL_DATA_UPDATED
+from .coordinator import LiquidCheckDataUpdateCoordinator
+
+# Fields included in the snapshots
+SNAPSHOT_FIELDS = ("level", "content", "percent", "flow")
+# Seconds to collect device updates into one message, the coordinators of a
+# poll cycle finish within this window
+BATCH_INTERVAL = 1.0
+
+
+@callback
+def async_setup_websocket_api(hass: HomeAssistant) -> None:
+    """Register the Liquid Check WebSocket commands."""
+    websocket_api.async_register_command(hass, websocket_subscribe)
+
+
+@callback
+def _async_snapshot(hass: HomeAssistant, entry_ids) -> dict[str, dict[str, Any]]:
+    """Return the snapshot fields of the loaded devices among entry_ids."""
+    coordinators = hass.data.get(DOMAIN, {})
+    snapshot = {}
+    for entry_id in entry_ids:
+        coordinator = coordinators.get(entry_id)
+        if isinstance(coordinator, LiquidCheckDataUpdateCoordinator) and (
+            data := coordinator.data
+        ):
+            snapshot[entry_id] = {key: data.get(key) for key in SNAPSHOT_FIELDS}
+    return snapshot
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/subscribe",
+        vol.Optional("entry_ids"): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+@callback
+def websocket_subscribe(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Subscribe to batched snapshots of all or selected devices.
+
+    The first event holds every selected device, later events only the
+    devices updated since the previous one.
+    """
+    selected = set(msg["entry_ids"]) if "entry_ids" in msg else None
+    pending: set[str] = set()
+    unsub_flush: CALLBACK_TYPE | None = None
+
+    @callback
+    def _async_flush(_now: datetime) -> None:
+        nonlocal unsub_flush
+        unsub_flush = None
+        if snapshot := _async_snapshot(hass, pending):
+            connection.send_message(
+                websocket_api.event_message(msg["id"], {"entries": snapshot})
+            )
+        pending.clear()
+
+    @callback
+    def _async_updated(entry_id: str) -> None:
+        nonlocal unsub_flush
+        if selected is not None and entry_id not in selected:
+            return
+        pending.add(entry_id)
+        if unsub_flush is None:
+            unsub_flush = async_call_later(hass, BATCH_INTERVAL, _async_flush)
+
+    unsub_updates = async_dispatcher_connect(hass, SIGNAL_DATA_UPDATED, _async_updated)
+
+    @callback
+    def _async_unsubscribe() -> None:
+        unsub_updates()
+        if unsub_flush is not None:
+            unsub_flush()
+
+    connection.subscriptions[msg["id"]] = _async_unsubscribe
+    connection.send_result(msg["id"])
+
+    entry_ids = selected if selected is not None else hass.data.get(DOMAIN, {})
+    connection.send_message(
+        websocket_api.event_message(
+            msg["id"], {"entries": _async_snapshot(hass, entry_ids)}
+        )
+    )
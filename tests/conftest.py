@@ -1,14 +1,22 @@
 """Common fixtures for Liquid Check tests."""
-from collections.abc import Generator
+import json
+from collections.abc import Awaitable, Callable, Generator
+from pathlib import Path
+from typing import Any
 from unittest.mock import AsyncMock, patch
 
 import pytest
+from homeassistant.core import HomeAssistant
 
 # Must be before other imports for pytest plugin to work
 pytest_plugins = "pytest_homeassistant_custom_component"  # noqa: E402
 
 from pytest_homeassistant_custom_component.common import MockConfigEntry  # noqa: E402
 
+from custom_components.liquid_check.client import LiquidCheckClient  # noqa: E402
+
+FIXTURE = Path(__file__).parent / "fixtures" / "api_response.json"
+
 
 @pytest.fixture(autouse=True)
 def auto_enable_custom_integrations(enable_custom_integrations):
@@ -36,26 +44,41 @@ def mock_setup_entry() -> Generator:
 
 
 @pytest.fixture
-def mock_aiohttp_session():
-    """Mock aiohttp ClientSession with successful response."""
-
-    def _create_mock(response_data, status=200):
-        mock_response = AsyncMock()
-        mock_response.status = status
-        mock_response.json = AsyncMock(return_value=response_data)
-
-        mock_get = AsyncMock()
-        mock_get.__aenter__.return_value = mock_response
-        mock_get.__aexit__.return_value = None
-
-        mock_session_instance = AsyncMock()
-        mock_session_instance.get.return_value = mock_get
-        mock_session_instance.__aenter__.return_value = mock_session_instance
-        mock_session_instance.__aexit__.return_value = None
-
-        return patch(
-            "custom_components.liquid_check.sensor.aiohttp.ClientSession",
-            return_value=mock_session_instance,
+def api_response() -> dict[str, Any]:
+    """Return the infos.json response of the test device."""
+    return json.loads(FIXTURE.read_text())
+
+
+@pytest.fixture
+def mock_get_info(api_response: dict[str, Any]) -> Generator[AsyncMock]:
+    """Patch the client to return the test response."""
+    with patch.object(
+        LiquidCheckClient, "get_info", AsyncMock(return_value=api_response)
+    ) as get_info:
+        yield get_info
+
+
+@pytest.fixture
+def setup_integration(
+    hass: HomeAssistant, mock_get_info: AsyncMock
+) -> Callable[..., Awaitable[MockConfigEntry]]:
+    """Return a function setting up a tank entry polling the mocked client."""
+
+    async def _setup(
+        entry_id: str = "tank",
+        name: str = "Tank",
+        options: dict[str, Any] | None = None,
+        **data: Any,
+    ) -> MockConfigEntry:
+        entry = MockConfigEntry(
+            domain="liquid_check",
+            data={"name": name, "host": "192.168.1.100", "scan_interval": 60, **data},
+            options=options or {},
+            entry_id=entry_id,
         )
+        entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        return entry
 
-    return _create_mock
+    return _setup
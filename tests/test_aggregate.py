@@ -0,0 +1,137 @@
+"""Test the Liquid Check tank aggregate."""
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.liquid_check.aggregate import LiquidCheckAggregateCoordinator
+from custom_components.liquid_check.coordinator import (
+    LiquidCheckDataUpdateCoordinator,
+)
+
+
+def _mock_member(content, percent, flow=None):
+    """Return a member coordinator mock remembering its listener."""
+    member = MagicMock()
+    member.data = {"content": content, "percent": percent, "flow": flow}
+    member.capacity = content / percent * 100 if percent else None
+    member.listeners = []
+    member.async_add_listener = lambda listener: member.listeners.append(listener)
+    return member
+
+
+async def test_aggregate_combines_members(hass: HomeAssistant):
+    """Test content, weighted percent and flow are combined."""
+    tank_a = _mock_member(500, 50, 1.5)
+    tank_b = _mock_member(300, 10, -0.5)
+
+    aggregate = LiquidCheckAggregateCoordinator(hass, {"a": tank_a, "b": tank_b})
+    aggregate.async_start()
+
+    assert aggregate.data["content"] == 800
+    # 800 L of 1000 L + 3000 L capacity
+    assert aggregate.data["percent"] == 20
+    assert aggregate.data["flow"] == 1.0
+    assert aggregate.data["members"] == 2
+
+
+async def test_aggregate_batches_updates(hass: HomeAssistant):
+    """Test member updates in the same tick are published once."""
+    tank_a = _mock_member(500, 50)
+    tank_b = _mock_member(300, 10)
+
+    aggregate = LiquidCheckAggregateCoordinator(hass, {"a": tank_a, "b": tank_b})
+    aggregate.async_start()
+
+    updates = []
+    aggregate.async_add_listener(lambda: updates.append(aggregate.data))
+
+    tank_a.data = {"content": 400, "percent": 40, "flow": None}
+    tank_a.listeners[0]()
+    tank_b.data = {"content": 600, "percent": 20, "flow": None}
+    tank_b.listeners[0]()
+    await hass.async_block_till_done()
+
+    assert len(updates) == 1
+    assert updates[0]["content"] == 1000
+
+
+async def test_aggregate_ignores_unchanged_members(hass: HomeAssistant):
+    """Test an update without changes does not publish new data."""
+    tank_a = _mock_member(500, 50)
+
+    aggregate = LiquidCheckAggregateCoordinator(hass, {"a": tank_a})
+    aggregate.async_start()
+
+    updates = []
+    aggregate.async_add_listener(lambda: updates.append(aggregate.data))
+
+    tank_a.listeners[0]()
+    await hass.async_block_till_done()
+
+    assert updates == []
+
+
+async def test_aggregate_capacity_is_stable(hass: HomeAssistant):
+    """Test the percent follows the content, not the rounded member percent."""
+    tank_a = _mock_member(500, 50)
+    tank_b = _mock_member(300, 10)
+
+    aggregate = LiquidCheckAggregateCoordinator(hass, {"a": tank_a, "b": tank_b})
+    aggregate.async_start()
+
+    # 299.6 L would be 9.99 %, the device reports a rounded 10.0 %
+    tank_b.data = {"content": 299.6, "percent": 10.0, "flow": None}
+    tank_b.listeners[0]()
+    await hass.async_block_till_done()
+    assert aggregate.data["percent"] == 20.0
+    assert aggregate.data["content"] == 799.6
+
+
+async def test_aggregate_percent_waits_for_capacities(hass: HomeAssistant):
+    """Test the percent is unknown while a member's capacity is unknown."""
+    tank_a = _mock_member(500, 50)
+    tank_b = _mock_member(3000, None)
+
+    aggregate = LiquidCheckAggregateCoordinator(hass, {"a": tank_a, "b": tank_b})
+    aggregate.async_start()
+    assert aggregate.data["content"] == 3500
+    assert aggregate.data["percent"] is None
+
+    tank_b.capacity = 6000
+    tank_b.listeners[0]()
+    await hass.async_block_till_done()
+    assert aggregate.data["percent"] == 50.0
+
+
+async def test_coordinator_capacity():
+    """Test the capacity is learned once or taken from the tank geometry."""
+    hass = HomeAssistant("/test")
+    entry = MagicMock()
+    entry.data = {"name": "Test", "host": "192.168.1.100", "scan_interval": 60}
+    entry.options = {}
+
+    coordinator = LiquidCheckDataUpdateCoordinator(hass, entry)
+    assert coordinator.capacity is None
+    measure = {"level": 0.0, "content": 0, "percent": 0, "age": 20}
+    measure["raw"] = {"content": 0.0, "percent": 0.0}
+    response = {"payload": {"measure": measure}}
+    coordinator._client.get_info = AsyncMock(return_value=response)
+    await coordinator._async_update_data()
+    assert coordinator.capacity is None
+
+    measure["raw"] = {"content": 959.914795, "percent": 8.726499}
+    await coordinator._async_update_data()
+    assert coordinator.capacity == pytest.approx(11000, abs=0.01)
+
+    measure["raw"] = {"content": 1000.0, "percent": 9.0}
+    await coordinator._async_update_data()
+    assert coordinator.capacity == pytest.approx(11000, abs=0.01)
+
+    entry.options = {
+        "tank_shape": "vertical_cylinder",
+        "tank_diameter": 1.0,
+        "tank_height": 2.0,
+    }
+    coordinator = LiquidCheckDataUpdateCoordinator(hass, entry)
+    assert coordinator.capacity == pytest.approx(1570.8, abs=0.1)
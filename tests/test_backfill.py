@@ -0,0 +1,125 @@
+"""Test the Liquid Check history backfill."""
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.liquid_check.backfill import (
+    aggregate_readings,
+    async_import_history_file,
+    read_history_file,
+)
+from custom_components.liquid_check.services import async_setup_services
+
+
+def test_aggregate_readings_hourly():
+    """Test readings are reduced to one row per hour and quantity."""
+    readings = [
+        (datetime(2024, 5, 1, 10, 5, tzinfo=UTC), {"level": 1.0, "content": 900}),
+        (datetime(2024, 5, 1, 10, 35, tzinfo=UTC), {"level": 1.2, "content": 1100}),
+        (datetime(2024, 5, 1, 11, 0, tzinfo=UTC), {"level": 1.1}),
+    ]
+
+    statistics = aggregate_readings(readings)
+
+    assert set(statistics) == {"level", "content"}
+    assert len(statistics["level"]) == 2
+    first = statistics["level"][0]
+    assert first["start"] == datetime(2024, 5, 1, 10, tzinfo=UTC)
+    assert first["mean"] == 1.1
+    assert first["min"] == 1.0
+    assert first["max"] == 1.2
+    assert statistics["content"][0]["mean"] == 1000
+
+
+def test_read_history_file_formats(tmp_path):
+    """Test CSV and JSON lines files are read."""
+    csv_file = tmp_path / "history.csv"
+    csv_file.write_text(
+        "timestamp,level,content,percent\n"
+        "2024-05-01T10:00:00+00:00,0.5,400,20\n"
+        "1714561200,0.6,,\n"
+    )
+    jsonl_file = tmp_path / "history.jsonl"
+    jsonl_file.write_text('{"timestamp": "2024-05-01T10:00:00Z", "percent": 21}\n')
+
+    rows = list(read_history_file(csv_file))
+    assert rows[0] == (
+        datetime(2024, 5, 1, 10, tzinfo=UTC),
+        {"level": 0.5, "content": 400, "percent": 20},
+    )
+    assert rows[1] == (datetime(2024, 5, 1, 11, tzinfo=UTC), {"level": 0.6})
+
+    assert list(read_history_file(jsonl_file)) == [
+        (datetime(2024, 5, 1, 10, tzinfo=UTC), {"percent": 21})
+    ]
+
+
+async def test_import_history_file_batches(hass: HomeAssistant, tmp_path):
+    """Test one statistics import is queued per quantity."""
+    entry = MockConfigEntry(
+        domain="liquid_check",
+        data={"name": "Test", "host": "192.168.1.100"},
+        entry_id="test123",
+    )
+    history = tmp_path / "history.csv"
+    history.write_text(
+        "timestamp,level,content\n"
+        + "".join(f"{1714550400 + minute * 60},1.0,900\n" for minute in range(180))
+    )
+
+    with patch(
+        "custom_components.liquid_check.backfill.async_add_external_statistics"
+    ) as mock_add:
+        hours = await async_import_history_file(hass, entry, history)
+
+    assert hours == 3
+    assert mock_add.call_count == 2
+    metadata, rows = mock_add.call_args_list[0][0][1:]
+    assert metadata["statistic_id"] == "liquid_check:test123_level"
+    assert metadata["source"] == "liquid_check"
+    assert len(rows) == 3
+
+
+async def test_import_history_service(hass: HomeAssistant, tmp_path):
+    """Test files in the configuration directory are imported."""
+    hass.config.config_dir = str(tmp_path)
+    hass.config.components.add("recorder")
+    entry = MockConfigEntry(
+        domain="liquid_check",
+        data={"name": "Test", "host": "192.168.1.100"},
+        entry_id="test123",
+    )
+    entry.add_to_hass(hass)
+    async_setup_services(hass)
+    (tmp_path / "liquid_check").mkdir()
+    (tmp_path / "liquid_check" / "history.csv").write_text(
+        "timestamp,level\n1714550400,1.0\n"
+    )
+    (tmp_path / "liquid_check" / "null.jsonl").write_text(
+        '{"timestamp": null, "level": 1.0}\n'
+    )
+
+    with patch(
+        "custom_components.liquid_check.backfill.async_add_external_statistics"
+    ) as mock_add:
+        await hass.services.async_call(
+            "liquid_check",
+            "import_history",
+            {"device_id": "test123", "file": "liquid_check/history.csv"},
+            blocking=True,
+        )
+        assert mock_add.call_count == 1
+
+        for file in ("liquid_check/null.jsonl", "/etc/hosts"):
+            with pytest.raises(HomeAssistantError):
+                await hass.services.async_call(
+                    "liquid_check",
+                    "import_history",
+                    {"device_id": "test123", "file": file},
+                    blocking=True,
+                )
+    assert mock_add.call_count == 1
@@ -0,0 +1,188 @@
+"""Test the Liquid Check client."""
+import json
+import logging
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.liquid_check import client as client_module
+from custom_components.liquid_check.client import LiquidCheckClient
+
+
+def _mock_session(response=None, error=None):
+    """Return a ClientSession mock answering GET requests."""
+    mock_session = MagicMock()
+    if error is not None:
+        mock_session.get = MagicMock(side_effect=error)
+    else:
+        mock_response = MagicMock()
+        mock_response.read = AsyncMock(return_value=json.dumps(response).encode())
+        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_response.__aexit__ = AsyncMock(return_value=None)
+        mock_session.get = MagicMock(return_value=mock_response)
+    mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+    mock_session.__aexit__ = AsyncMock(return_value=None)
+    return mock_session
+
+
+async def test_offline_device_logs_once(caplog):
+    """Test repeated failures are logged once with a recovery message."""
+    client = LiquidCheckClient("192.168.1.100")
+    caplog.set_level(logging.INFO)
+
+    with patch(
+        "custom_components.liquid_check.client.aiohttp.ClientSession",
+        return_value=_mock_session(error=OSError("unreachable")),
+    ):
+        for _ in range(5):
+            with pytest.raises(OSError):
+                await client.get_info()
+
+    offline = [r for r in caplog.records if "went offline" in r.message]
+    assert len(offline) == 1
+    assert offline[0].levelno == logging.WARNING
+
+    with patch(
+        "custom_components.liquid_check.client.aiohttp.ClientSession",
+        return_value=_mock_session(response={"payload": {}}),
+    ):
+        assert await client.get_info() == {"payload": {}}
+    assert client.last_body == b'{"payload": {}}'
+
+    assert "back online after 5 failed requests" in caplog.text
+
+
+async def test_offline_device_periodic_summary(caplog):
+    """Test a summary is logged when a device stays offline."""
+    client = LiquidCheckClient("192.168.1.100")
+
+    with patch(
+        "custom_components.liquid_check.client.aiohttp.ClientSession",
+        return_value=_mock_session(error=OSError("unreachable")),
+    ):
+        with pytest.raises(OSError):
+            await client.get_info()
+        client._last_summary -= client_module.OFFLINE_SUMMARY_INTERVAL
+        with pytest.raises(OSError):
+            await client.get_info()
+
+    assert "still offline, 2 failed requests" in caplog.text
+
+
+async def test_hostname_resolved_once():
+    """Test the resolved address is cached and refreshed in the background."""
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    tasks = []
+
+    def _create_task(coro, name):
+        tasks.append(name)
+        return loop.create_task(coro)
+
+    client = LiquidCheckClient("liquid-check.local", create_task=_create_task)
+    session = _mock_session(response={"payload": {}})
+    getaddrinfo = AsyncMock(return_value=[(2, 1, 6, "", ("192.168.1.50", 0))])
+
+    with patch(
+        "custom_components.liquid_check.client.aiohttp.ClientSession",
+        return_value=session,
+    ), patch.object(loop, "getaddrinfo", getaddrinfo):
+        await client.get_info()
+        await client.get_info()
+        assert getaddrinfo.await_count == 1
+        assert session.get.call_args[0][0] == "http://192.168.1.50/infos.json"
+
+        # An expired address is still used while resolving in the background
+        client._resolved_at -= client_module.ADDRESS_TTL
+        getaddrinfo.side_effect = OSError("mDNS timeout")
+        await client.get_info()
+        await asyncio.sleep(0)
+        assert getaddrinfo.await_count == 2
+        assert session.get.call_args[0][0] == "http://192.168.1.50/infos.json"
+
+        # A changed address is used once it was resolved in the background
+        client._resolved_at = client._resolved_at - client_module.ADDRESS_TTL
+        getaddrinfo.side_effect = None
+        getaddrinfo.return_value = [(2, 1, 6, "", ("192.168.1.60", 0))]
+        await client.get_info()
+        await asyncio.sleep(0)
+        await client.get_info()
+        assert session.get.call_args[0][0] == "http://192.168.1.60/infos.json"
+        assert getaddrinfo.await_count == 3
+        assert tasks == ["liquid_check resolve liquid-check.local"] * 2
+
+
+async def test_ip_host_not_resolved():
+    """Test an IP address with a port is used as configured."""
+    client = LiquidCheckClient("192.168.1.100:8080")
+    session = _mock_session(response={"payload": {}})
+
+    with patch(
+        "custom_components.liquid_check.client.aiohttp.ClientSession",
+        return_value=session,
+    ):
+        await client.get_info()
+
+    assert session.get.call_args[0][0] == "http://192.168.1.100:8080/infos.json"
+
+
+async def test_hedged_request():
+    """Test a slow poll is sent again within the hedge budget."""
+    import asyncio
+
+    client = LiquidCheckClient("192.168.1.100", hedge=True)
+    client._latencies.extend([0.01] * client_module.MIN_LATENCY_SAMPLES)
+    delays = iter([1.0, 0.0])
+    cancelled = []
+
+    async def _fetch(url, record=True):
+        delay = next(delays)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.append(delay)
+            raise
+        return json.dumps({"payload": {"delay": delay}}).encode()
+
+    with patch.object(client, "_async_fetch", _fetch):
+        assert await client.get_info() == {"payload": {"delay": 0.0}}
+        await asyncio.sleep(0)
+    assert client.hedge_count == 1
+    assert cancelled == [1.0]
+    # Counted from the start of the overtaken request, not the hedge's 0 s
+    assert len(client._latencies) == client_module.MIN_LATENCY_SAMPLES + 1
+    assert client._latencies[-1] >= 0.01
+
+    # The budget is spent, the next slow poll is not hedged
+    client._hedge_tokens = 0
+    delays = iter([0.05])
+    with patch.object(client, "_async_fetch", _fetch):
+        assert await client.get_info() == {"payload": {"delay": 0.05}}
+    assert client.hedge_count == 1
+
+
+async def test_hedged_request_failure():
+    """Test a hedged poll fails only when both requests fail."""
+    import asyncio
+
+    client = LiquidCheckClient("192.168.1.100", hedge=True)
+    client._latencies.extend([0.01] * client_module.MIN_LATENCY_SAMPLES)
+    delays = iter([0.05, 0.0])
+
+    async def _fetch(url, record=True):
+        await asyncio.sleep(next(delays))
+        raise OSError("unreachable")
+
+    with patch.object(client, "_async_fetch", _fetch), pytest.raises(OSError):
+        await client.get_info()
+    assert client.hedge_count == 1
+
+    # Without enough samples the first poll is never hedged
+    client = LiquidCheckClient("192.168.1.100", hedge=True)
+    with patch(
+        "custom_components.liquid_check.client.aiohttp.ClientSession",
+        return_value=_mock_session(response={"payload": {}}),
+    ):
+        assert await client.get_info() == {"payload": {}}
+    assert len(client._latencies) == 1
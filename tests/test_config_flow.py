@@ -3,6 +3,8 @@ from unittest.mock import patch
 
 from homeassistant import config_entries, data_entry_flow
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.service_info.dhcp import DhcpServiceInfo
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.liquid_check.config_flow import CannotConnect
 
@@ -110,3 +112,159 @@ async def test_form_with_custom_scan_interval(hass: HomeAssistant):
     assert result2["data"]["host"] == "192.168.1.100"
     assert result2["data"]["scan_interval"] == 120
     assert len(mock_setup_entry.mock_calls) == 1
+
+
+async def test_options_flow_tank_geometry(hass: HomeAssistant, mock_config_entry):
+    """Test configuring a tank geometry in the options flow."""
+    mock_config_entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(mock_config_entry.entry_id)
+    assert result["type"] == data_entry_flow.FlowResultType.FORM
+    assert result["step_id"] == "init"
+
+    with patch(
+        "custom_components.liquid_check.async_setup_entry",
+        return_value=True,
+    ):
+        result2 = await hass.config_entries.options.async_configure(
+            result["flow_id"],
+            {"tank_shape": "horizontal_cylinder", "tank_diameter": 1.2, "tank_length": 2.5},
+        )
+        await hass.async_block_till_done()
+
+    assert result2["type"] == data_entry_flow.FlowResultType.CREATE_ENTRY
+    assert mock_config_entry.options["tank_shape"] == "horizontal_cylinder"
+    assert mock_config_entry.options["tank_diameter"] == 1.2
+
+
+async def test_options_flow_invalid_geometry(hass: HomeAssistant, mock_config_entry):
+    """Test we reject a shape without dimensions."""
+    mock_config_entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(mock_config_entry.entry_id)
+    result2 = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"tank_shape": "sphere"}
+    )
+
+    assert result2["type"] == data_entry_flow.FlowResultType.FORM
+    assert result2["errors"] == {"base": "invalid_geometry"}
+
+
+async def test_form_aggregate(hass: HomeAssistant):
+    """Test combining existing tanks into an aggregate."""
+    for entry_id in ("tank_a", "tank_b"):
+        MockConfigEntry(
+            domain="liquid_check",
+            title=entry_id,
+            data={"name": entry_id, "host": "192.168.1.100"},
+            entry_id=entry_id,
+        ).add_to_hass(hass)
+
+    result = await hass.config_entries.flow.async_init(
+        "liquid_check", context={"source": config_entries.SOURCE_USER}
+    )
+    assert result["type"] == data_entry_flow.FlowResultType.MENU
+
+    result2 = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"next_step_id": "aggregate"}
+    )
+    assert result2["type"] == data_entry_flow.FlowResultType.FORM
+    assert result2["step_id"] == "aggregate"
+
+    result3 = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"name": "Reservoir", "members": ["tank_a"]}
+    )
+    assert result3["errors"] == {"base": "too_few_members"}
+
+    with patch(
+        "custom_components.liquid_check.async_setup_entry",
+        return_value=True,
+    ):
+        result4 = await hass.config_entries.flow.async_configure(
+            result["flow_id"], {"name": "Reservoir", "members": ["tank_a", "tank_b"]}
+        )
+        await hass.async_block_till_done()
+
+    assert result4["type"] == data_entry_flow.FlowResultType.CREATE_ENTRY
+    assert result4["data"]["members"] == ["tank_a", "tank_b"]
+
+
+async def test_options_flow_invalid_schedule(hass: HomeAssistant, mock_config_entry):
+    """Test an invalid measurement schedule shows an error."""
+    mock_config_entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(mock_config_entry.entry_id)
+    result2 = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {"tank_shape": "device", "measure_schedule": "0 25 * * *"},
+    )
+
+    assert result2["type"] == data_entry_flow.FlowResultType.FORM
+    assert result2["errors"] == {"measure_schedule": "invalid_schedule"}
+
+
+DHCP_DISCOVERY = DhcpServiceInfo(
+    ip="192.168.1.120", hostname="liquid-check", macaddress="aabbccddeeff"
+)
+
+
+async def test_dhcp_updates_ip_address(hass: HomeAssistant):
+    """Test a device found at a new IP address updates its entry."""
+    entry = MockConfigEntry(
+        domain="liquid_check",
+        data={"name": "Tank", "host": "192.168.1.100", "scan_interval": 60},
+        unique_id="aa:bb:cc:dd:ee:ff",
+    )
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.flow.async_init(
+        "liquid_check",
+        context={"source": config_entries.SOURCE_DHCP},
+        data=DHCP_DISCOVERY,
+    )
+    assert result["type"] == data_entry_flow.FlowResultType.ABORT
+    assert result["reason"] == "already_configured"
+    assert entry.data["host"] == "192.168.1.120"
+
+
+async def test_dhcp_keeps_hostname(hass: HomeAssistant):
+    """Test a configured hostname is not replaced by the discovered address."""
+    entry = MockConfigEntry(
+        domain="liquid_check",
+        data={"name": "Tank", "host": "liquid-check.local", "scan_interval": 60},
+        unique_id="aa:bb:cc:dd:ee:ff",
+    )
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.flow.async_init(
+        "liquid_check",
+        context={"source": config_entries.SOURCE_DHCP},
+        data=DHCP_DISCOVERY,
+    )
+    assert result["type"] == data_entry_flow.FlowResultType.ABORT
+    assert entry.data["host"] == "liquid-check.local"
+
+
+async def test_dhcp_new_device(hass: HomeAssistant):
+    """Test a new device found by DHCP is added after confirming."""
+    result = await hass.config_entries.flow.async_init(
+        "liquid_check",
+        context={"source": config_entries.SOURCE_DHCP},
+        data=DHCP_DISCOVERY,
+    )
+    assert result["type"] == data_entry_flow.FlowResultType.FORM
+    assert result["step_id"] == "discovery_confirm"
+
+    with patch(
+        "custom_components.liquid_check.async_setup_entry", return_value=True
+    ):
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], {"name": "Cistern"}
+        )
+    assert result["type"] == data_entry_flow.FlowResultType.CREATE_ENTRY
+    assert result["data"] == {
+        "name": "Cistern",
+        "host": "192.168.1.120",
+        "scan_interval": 60,
+    }
+    assert result["result"].unique_id == "aa:bb:cc:dd:ee:ff"
@@ -0,0 +1,54 @@
+"""Test the Liquid Check anomaly detector."""
+from custom_components.liquid_check.detector import STUCK_AGE, LevelAnomalyDetector
+
+# Midday in the US/Pacific time zone used by the test harness
+START = 1_700_000_000 - 1_700_000_000 % 86400 + 20 * 3600
+HOUR = 3600
+
+
+def _feed(detector, levels, start=START, step=HOUR):
+    for index, level in enumerate(levels):
+        state = detector.add_measurement(start + index * step, level)
+    return state
+
+
+async def test_stable_level_is_normal():
+    """Test jitter around a stable level raises nothing."""
+    detector = LevelAnomalyDetector()
+    state = _feed(detector, [1.000, 1.001, 0.999, 1.000, 1.002, 0.999] * 4)
+
+    assert not state.leak
+    assert not state.refill
+
+
+async def test_persistent_drain_is_a_leak():
+    """Test a level that keeps dropping faster than usual is a leak."""
+    detector = LevelAnomalyDetector()
+    _feed(detector, [1.000, 1.001, 0.999, 1.000] * 5)
+
+    levels = [1.000 - 0.01 * index for index in range(1, 8)]
+    state = _feed(detector, levels, start=START + 20 * HOUR)
+
+    assert state.leak
+
+
+async def test_sudden_rise_is_a_refill():
+    """Test a jump in level is reported as refill and clears a leak."""
+    detector = LevelAnomalyDetector()
+    _feed(detector, [0.500, 0.501, 0.499, 0.500] * 5)
+
+    state = detector.add_measurement(START + 20 * HOUR, 0.9)
+    assert state.refill
+    assert not state.leak
+
+    state = detector.add_measurement(START + 21 * HOUR, 0.9)
+    assert not state.refill
+
+
+async def test_stuck_sensor_is_a_fault():
+    """Test a measurement age beyond the limit or a device error is a fault."""
+    detector = LevelAnomalyDetector()
+
+    assert not detector.check_age(600, 0).sensor_fault
+    assert detector.check_age(STUCK_AGE + 1, 0).sensor_fault
+    assert detector.check_age(600, 3).sensor_fault
@@ -0,0 +1,47 @@
+"""Test the Liquid Check device actions."""
+from unittest.mock import AsyncMock, patch
+
+from homeassistant.const import CONF_DEVICE_ID, CONF_DOMAIN, CONF_TYPE
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.liquid_check.device_action import (
+    async_call_action_from_config,
+    async_get_actions,
+)
+
+
+async def test_get_actions(hass: HomeAssistant):
+    """Test the available device actions."""
+    actions = await async_get_actions(hass, "device123")
+
+    assert {action[CONF_TYPE] for action in actions} == {"start_measure", "restart"}
+
+
+async def test_action_calls_client_directly(hass: HomeAssistant):
+    """Test device actions send the command without a service call."""
+    mock_entry = MockConfigEntry(
+        domain="liquid_check",
+        data={"name": "Test", "host": "192.168.1.100", "scan_interval": 60},
+        entry_id="test123",
+    )
+    mock_entry.add_to_hass(hass)
+    device = dr.async_get(hass).async_get_or_create(
+        config_entry_id=mock_entry.entry_id,
+        identifiers={("liquid_check", mock_entry.entry_id)},
+    )
+
+    with patch(
+        "custom_components.liquid_check.client.LiquidCheckClient.send_command",
+        AsyncMock(),
+    ) as mock_send:
+        await async_call_action_from_config(
+            hass,
+            {CONF_DEVICE_ID: device.id, CONF_DOMAIN: "liquid_check", CONF_TYPE: "restart"},
+            {},
+            None,
+        )
+
+    mock_send.assert_awaited_once_with("Restart")
+    assert not hass.services.has_service("liquid_check", "restart")
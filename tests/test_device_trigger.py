@@ -0,0 +1,114 @@
+"""Test the Liquid Check device triggers."""
+import copy
+from unittest.mock import MagicMock
+
+from homeassistant.const import CONF_DEVICE_ID, CONF_DOMAIN, CONF_PLATFORM, CONF_TYPE
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.liquid_check.device_trigger import (
+    TRIGGER_SCHEMA,
+    LevelTrigger,
+    async_attach_trigger,
+    async_get_device_triggers,
+    async_get_triggers,
+)
+
+
+def _trigger(device_id: str, trigger_type: str, **fields) -> dict:
+    """Return a validated trigger config."""
+    return TRIGGER_SCHEMA(
+        {
+            CONF_PLATFORM: "device",
+            CONF_DOMAIN: "liquid_check",
+            CONF_DEVICE_ID: device_id,
+            CONF_TYPE: trigger_type,
+            **fields,
+        }
+    )
+
+
+async def test_get_triggers(hass: HomeAssistant):
+    """Test the available device triggers."""
+    entry = MockConfigEntry(
+        domain="liquid_check",
+        data={"name": "Test", "host": "192.168.1.100"},
+        entry_id="tank",
+    )
+    entry.add_to_hass(hass)
+    device = dr.async_get(hass).async_get_or_create(
+        config_entry_id=entry.entry_id, identifiers={("liquid_check", "tank")}
+    )
+
+    triggers = await async_get_triggers(hass, device.id)
+    assert {trigger[CONF_TYPE] for trigger in triggers} == {
+        "below",
+        "above",
+        "rate",
+        "refill",
+    }
+    assert await async_get_triggers(hass, "unknown") == []
+
+
+async def test_threshold_trigger_hysteresis(
+    hass: HomeAssistant, api_response, mock_get_info, setup_integration
+):
+    """Test a threshold trigger fires once per crossing."""
+    entry = await setup_integration()
+
+    device = dr.async_get(hass).async_get_device({("liquid_check", "tank")})
+    calls = []
+    unsub = await async_attach_trigger(
+        hass,
+        _trigger(device.id, "below", threshold=8, hysteresis=1),
+        callback(lambda variables, context=None: calls.append(variables)),
+        {"trigger_data": {"id": "low"}},
+    )
+
+    coordinator = hass.data["liquid_check"]["tank"]
+    # Starts at 8.7 %, refills to 8.5 % stay within the hysteresis
+    for percent in (7.5, 7.0, 8.5, 7.0, 9.5, 7.5):
+        response = copy.deepcopy(api_response)
+        response["payload"]["measure"]["percent"] = percent
+        mock_get_info.return_value = response
+        await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert [call["trigger"]["value"] for call in calls] == [7.5, 7.5]
+    assert calls[0]["trigger"]["id"] == "low"
+    assert calls[0]["trigger"][CONF_DEVICE_ID] == device.id
+
+    unsub()
+    assert not async_get_device_triggers(hass)._triggers
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_rate_and_refill_triggers(hass: HomeAssistant):
+    """Test the rate and refill triggers against the coordinator data."""
+    coordinator = MagicMock()
+    coordinator.data = {"refill": False}
+    coordinator.fetched_at = 7200.0
+    coordinator.history.slope.return_value = -1.0
+    calls = []
+
+    @callback
+    def _action(variables, context=None):
+        calls.append(variables["trigger"])
+
+    rate = LevelTrigger(
+        _trigger("device", "rate", rate=-2, window=30), _action, {"trigger_data": {}}
+    )
+    refill = LevelTrigger(_trigger("device", "refill"), _action, {"trigger_data": {}})
+    for slope, refilled in ((-1.0, False), (-3.0, True), (-4.0, True), (0.5, False)):
+        coordinator.history.slope.return_value = slope
+        coordinator.data = {"refill": refilled}
+        rate.async_evaluate(hass, coordinator)
+        refill.async_evaluate(hass, coordinator)
+    await hass.async_block_till_done()
+
+    coordinator.history.slope.assert_called_with("percent", 7200.0 - 30 * 60)
+    assert [(call[CONF_TYPE], call["value"]) for call in calls] == [
+        ("rate", -3.0),
+        ("refill", True),
+    ]
@@ -0,0 +1,133 @@
+"""Test the Liquid Check history export."""
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.components.recorder.common import (
+    async_wait_recording_done,
+)
+
+from custom_components.liquid_check import export
+from custom_components.liquid_check.backfill import read_history_file
+from custom_components.liquid_check.services import async_setup_services
+
+START = datetime(2024, 5, 1, 10, tzinfo=UTC)
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations():
+    """Leave starting Home Assistant to the tests, after the recorder."""
+    yield
+
+
+def test_merge_states():
+    """Test the sensor states are merged into rows and downsampled."""
+    entities = {"sensor.tank_level": "level", "sensor.tank_content": "content"}
+    states = {
+        "sensor.tank_level": [
+            {"s": "1.0", "lu": 100.2},
+            {"s": "unavailable", "lu": 160.0},
+            {"s": "1.2", "lu": 220.4},
+        ],
+        "sensor.tank_content": [{"s": "900", "lu": 100.3}, {"s": "1100", "lu": 220.5}],
+    }
+
+    assert export.merge_states(states, entities, 0.0, None) == [
+        (100.0, {"level": 1.0, "content": 900.0}),
+        (220.0, {"level": 1.2, "content": 1100.0}),
+    ]
+    assert export.merge_states(states, entities, 40.0, 300.0) == [
+        (40.0, {"level": 1.1, "content": 1000.0}),
+    ]
+
+
+async def _record_history(hass: HomeAssistant, freezer) -> MockConfigEntry:
+    """Record three hours of level and content states of a device."""
+    entry = MockConfigEntry(
+        domain="liquid_check",
+        data={"name": "Tank", "host": "192.168.1.100"},
+        entry_id="tank",
+    )
+    entry.add_to_hass(hass)
+    registry = er.async_get(hass)
+    for key in ("level", "content"):
+        registry.async_get_or_create(
+            "sensor",
+            "liquid_check",
+            f"tank_{key}",
+            suggested_object_id=f"tank_{key}",
+            config_entry=entry,
+        )
+
+    for minute in range(0, 180, 30):
+        freezer.move_to(START + timedelta(minutes=minute))
+        hass.states.async_set("sensor.tank_level", str(1.0 + minute / 100))
+        hass.states.async_set("sensor.tank_content", str(900 + minute))
+    await async_wait_recording_done(hass)
+    return entry
+
+
+async def test_export_history(recorder_mock, hass: HomeAssistant, freezer, tmp_path):
+    """Test the history is exported in chunks in the import format."""
+    entry = await _record_history(hass, freezer)
+    path = tmp_path / "export.csv"
+
+    with patch.object(export, "CHUNK_DURATION", timedelta(minutes=45)):
+        rows = await export.async_export_history(
+            hass, entry, path, START, START + timedelta(hours=3)
+        )
+
+    assert rows == 6
+    readings = list(read_history_file(path))
+    assert readings[0] == (START, {"level": 1.0, "content": 900.0})
+    assert readings[-1] == (
+        START + timedelta(minutes=150),
+        {"level": 2.5, "content": 1050.0},
+    )
+    assert not (tmp_path / "export.csv.part").exists()
+
+    path = tmp_path / "hourly.jsonl"
+    rows = await export.async_export_history(
+        hass, entry, path, START, START + timedelta(hours=2), timedelta(hours=1)
+    )
+    assert [values for _, values in read_history_file(path)] == [
+        {"level": 1.15, "content": 915.0},
+        {"level": 1.75, "content": 975.0},
+    ]
+
+
+async def test_export_history_service(
+    recorder_mock, hass: HomeAssistant, freezer, tmp_path
+):
+    """Test the service writes new files inside the configuration directory."""
+    hass.config.config_dir = str(tmp_path)
+    entry = await _record_history(hass, freezer)
+    device = dr.async_get(hass).async_get_or_create(
+        config_entry_id=entry.entry_id, identifiers={("liquid_check", "tank")}
+    )
+    async_setup_services(hass)
+    data = {"device_id": device.id, "start": START, "end": START + timedelta(hours=3)}
+
+    await hass.services.async_call(
+        "liquid_check",
+        "export_history",
+        {**data, "file": "exports/tank.csv"},
+        blocking=True,
+    )
+    path = Path(hass.config.path("exports/tank.csv"))
+    assert len(list(read_history_file(path))) == 6
+
+    for file in ("exports/tank.csv", "/etc/tank.csv"):
+        with pytest.raises(HomeAssistantError):
+            await hass.services.async_call(
+                "liquid_check",
+                "export_history",
+                {**data, "file": file},
+                blocking=True,
+            )
@@ -0,0 +1,85 @@
+"""Test the Liquid Check noise filters."""
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.liquid_check.coordinator import (
+    LiquidCheckDataUpdateCoordinator,
+)
+from custom_components.liquid_check.filters import (
+    EwmaFilter,
+    KalmanFilter,
+    MeasurementFilter,
+    MedianFilter,
+    filter_from_options,
+)
+
+
+def test_median_filter_drops_outliers():
+    """Test a single outlier does not reach the median."""
+    value_filter = MedianFilter(size=3)
+    assert value_filter.update(1.0) == 1.0
+    assert value_filter.update(1.2) == pytest.approx(1.1)
+    assert value_filter.update(9.0) == 1.2
+    assert value_filter.update(1.1) == 1.2
+    assert value_filter.update(1.0) == 1.1
+
+
+def test_ewma_and_kalman_filters_converge():
+    """Test the smoothing filters follow a step with damped noise."""
+    for value_filter in (EwmaFilter(), KalmanFilter()):
+        assert value_filter.update(1.0) == 1.0
+        assert 1.0 < value_filter.update(2.0) < 2.0
+        for _ in range(50):
+            value = value_filter.update(2.0)
+        assert value == pytest.approx(2.0, abs=0.01)
+
+
+def test_measurement_filter():
+    """Test the filter is built from the options and rounds the values."""
+    assert filter_from_options({}) is None
+    assert filter_from_options({"filter": "none"}) is None
+    assert isinstance(filter_from_options({"filter": "kalman"}), MeasurementFilter)
+
+    measurement_filter = MeasurementFilter("ewma")
+    measurement_filter.update({"level": 1.0, "content": 100.0, "percent": None})
+    measurement_filter.update({"level": 1.01, "content": 101.0, "percent": 50.0})
+    assert measurement_filter.values == {
+        "level": 1.003,
+        "content": 100.3,
+        "percent": 50.0,
+    }
+
+
+async def test_coordinator_publishes_smoothed_values():
+    """Test new measurements are smoothed and the raw values are kept."""
+    hass = HomeAssistant("/test")
+    entry = MagicMock()
+    entry.data = {"name": "Test", "host": "192.168.1.100"}
+    entry.options = {"filter": "median"}
+
+    coordinator = LiquidCheckDataUpdateCoordinator(hass, entry)
+    coordinator._client.get_info = AsyncMock()
+    now = dt_util.utcnow()
+
+    for minute, level in enumerate((1.0, 1.5, 1.02, 1.02)):
+        coordinator._client.get_info.return_value = {
+            "payload": {"measure": {"level": level, "age": 0}}
+        }
+        # The last poll returns the same measurement again
+        seconds = 60 * min(minute, 2)
+        with patch.object(
+            dt_util, "utcnow", return_value=now + timedelta(seconds=seconds)
+        ):
+            coordinator.data = await coordinator._async_update_data()
+
+    assert coordinator.data["level"] == 1.02
+    assert coordinator.data["level_raw"] == 1.02
+    assert [value for _, value in coordinator.history.window("level")] == [
+        1.0,
+        1.25,
+        1.02,
+    ]
@@ -0,0 +1,71 @@
+"""Test the Liquid Check tank geometry model."""
+import math
+
+import pytest
+
+from custom_components.liquid_check.geometry import (
+    TankGeometry,
+    geometry_from_options,
+    parse_strapping_table,
+)
+
+
+def test_vertical_cylinder_is_linear():
+    """Test the vertical cylinder preset."""
+    geometry = geometry_from_options(
+        {"tank_shape": "vertical_cylinder", "tank_diameter": 1.0, "tank_height": 2.0}
+    )
+
+    capacity = math.pi * 0.5**2 * 2.0 * 1000
+    assert geometry.capacity == pytest.approx(capacity)
+    assert geometry.volume_at(1.0) == pytest.approx(capacity / 2)
+    assert geometry.percent_at(0.5) == pytest.approx(25)
+
+
+def test_horizontal_cylinder_half_full():
+    """Test the horizontal cylinder preset is symmetric around the middle."""
+    geometry = geometry_from_options(
+        {"tank_shape": "horizontal_cylinder", "tank_diameter": 2.0, "tank_length": 3.0}
+    )
+
+    capacity = math.pi * 3.0 * 1000
+    assert geometry.capacity == pytest.approx(capacity)
+    assert geometry.volume_at(1.0) == pytest.approx(capacity / 2, rel=1e-3)
+    assert geometry.volume_at(0.5) + geometry.volume_at(1.5) == pytest.approx(
+        capacity, rel=1e-3
+    )
+
+
+def test_sphere_clamps_levels():
+    """Test levels outside the tank are clamped."""
+    geometry = geometry_from_options({"tank_shape": "sphere", "tank_diameter": 1.0})
+
+    assert geometry.volume_at(-0.1) == 0
+    assert geometry.volume_at(5) == pytest.approx(4 / 3 * math.pi * 0.5**3 * 1000)
+
+
+def test_strapping_table_interpolates():
+    """Test a user supplied strapping table."""
+    geometry = geometry_from_options(
+        {"tank_shape": "strapping_table", "strapping_table": "1.0:1000; 0:0, 0.5:400"}
+    )
+
+    assert geometry.volume_at(0.25) == pytest.approx(200)
+    assert geometry.volume_at(0.75) == pytest.approx(700)
+    assert geometry.percent_at(1.0) == pytest.approx(100)
+
+
+def test_device_shape_returns_none():
+    """Test the device computed content is used by default."""
+    assert geometry_from_options({}) is None
+    assert geometry_from_options({"tank_shape": "device"}) is None
+
+
+def test_invalid_geometry():
+    """Test invalid dimensions and tables are rejected."""
+    with pytest.raises(ValueError):
+        geometry_from_options({"tank_shape": "sphere", "tank_diameter": 0})
+    with pytest.raises(ValueError):
+        parse_strapping_table("0:0, 1.0")
+    with pytest.raises(ValueError):
+        TankGeometry.from_strapping_table([(0, 100), (1, 50)])
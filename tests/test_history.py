@@ -0,0 +1,43 @@
+"""Test the Liquid Check measurement history."""
+import pytest
+
+from custom_components.liquid_check.history import MeasurementHistory
+
+
+def test_history_statistics():
+    """Test the statistics over a window of measurements."""
+    history = MeasurementHistory(size=8)
+    # The level rises by 0.1 m per hour
+    for hour in range(5):
+        history.append(hour * 3600.0, 1.0 + hour * 0.1, 500.0 + hour * 50, None)
+
+    assert len(history) == 5
+    assert history.minimum("level") == 1.0
+    assert history.maximum("level") == pytest.approx(1.4)
+    assert history.mean("content") == 600.0
+    assert history.slope("level") == pytest.approx(0.1)
+    assert history.window("content", since=3 * 3600) == [
+        (3 * 3600.0, 650.0),
+        (4 * 3600.0, 700.0),
+    ]
+    # Missing values are skipped
+    assert history.mean("percent") is None
+    assert history.slope("level", since=4 * 3600) is None
+
+
+def test_history_wraps_around():
+    """Test the oldest measurements are replaced when the buffer is full."""
+    history = MeasurementHistory(size=4)
+    for minute in range(10):
+        history.append(minute * 60.0, float(minute), None, float(minute * 10))
+
+    assert len(history) == 4
+    assert history.window("level") == [
+        (360.0, 6.0),
+        (420.0, 7.0),
+        (480.0, 8.0),
+        (540.0, 9.0),
+    ]
+    assert history.minimum("percent", since=450) == 80.0
+    assert history.window("level", since=1000) == []
+    assert history.slope("level") == pytest.approx(60.0)
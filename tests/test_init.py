@@ -37,3 +37,35 @@ async def test_unload_entry(hass: HomeAssistant, mock_config_entry: MockConfigEn
     await hass.async_block_till_done()
 
     assert mock_config_entry.state == ConfigEntryState.NOT_LOADED
+
+
+async def test_setup_entry_sets_unique_id(hass: HomeAssistant, setup_integration):
+    """Test an entry is identified by the MAC address of its device."""
+    entry = await setup_integration()
+    assert entry.unique_id == "aa:bb:cc:dd:ee:ff"
+
+    # A second entry of the same device is left without one
+    other = await setup_integration(entry_id="other", name="Other")
+    assert other.unique_id is None
+    assert entry.state == other.state == ConfigEntryState.LOADED
+
+
+def test_package_import_is_light():
+    """Test loading the package and config flow leaves the device modules out."""
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    code = (
+        "import sys, custom_components.liquid_check.config_flow; "
+        "print(' '.join(sorted(sys.modules)))"
+    )
+    modules = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        cwd=Path(__file__).parents[1],
+        text=True,
+    ).stdout.split()
+    for module in ("client", "coordinator", "scheduler", "views", "websocket_api"):
+        assert f"custom_components.liquid_check.{module}" not in modules
@@ -0,0 +1,92 @@
+"""Test the Liquid Check measurement phase tracking."""
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
+
+from custom_components.liquid_check.coordinator import (
+    LiquidCheckDataUpdateCoordinator,
+)
+from custom_components.liquid_check.phase import (
+    LATE_TOLERANCE,
+    MIN_DELAY,
+    PHASE_MARGIN,
+    MeasurementPhase,
+)
+
+
+def test_phase_learns_period():
+    """Test the period is learned from the measurement timestamps."""
+    phase = MeasurementPhase()
+    assert phase.next_delay(0) is None
+
+    phase.add_measurement(1000.0)
+    assert phase.next_delay(1000.0) is None
+    phase.add_measurement(1300.0)
+    assert phase.period == 300.0
+    assert phase.next_delay(1310.0) == 290.0 + PHASE_MARGIN
+
+    # A skipped measurement counts as two periods
+    phase.add_measurement(1900.0)
+    assert phase.period == 300.0
+    # A measurement started by hand does not shorten the period
+    phase.add_measurement(1950.0)
+    assert phase.period == 300.0
+
+    phase.add_measurement(2260.0)
+    assert phase.period == pytest.approx(303.0)
+
+
+def test_phase_late_measurement():
+    """Test the polls back off while a measurement is late."""
+    phase = MeasurementPhase()
+    phase.add_measurement(0.0)
+    phase.add_measurement(300.0)
+
+    # Late, but within the tolerance
+    assert phase.next_delay(600.0 + PHASE_MARGIN) == MIN_DELAY
+    # Missed, wait for the following cycle
+    now = 600.0 + LATE_TOLERANCE + 1
+    assert phase.next_delay(now) == 900.0 + PHASE_MARGIN - now
+
+
+async def test_coordinator_phase_locked():
+    """Test the coordinator polls just after the expected measurement."""
+    hass = HomeAssistant("/test")
+    entry = MagicMock()
+    entry.data = {"name": "Test", "host": "192.168.1.100", "scan_interval": 60}
+    entry.options = {"poll_mode": "phase_locked"}
+
+    coordinator = LiquidCheckDataUpdateCoordinator(hass, entry)
+    response = {"payload": {"measure": {"level": 1.0, "age": 20}}}
+    coordinator._client.get_info = AsyncMock(return_value=response)
+    now = dt_util.utcnow()
+
+    with patch.object(dt_util, "utcnow", return_value=now):
+        coordinator.data = await coordinator._async_update_data()
+    assert coordinator.update_interval == timedelta(seconds=60)
+
+    # The device measured again 200 s later
+    with patch.object(dt_util, "utcnow", return_value=now + timedelta(seconds=200)):
+        coordinator.data = await coordinator._async_update_data()
+    assert coordinator.update_interval == timedelta(seconds=200 - 20 + PHASE_MARGIN)
+
+    coordinator._client.get_info.side_effect = TimeoutError
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+    assert coordinator.update_interval == timedelta(seconds=60)
+
+
+async def test_coordinator_phase_locked_without_polling():
+    """Test the phase is not tracked while polling is disabled."""
+    hass = HomeAssistant("/test")
+    entry = MagicMock()
+    entry.data = {"name": "Test", "host": "192.168.1.100", "scan_interval": 0}
+    entry.options = {"poll_mode": "phase_locked"}
+
+    coordinator = LiquidCheckDataUpdateCoordinator(hass, entry)
+    assert coordinator._phase is None
+    assert coordinator.update_interval is None
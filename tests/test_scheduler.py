@@ -0,0 +1,149 @@
+"""Test the Liquid Check measurement scheduler."""
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+from zoneinfo import ZoneInfo
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.liquid_check import scheduler as scheduler_module
+from custom_components.liquid_check.cron import CronSchedule
+from custom_components.liquid_check.scheduler import async_get_scheduler
+
+TZ = ZoneInfo("Europe/Berlin")
+
+
+@pytest.mark.parametrize(
+    ("expression", "after", "expected"),
+    [
+        ("0 6,18 * * *", datetime(2024, 5, 1, 6, 0), datetime(2024, 5, 1, 18, 0)),
+        ("*/15 * * * *", datetime(2024, 5, 1, 6, 7), datetime(2024, 5, 1, 6, 15)),
+        ("30 2 * * 0", datetime(2024, 5, 1, 12, 0), datetime(2024, 5, 5, 2, 30)),
+        ("0 0 1 * *", datetime(2024, 12, 15, 0, 0), datetime(2025, 1, 1, 0, 0)),
+        ("0 8 1 * 1-5", datetime(2024, 6, 1, 9, 0), datetime(2024, 6, 3, 8, 0)),
+        ("0 12 29 2 *", datetime(2025, 3, 1, 0, 0), datetime(2028, 2, 29, 12, 0)),
+    ],
+)
+def test_cron_next_after(expression, after, expected):
+    """Test finding the next matching minute."""
+    schedule = CronSchedule(expression)
+    assert schedule.next_after(after.replace(tzinfo=TZ)) == expected.replace(
+        tzinfo=TZ
+    )
+
+
+@pytest.mark.parametrize(
+    "expression", ["", "* * * *", "60 * * * *", "0 0 0 * *", "*/0 * * * *", "a * * * *"]
+)
+def test_cron_invalid(expression):
+    """Test invalid expressions are rejected."""
+    with pytest.raises(ValueError):
+        CronSchedule(expression)
+
+
+def _mock_coordinator(hass: HomeAssistant, name: str) -> MagicMock:
+    """Return a coordinator mock with a client and a config entry."""
+    coordinator = MagicMock()
+    coordinator.name = name
+    coordinator.config_entry = MockConfigEntry(domain="liquid_check", entry_id=name)
+    coordinator.config_entry.add_to_hass(hass)
+    coordinator.client.send_command = AsyncMock()
+    coordinator.async_refresh = AsyncMock()
+    return coordinator
+
+
+async def test_scheduler_measures_due_devices(hass: HomeAssistant):
+    """Test one timer starts the measurements of all due devices."""
+    scheduler = async_get_scheduler(hass)
+    assert async_get_scheduler(hass) is scheduler
+
+    hourly = [_mock_coordinator(hass, "a"), _mock_coordinator(hass, "b")]
+    daily = _mock_coordinator(hass, "c")
+    removers = [
+        scheduler.async_add("a", CronSchedule("0 * * * *"), hourly[0]),
+        scheduler.async_add("b", CronSchedule("0 * * * *"), hourly[1]),
+        scheduler.async_add("c", CronSchedule("0 0 1 1 *"), daily),
+    ]
+
+    next_hour = dt_util.now().replace(minute=0, second=0, microsecond=0)
+    with patch.object(scheduler_module, "MEASURE_DURATION", 0), patch.object(
+        scheduler_module, "COMMAND_STAGGER", 0
+    ):
+        async_fire_time_changed(hass, next_hour + timedelta(hours=1))
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    for coordinator in hourly:
+        coordinator.client.send_command.assert_awaited_once_with("StartMeasure")
+        coordinator.async_refresh.assert_awaited_once()
+    daily.client.send_command.assert_not_awaited()
+
+    for remove in removers:
+        remove()
+    assert scheduler._unsub_timer is None
+
+
+async def test_scheduler_bounds_concurrency(hass: HomeAssistant):
+    """Test the number of commands in flight is bounded."""
+    scheduler = async_get_scheduler(hass)
+    in_flight = 0
+    peak = 0
+
+    async def _send_command(command: str) -> None:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await hass.async_add_executor_job(lambda: None)
+        in_flight -= 1
+
+    coordinators = [_mock_coordinator(hass, str(index)) for index in range(8)]
+    coordinators[2].client.send_command = AsyncMock(side_effect=OSError("offline"))
+    for coordinator in coordinators[3:]:
+        coordinator.client.send_command = _send_command
+
+    removers = [
+        scheduler.async_add(coordinator.name, CronSchedule("0 * * * *"), coordinator)
+        for coordinator in coordinators
+    ]
+    next_hour = dt_util.now().replace(minute=0, second=0, microsecond=0)
+    with patch.object(scheduler_module, "MEASURE_DURATION", 0), patch.object(
+        scheduler_module, "COMMAND_STAGGER", 0
+    ):
+        async_fire_time_changed(hass, next_hour + timedelta(hours=1))
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    for remove in removers:
+        remove()
+    assert peak == scheduler_module.MAX_CONCURRENT_COMMANDS
+    # A failing device does not stop the refresh of the others
+    for coordinator in coordinators:
+        coordinator.async_refresh.assert_awaited_once()
+
+
+async def test_scheduler_cancels_removed_device(hass: HomeAssistant):
+    """Test a running measurement is cancelled when its device is removed."""
+    scheduler = async_get_scheduler(hass)
+    coordinators = [_mock_coordinator(hass, "a"), _mock_coordinator(hass, "b")]
+    removers = [
+        scheduler.async_add(coordinator.name, CronSchedule("0 * * * *"), coordinator)
+        for coordinator in coordinators
+    ]
+
+    next_hour = dt_util.now().replace(minute=0, second=0, microsecond=0)
+    with patch.object(scheduler_module, "COMMAND_STAGGER", 0):
+        async_fire_time_changed(hass, next_hour + timedelta(hours=1))
+        await hass.async_block_till_done()
+        for coordinator in coordinators:
+            coordinator.client.send_command.assert_awaited_once_with("StartMeasure")
+
+        for remove in removers:
+            remove()
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    for coordinator in coordinators:
+        coordinator.async_refresh.assert_not_awaited()
+    assert not scheduler._tasks
@@ -80,17 +80,18 @@ async def test_sensor_entities_have_correct_units():
         UnitOfTime,
         UnitOfVolume,
     )
+    from homeassistant.util import dt as dt_util
 
     from custom_components.liquid_check.sensor import (
+        LiquidCheckBootedAtSensor,
         LiquidCheckContentSensor,
         LiquidCheckErrorSensor,
         LiquidCheckFirmwareSensor,
+        LiquidCheckLastMeasuredSensor,
         LiquidCheckLevelSensor,
-        LiquidCheckMeasurementAgeSensor,
         LiquidCheckPercentSensor,
         LiquidCheckPumpTotalRunsSensor,
         LiquidCheckPumpTotalRuntimeSensor,
-        LiquidCheckUptimeSensor,
         LiquidCheckWiFiRSSISensor,
     )
     
@@ -106,6 +107,8 @@ async def test_sensor_entities_have_correct_units():
         "error": 0,
         "firmware": "1.91",
         "age": 593,
+        "measured_at": dt_util.utc_from_timestamp(1700000000),
+        "booted_at": dt_util.utc_from_timestamp(1699990000),
     }
     
     entry = MagicMock()
@@ -151,12 +154,10 @@ async def test_sensor_entities_have_correct_units():
     assert runtime_sensor._attr_state_class == "total_increasing"
     assert runtime_sensor.native_value == 43
     
-    # Test uptime sensor
-    uptime_sensor = LiquidCheckUptimeSensor(coordinator, entry)
-    assert uptime_sensor._attr_device_class == "duration"
-    assert uptime_sensor._attr_native_unit_of_measurement == UnitOfTime.SECONDS
-    assert uptime_sensor._attr_state_class == "total_increasing"
-    assert uptime_sensor.native_value == 7804
+    # Test booted at sensor
+    booted_sensor = LiquidCheckBootedAtSensor(coordinator, entry)
+    assert booted_sensor._attr_device_class == "timestamp"
+    assert booted_sensor.native_value == dt_util.utc_from_timestamp(1699990000)
     
     # Test error sensor
     error_sensor = LiquidCheckErrorSensor(coordinator, entry)
@@ -166,12 +167,10 @@ async def test_sensor_entities_have_correct_units():
     firmware_sensor = LiquidCheckFirmwareSensor(coordinator, entry)
     assert firmware_sensor.native_value == "1.91"
     
-    # Test measurement age sensor
-    age_sensor = LiquidCheckMeasurementAgeSensor(coordinator, entry)
-    assert age_sensor._attr_device_class == "duration"
-    assert age_sensor._attr_native_unit_of_measurement == UnitOfTime.SECONDS
-    assert age_sensor._attr_state_class == "measurement"
-    assert age_sensor.native_value == 593
+    # Test last measured sensor
+    measured_sensor = LiquidCheckLastMeasuredSensor(coordinator, entry)
+    assert measured_sensor._attr_device_class == "timestamp"
+    assert measured_sensor.native_value == dt_util.utc_from_timestamp(1700000000)
 
 
 async def test_sensor_handles_none_data():
@@ -191,31 +190,29 @@ async def test_sensor_handles_none_data():
     assert sensor.native_value is None
 
 
-async def test_coordinator_parses_api_response():
+async def test_coordinator_parses_api_response(api_response):
     """Test that coordinator correctly parses the API response structure."""
     import json
-    from pathlib import Path
     from unittest.mock import AsyncMock, MagicMock, patch
 
     from homeassistant.core import HomeAssistant
 
     from custom_components.liquid_check.sensor import LiquidCheckDataUpdateCoordinator
     
-    # Load the fixture
-    fixture_path = Path(__file__).parent / "fixtures" / "api_response.json"
-    with open(fixture_path) as f:
-        api_response = json.load(f)
-    
     hass = HomeAssistant("/test")
     entry = MagicMock()
     entry.data = {"name": "Test", "host": "192.168.1.100"}
+    entry.options = {}
     
     coordinator = LiquidCheckDataUpdateCoordinator(hass, entry)
+    # Request all optional fields as if every sensor was enabled
+    for key in ("uptime", "totalRuns", "totalRuntime", "rssi", "firmware"):
+        coordinator.async_track_field(key)
     
     # Mock the HTTP response
     mock_response = MagicMock()
     mock_response.status = 200
-    mock_response.json = AsyncMock(return_value=api_response)
+    mock_response.read = AsyncMock(return_value=json.dumps(api_response).encode())
     mock_response.__aenter__ = AsyncMock(return_value=mock_response)
     mock_response.__aexit__ = AsyncMock(return_value=None)
     
@@ -238,3 +235,261 @@ async def test_coordinator_parses_api_response():
     assert result["totalRuntime"] == 43
     assert result["rssi"] == -85
     assert result["firmware"] == "1.91"
+    assert coordinator.history.window("level") == [
+        (coordinator._measured_at, 0.24)
+    ]
+
+
+async def test_coordinator_extracts_only_tracked_fields(api_response):
+    """Test optional fields are only extracted while an entity needs them."""
+    from unittest.mock import AsyncMock, MagicMock
+
+    from homeassistant.core import HomeAssistant
+
+    from custom_components.liquid_check.sensor import LiquidCheckDataUpdateCoordinator
+
+    hass = HomeAssistant("/test")
+    entry = MagicMock()
+    entry.data = {"name": "Test", "host": "192.168.1.100"}
+    entry.options = {}
+
+    coordinator = LiquidCheckDataUpdateCoordinator(hass, entry)
+    coordinator._client.get_info = AsyncMock(return_value=api_response)
+
+    result = await coordinator._async_update_data()
+    assert result["level"] == 0.24
+    assert "rssi" not in result
+    assert "totalRuns" not in result
+
+    coordinator.data = result
+    release = coordinator.async_track_field("rssi")
+    # Filled in from the last payload without polling the device again
+    assert coordinator.data["rssi"] == -85
+    assert coordinator._client.get_info.await_count == 1
+
+    release()
+    result = await coordinator._async_update_data()
+    assert "rssi" not in result
+
+
+async def test_coordinator_polls_in_tiers(api_response):
+    """Test diagnostics and static metadata are refreshed less often."""
+    import copy
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    from homeassistant.core import HomeAssistant
+    from homeassistant.util import dt as dt_util
+
+    from custom_components.liquid_check.coordinator import DIAGNOSTIC_INTERVAL
+    from custom_components.liquid_check.sensor import LiquidCheckDataUpdateCoordinator
+
+    hass = HomeAssistant("/test")
+    entry = MagicMock()
+    entry.data = {"name": "Test", "host": "192.168.1.100"}
+    entry.options = {}
+
+    coordinator = LiquidCheckDataUpdateCoordinator(hass, entry)
+    coordinator.async_track_field("rssi")
+    coordinator.async_track_field("uptime")
+    coordinator._client.get_info = AsyncMock(return_value=api_response)
+    now = dt_util.utcnow()
+
+    with patch.object(dt_util, "utcnow", return_value=now):
+        coordinator.data = await coordinator._async_update_data()
+    assert coordinator.data["rssi"] == -85
+    assert coordinator.metadata == {
+        "firmware": "1.91",
+        "hardware": "C5",
+        "mac": "AA:BB:CC:DD:EE:FF",
+    }
+    booted_at = coordinator.data["booted_at"]
+    assert booted_at == dt_util.utc_from_timestamp(round(now.timestamp() - 7804))
+
+    changed = copy.deepcopy(api_response)
+    changed["payload"]["wifi"]["accessPoint"]["rssi"] = -60
+    changed["payload"]["device"]["firmware"] = "1.92"
+    # The device clock drifts a little from the fetch time
+    changed["payload"]["system"]["uptime"] = (
+        7804 + DIAGNOSTIC_INTERVAL.total_seconds() + 2
+    )
+    coordinator._client.get_info.return_value = changed
+
+    # Diagnostics are kept until the interval passed, metadata until reconnect
+    with patch.object(dt_util, "utcnow", return_value=now + DIAGNOSTIC_INTERVAL / 2):
+        coordinator.data = await coordinator._async_update_data()
+    assert coordinator.data["rssi"] == -85
+    assert coordinator.data["firmware"] == "1.91"
+
+    with patch.object(dt_util, "utcnow", return_value=now + DIAGNOSTIC_INTERVAL):
+        coordinator.data = await coordinator._async_update_data()
+    assert coordinator.data["rssi"] == -60
+    assert coordinator.data["firmware"] == "1.91"
+    assert coordinator.data["booted_at"] == booted_at
+
+    coordinator.last_update_success = False
+    coordinator.data = await coordinator._async_update_data()
+    assert coordinator.data["firmware"] == "1.92"
+
+
+async def test_coordinator_updates_device_registry(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry, api_response
+):
+    """Test static metadata is published to the device registry."""
+    from unittest.mock import AsyncMock
+
+    from homeassistant.helpers import device_registry as dr
+
+    from custom_components.liquid_check.sensor import LiquidCheckDataUpdateCoordinator
+
+    mock_config_entry.add_to_hass(hass)
+
+    coordinator = LiquidCheckDataUpdateCoordinator(hass, mock_config_entry)
+    coordinator._client.get_info = AsyncMock(return_value=api_response)
+    await coordinator.async_refresh()
+
+    device = dr.async_get(hass).async_get_device(
+        identifiers={("liquid_check", mock_config_entry.entry_id)}
+    )
+    assert device.sw_version == "1.91"
+    assert device.hw_version == "C5"
+
+
+async def test_pump_energy_sensor(
+    hass: HomeAssistant, api_response, mock_get_info, setup_integration
+):
+    """Test the pump energy is counted from runtime deltas and restored."""
+    import copy
+
+    from homeassistant.core import State
+    from pytest_homeassistant_custom_component.common import (
+        mock_restore_cache_with_extra_data,
+    )
+
+    # 1 kWh counted up to a runtime of 13 s, the fixture reports 43 s
+    mock_restore_cache_with_extra_data(
+        hass,
+        [
+            (
+                State("sensor.tank_pump_energy", "1.0", {"pump_runtime": 13}),
+                {"native_value": 1.0, "native_unit_of_measurement": "kWh"},
+            )
+        ],
+    )
+    entry = await setup_integration(options={"pump_power": 720.0})
+
+    state = hass.states.get("sensor.tank_pump_energy")
+    assert float(state.state) == 1.006
+    assert state.attributes["unit_of_measurement"] == "kWh"
+    assert state.attributes["state_class"] == "total_increasing"
+
+    # A device reset starts the runtime counter from zero
+    reset = copy.deepcopy(api_response)
+    reset["payload"]["system"]["pump"]["totalRuntime"] = 10
+    mock_get_info.return_value = reset
+    await hass.data["liquid_check"]["tank"].async_refresh()
+    await hass.async_block_till_done()
+
+    assert float(hass.states.get("sensor.tank_pump_energy").state) == 1.008
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_stale_measurement(
+    hass: HomeAssistant, api_response, mock_get_info, setup_integration
+):
+    """Test stale values are unavailable and trigger one new measurement."""
+    import copy
+    from unittest.mock import AsyncMock
+
+    from homeassistant.const import STATE_UNAVAILABLE
+
+    from custom_components.liquid_check import coordinator as coordinator_module
+    from custom_components.liquid_check.client import LiquidCheckClient
+
+    # The fixture measurement is 593 s old
+    send_command = AsyncMock()
+    with patch.object(LiquidCheckClient, "send_command", send_command), patch.object(
+        coordinator_module, "MEASURE_DURATION", 0
+    ):
+        entry = await setup_integration(options={"stale_after": 5})
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+        assert hass.states.get("sensor.tank_level").state == STATE_UNAVAILABLE
+        assert hass.states.get("sensor.tank_content").state == STATE_UNAVAILABLE
+        send_command.assert_awaited_once_with("StartMeasure")
+
+        coordinator = hass.data["liquid_check"]["tank"]
+        await coordinator.async_refresh()
+        await hass.async_block_till_done(wait_background_tasks=True)
+        # Still the same stale episode
+        send_command.assert_awaited_once()
+
+        fresh = copy.deepcopy(api_response)
+        fresh["payload"]["measure"]["age"] = 10
+        mock_get_info.return_value = fresh
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+        assert hass.states.get("sensor.tank_level").state == "0.24"
+
+        # A measurement still running when the entry is unloaded is cancelled
+        mock_get_info.return_value = api_response
+        with patch.object(coordinator_module, "MEASURE_DURATION", 3600):
+            await coordinator.async_refresh()
+            await hass.async_block_till_done()
+            assert send_command.await_count == 2
+            assert entry._background_tasks
+            polls = mock_get_info.await_count
+            assert await hass.config_entries.async_unload(entry.entry_id)
+        assert not entry._background_tasks
+        assert mock_get_info.await_count == polls
+
+
+async def test_booted_at_enabled_after_first_refresh(
+    hass: HomeAssistant, setup_integration
+):
+    """Test the boot time is known when its sensor is added after the first poll."""
+    from homeassistant.helpers import entity_registry as er
+    from homeassistant.util import dt as dt_util
+
+    # Enabled by the user, but only added once the first refresh is done
+    er.async_get(hass).async_get_or_create(
+        "sensor",
+        "liquid_check",
+        "tank_booted_at",
+        suggested_object_id="tank_booted_at",
+    )
+
+    now = dt_util.utcnow()
+    with patch.object(dt_util, "utcnow", return_value=now):
+        entry = await setup_integration()
+
+    state = hass.states.get("sensor.tank_booted_at")
+    assert dt_util.parse_datetime(state.state) == dt_util.utc_from_timestamp(
+        round(now.timestamp() - 7804)
+    )
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_restart_updates_device_metadata(
+    hass: HomeAssistant, api_response, mock_get_info, setup_integration
+):
+    """Test a restart between two successful polls re-reads the firmware."""
+    import copy
+
+    from homeassistant.helpers import device_registry as dr
+
+    entry = await setup_integration()
+    registry = dr.async_get(hass)
+    assert registry.async_get_device({("liquid_check", "tank")}).sw_version == "1.91"
+
+    updated = copy.deepcopy(api_response)
+    updated["payload"]["device"]["firmware"] = "1.92"
+    updated["payload"]["system"]["uptime"] = 30
+    mock_get_info.return_value = updated
+    coordinator = hass.data["liquid_check"]["tank"]
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert coordinator.last_update_success
+    assert registry.async_get_device({("liquid_check", "tank")}).sw_version == "1.92"
+    assert await hass.config_entries.async_unload(entry.entry_id)
@@ -10,7 +10,7 @@ async def test_start_measure_service(hass: HomeAssistant):
     from custom_components.liquid_check import (
         DOMAIN,
         SERVICE_START_MEASURE,
-        async_setup_entry,
+        async_setup,
     )
     
     mock_entry = MockConfigEntry(
@@ -20,10 +20,9 @@ async def test_start_measure_service(hass: HomeAssistant):
     )
     mock_entry.add_to_hass(hass)
 
-    # Mock the platform forwarding to avoid coordinator threads
-    with patch("homeassistant.config_entries.ConfigEntries.async_forward_entry_setups", return_value=None):
-        assert await async_setup_entry(hass, mock_entry)
-        await hass.async_block_till_done()
+    # Services are registered once for the domain
+    assert await async_setup(hass, {})
+    await hass.async_block_till_done()
 
     # Verify service is registered
     assert hass.services.has_service(DOMAIN, SERVICE_START_MEASURE)
@@ -64,7 +63,7 @@ async def test_start_measure_service_invalid_device(hass: HomeAssistant):
     from custom_components.liquid_check import (
         DOMAIN,
         SERVICE_START_MEASURE,
-        async_setup_entry,
+        async_setup,
     )
     
     mock_entry = MockConfigEntry(
@@ -74,10 +73,9 @@ async def test_start_measure_service_invalid_device(hass: HomeAssistant):
     )
     mock_entry.add_to_hass(hass)
     
-    # Mock the platform forwarding
-    with patch("homeassistant.config_entries.ConfigEntries.async_forward_entry_setups", return_value=None):
-        assert await async_setup_entry(hass, mock_entry)
-        await hass.async_block_till_done()
+    # Services are registered once for the domain
+    assert await async_setup(hass, {})
+    await hass.async_block_till_done()
     
     # Call service with non-existent device
     await hass.services.async_call(
@@ -94,7 +92,7 @@ async def test_start_measure_service_connection_error(hass: HomeAssistant):
     from custom_components.liquid_check import (
         DOMAIN,
         SERVICE_START_MEASURE,
-        async_setup_entry,
+        async_setup,
     )
     
     mock_entry = MockConfigEntry(
@@ -104,10 +102,9 @@ async def test_start_measure_service_connection_error(hass: HomeAssistant):
     )
     mock_entry.add_to_hass(hass)
 
-    # Mock the platform forwarding
-    with patch("homeassistant.config_entries.ConfigEntries.async_forward_entry_setups", return_value=None):
-        assert await async_setup_entry(hass, mock_entry)
-        await hass.async_block_till_done()
+    # Services are registered once for the domain
+    assert await async_setup(hass, {})
+    await hass.async_block_till_done()
 
     mock_session = MagicMock()
     mock_session.post = MagicMock(side_effect=Exception("Connection error"))
@@ -129,7 +126,7 @@ async def test_restart_service(hass: HomeAssistant):
     from custom_components.liquid_check import (
         DOMAIN,
         SERVICE_RESTART,
-        async_setup_entry,
+        async_setup,
     )
     
     mock_entry = MockConfigEntry(
@@ -139,10 +136,9 @@ async def test_restart_service(hass: HomeAssistant):
     )
     mock_entry.add_to_hass(hass)
 
-    # Mock the platform forwarding to avoid coordinator threads
-    with patch("homeassistant.config_entries.ConfigEntries.async_forward_entry_setups", return_value=None):
-        assert await async_setup_entry(hass, mock_entry)
-        await hass.async_block_till_done()
+    # Services are registered once for the domain
+    assert await async_setup(hass, {})
+    await hass.async_block_till_done()
 
     # Verify service is registered
     assert hass.services.has_service(DOMAIN, SERVICE_RESTART)
@@ -183,7 +179,7 @@ async def test_restart_service_invalid_device(hass: HomeAssistant):
     from custom_components.liquid_check import (
         DOMAIN,
         SERVICE_RESTART,
-        async_setup_entry,
+        async_setup,
     )
     
     mock_entry = MockConfigEntry(
@@ -193,10 +189,9 @@ async def test_restart_service_invalid_device(hass: HomeAssistant):
     )
     mock_entry.add_to_hass(hass)
     
-    # Mock the platform forwarding
-    with patch("homeassistant.config_entries.ConfigEntries.async_forward_entry_setups", return_value=None):
-        assert await async_setup_entry(hass, mock_entry)
-        await hass.async_block_till_done()
+    # Services are registered once for the domain
+    assert await async_setup(hass, {})
+    await hass.async_block_till_done()
     
     # Call service with non-existent device
     await hass.services.async_call(
@@ -213,7 +208,7 @@ async def test_restart_service_connection_error(hass: HomeAssistant):
     from custom_components.liquid_check import (
         DOMAIN,
         SERVICE_RESTART,
-        async_setup_entry,
+        async_setup,
     )
     
     mock_entry = MockConfigEntry(
@@ -223,10 +218,9 @@ async def test_restart_service_connection_error(hass: HomeAssistant):
     )
     mock_entry.add_to_hass(hass)
 
-    # Mock the platform forwarding
-    with patch("homeassistant.config_entries.ConfigEntries.async_forward_entry_setups", return_value=None):
-        assert await async_setup_entry(hass, mock_entry)
-        await hass.async_block_till_done()
+    # Services are registered once for the domain
+    assert await async_setup(hass, {})
+    await hass.async_block_till_done()
 
     mock_session = MagicMock()
     mock_session.post = MagicMock(side_effect=Exception("Connection error"))
@@ -241,3 +235,74 @@ async def test_restart_service_connection_error(hass: HomeAssistant):
             blocking=True,
         )
         await hass.async_block_till_done()
+
+
+async def test_services_registered_once(hass: HomeAssistant):
+    """Test setting up entries does not register the services again."""
+    from custom_components.liquid_check import (
+        DOMAIN,
+        SERVICE_RESTART,
+        SERVICE_START_MEASURE,
+        async_setup,
+        async_setup_entry,
+    )
+
+    assert await async_setup(hass, {})
+    handler = hass.services.async_services()[DOMAIN][SERVICE_START_MEASURE]
+
+    for entry_id in ("test123", "test456"):
+        mock_entry = MockConfigEntry(
+            domain=DOMAIN,
+            data={"name": "Test", "host": "192.168.1.100", "scan_interval": 60},
+            entry_id=entry_id,
+        )
+        mock_entry.add_to_hass(hass)
+        with patch("homeassistant.config_entries.ConfigEntries.async_forward_entry_setups", return_value=None):
+            assert await async_setup_entry(hass, mock_entry)
+
+    assert hass.services.async_services()[DOMAIN][SERVICE_START_MEASURE] is handler
+    assert hass.services.has_service(DOMAIN, SERVICE_RESTART)
+
+
+async def test_start_measure_service_device_id(hass: HomeAssistant):
+    """Test the start_measure service resolves a device registry id."""
+    from homeassistant.helpers import device_registry as dr
+
+    from custom_components.liquid_check import (
+        DOMAIN,
+        SERVICE_START_MEASURE,
+        async_setup,
+    )
+
+    mock_entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={"name": "Test", "host": "192.168.1.101", "scan_interval": 60},
+        entry_id="test123",
+    )
+    mock_entry.add_to_hass(hass)
+    device = dr.async_get(hass).async_get_or_create(
+        config_entry_id=mock_entry.entry_id,
+        identifiers={(DOMAIN, mock_entry.entry_id)},
+    )
+
+    assert await async_setup(hass, {})
+
+    mock_response = MagicMock()
+    mock_response.__aenter__ = AsyncMock(return_value=mock_response)
+    mock_response.__aexit__ = AsyncMock(return_value=None)
+
+    mock_session = MagicMock()
+    mock_session.post = MagicMock(return_value=mock_response)
+    mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+    mock_session.__aexit__ = AsyncMock(return_value=None)
+
+    with patch("custom_components.liquid_check.client.aiohttp.ClientSession", return_value=mock_session):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_START_MEASURE,
+            {"device_id": device.id},
+            blocking=True,
+        )
+
+    mock_session.post.assert_called_once()
+    assert mock_session.post.call_args[0][0] == "http://192.168.1.101/command"
@@ -0,0 +1,87 @@
+"""Test the Liquid Check HTTP views."""
+import json
+
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.liquid_check.views import DATA_INFOS_ETAGS
+
+
+async def _setup_entry(hass: HomeAssistant, setup_integration) -> MockConfigEntry:
+    """Set up the web server and a mocked tank entry."""
+    assert await async_setup_component(hass, "http", {})
+    return await setup_integration(name='Tank "A"')
+
+
+async def test_metrics_view(
+    hass: HomeAssistant, hass_client, mock_get_info, setup_integration
+):
+    """Test the metrics are rendered from the cached data."""
+    entry = await _setup_entry(hass, setup_integration)
+    client = await hass_client()
+
+    response = await client.get("/api/liquid_check/metrics")
+    assert response.status == 200
+    assert response.headers["Content-Type"].startswith("application/openmetrics-text")
+    body = await response.text()
+
+    labels = 'entry_id="tank",name="Tank \\"A\\"",host="192.168.1.100"'
+    assert "# TYPE liquid_check_level_meters gauge" in body
+    assert f"liquid_check_level_meters{{{labels}}} 0.24" in body
+    assert f"liquid_check_content_liters{{{labels}}} 960" in body
+    # The pump counters are exported without their sensors being enabled
+    assert f"liquid_check_pump_runs_total{{{labels}}} 12" in body
+    assert f"liquid_check_polls_total{{{labels}}} 1" in body
+    assert f"liquid_check_poll_errors_total{{{labels}}} 0" in body
+    assert f"liquid_check_up{{{labels}}} 1" in body
+    assert body.endswith("# EOF\n")
+    # Rendering does not poll the device
+    assert mock_get_info.await_count == 1
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_metrics_view_requires_auth(
+    hass: HomeAssistant, hass_client_no_auth, setup_integration
+):
+    """Test the metrics view requires authentication."""
+    entry = await _setup_entry(hass, setup_integration)
+    client = await hass_client_no_auth()
+
+    response = await client.get("/api/liquid_check/metrics")
+    assert response.status == 401
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_infos_view(
+    hass: HomeAssistant, hass_client, api_response, mock_get_info, setup_integration
+):
+    """Test the last device response is served with cache headers."""
+    body = json.dumps(api_response).encode()
+    entry = await _setup_entry(hass, setup_integration)
+    hass.data["liquid_check"]["tank"].client.last_body = body
+    client = await hass_client()
+
+    response = await client.get("/api/liquid_check/tank/infos.json")
+    assert response.status == 200
+    assert await response.read() == body
+    assert response.headers["Content-Type"] == "application/json"
+    assert response.headers["Cache-Control"].startswith("private, max-age=")
+    etag = response.headers["ETag"]
+
+    response = await client.get(
+        "/api/liquid_check/tank/infos.json", headers={"If-None-Match": etag}
+    )
+    assert response.status == 304
+    assert response.headers["ETag"] == etag
+    # Served from the last poll only
+    assert mock_get_info.await_count == 1
+
+    response = await client.get("/api/liquid_check/unknown/infos.json")
+    assert response.status == 404
+
+    assert "tank" in hass.data[DATA_INFOS_ETAGS]
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    assert "tank" not in hass.data[DATA_INFOS_ETAGS]
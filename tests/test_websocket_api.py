@@ -0,0 +1,77 @@
+"""Test the Liquid Check WebSocket API."""
+from datetime import timedelta
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+
+async def _setup_entries(setup_integration, count: int) -> list[MockConfigEntry]:
+    """Set up mocked tank entries."""
+    return [
+        await setup_integration(
+            entry_id=f"tank_{index}", name=f"Tank {index}", host=f"10.0.0.{index + 1}"
+        )
+        for index in range(count)
+    ]
+
+
+async def test_subscribe_batches_updates(
+    hass: HomeAssistant, hass_ws_client, setup_integration
+):
+    """Test updates of several devices are sent as one message."""
+    entries = await _setup_entries(setup_integration, 3)
+    client = await hass_ws_client(hass)
+
+    await client.send_json_auto_id({"type": "liquid_check/subscribe"})
+    result = await client.receive_json()
+    assert result["success"]
+
+    event = await client.receive_json()
+    assert set(event["event"]["entries"]) == {"tank_0", "tank_1", "tank_2"}
+    assert event["event"]["entries"]["tank_0"] == {
+        "level": 0.24,
+        "content": 960,
+        "percent": 8.7,
+        "flow": None,
+    }
+
+    for entry in entries[:2]:
+        await hass.data["liquid_check"][entry.entry_id].async_refresh()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+
+    event = await client.receive_json()
+    assert set(event["event"]["entries"]) == {"tank_0", "tank_1"}
+
+    for entry in entries:
+        assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_subscribe_selected_entries(
+    hass: HomeAssistant, hass_ws_client, setup_integration
+):
+    """Test subscribing to selected devices only."""
+    entries = await _setup_entries(setup_integration, 2)
+    client = await hass_ws_client(hass)
+
+    await client.send_json_auto_id(
+        {"type": "liquid_check/subscribe", "entry_ids": ["tank_1"]}
+    )
+    assert (await client.receive_json())["success"]
+    event = await client.receive_json()
+    assert list(event["event"]["entries"]) == ["tank_1"]
+
+    for entry in entries:
+        await hass.data["liquid_check"][entry.entry_id].async_refresh()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+
+    event = await client.receive_json()
+    assert list(event["event"]["entries"]) == ["tank_1"]
+
+    for entry in entries:
+        assert await hass.config_entries.async_unload(entry.entry_id)